@@ -33,6 +33,27 @@ Contents
 [tests](../tests/test_sorts_and_searches.py),
 [performance](../speed_tuning/sorts_for_floats.md)
 
+  - external merge sort:
+[docs](./external_sort.md),
+[source code](../external_sort.py),
+[tests](../tests/test_external_sort.py)
+
+  - k-way merge of sorted runs:
+[docs](./kway_merge.md),
+[source code](../kway_merge.py),
+[tests](../tests/test_kway_merge.py)
+
+  - parallel sample sort:
+[docs](./sample_sort.md),
+[source code](../sample_sort.py),
+[tests](../tests/test_sample_sort.py)
+
+  - automatic choice of the sort by the input:
+[docs](./auto_sort.md),
+[source code](../auto_sort.py),
+[tests](../tests/test_auto_sort.py),
+[measured rankings](../auto_sort_thresholds.json)
+
   - heap_sort:
 [docs](./heap.md),
 [source code](../heap.py),
@@ -42,7 +63,8 @@ Contents
   - sort by counting:
 [docs](./count_sort.md),
 [source code](../count_sort.py),
-[tests](../tests/test_sorts_and_searches.py),
+[import tests](../tests/test_count_sort.py),
+[case tests](../tests/test_sorts_and_searches.py),
 [performance](../speed_tuning/sorts_for_integers.md),
 [performance tuning](../speed_tuning/count_sort_tuning.md),
 [animation](../speed_tuning/README.md)
@@ -64,6 +86,11 @@ Contents
 [additional functions tests](../tests/test_digit_sort.py),
 [performance](../speed_tuning/sorts_for_integers.md)
 
+  - key and reverse options of the sorts:
+[docs](./sort_keys.md),
+[source code](../sort_keys.py),
+[tests](../tests/test_sorts_and_searches.py)
+
 - Data Structures
   - Array-like
     - Vector:
@@ -77,6 +104,11 @@ Contents
 [tests](../tests/test_heap.py),
 [performance]()
 
+    - SortedList:
+[docs](./sorted_list.md),
+[source code](../sorted_list.py),
+[tests](../tests/test_sorted_list.py)
+
   - Nodes and Linked Lists
     - OneWayNode:
 [docs](./Node.md),
@@ -194,6 +226,16 @@ Contents
 [tests](../tests/test_sorts_and_searches.py),
 [performance]()
 
+  - Batch Binary Search for many sorted queries at once:
+[docs](./batch_search.md),
+[source code](../batch_search.py),
+[tests](../tests/test_batch_search.py)
+
+  - Static search index in the Eytzinger or blocked layout:
+[docs](./eytzinger.md),
+[source code](../eytzinger.py),
+[tests](../tests/test_eytzinger.py)
+
   - Binary Search for functions on the real domain:
 [docs](./real_bin_search.md),
 [source code](../real_bin_search.py),
@@ -230,5 +272,11 @@ Contents
 [source code](../edit_distance.py),
 [tests](../tests/test_edit_distance.py)
 
+  - Sort benchmarks:
+[docs](./runner.md),
+[source code](../bench/),
+[tests](../tests/test_bench.py),
+[usage](../speed_tuning/README.md)
+
 ---
 """
@@ -7,9 +7,16 @@ Functions
 array_count_sort(arr: list[list[int]], key: int = 0) -> list[list[int]]
     Sort a 2-dimensional array of integers based on a key index.
 
+multi_key_order(arr: list[list[int]], keys: list[int]) -> array
+    Find the permutation which sorts rows by several key indexes.
+
 """
 
 
+from array import array as typed_array
+from itertools import accumulate
+
+
 def array_count_sort(arr: list[list[int]], key: int = 0) -> list[list[int]]:
     """
         This function performs counting sort on the 2-dimensional array
@@ -72,3 +79,109 @@ def array_count_sort(arr: list[list[int]], key: int = 0) -> list[list[int]]:
         arr[i] = result[i]
 
     return arr
+
+
+def _key_column(arr: list[list[int]], key: int):
+    """
+        Extract one key column of the rows as compact counting ranks.
+
+        Parameters
+        ----------
+        arr : list[list[int]]
+            2-dimensional array
+
+        key : int
+            the key index
+
+        Returns
+        -------
+        tuple[array, int] or None
+            array('q') of ranks from 0 (absent key) to size - 1 and
+            the size, or None if every row has the same rank.
+
+    """
+    blank = float('-inf')
+    values = [row[key] if key < len(row) else blank for row in arr]
+    present = [value for value in values if value != blank]
+    if not present:
+        return None
+    min_value, max_value = min(present), max(present)
+    if min_value == max_value and len(present) == len(values):
+        return None
+
+    shift = min_value - 1
+    column = typed_array('q', [value - shift if value != blank else 0
+                               for value in values])
+    return column, max_value - shift + 1
+
+
+def _count_pass(order: typed_array, column: typed_array,
+                size: int) -> typed_array:
+    """
+        Stable counting pass reordering the indexes by one key column.
+
+        Parameters
+        ----------
+        order : array
+            array('q') of row indexes in the current order
+
+        column : array
+            array('q') of ranks of the rows from 0 to size - 1
+
+        size : int
+            the number of possible ranks
+
+        Returns
+        -------
+        array
+            array('q') of row indexes stably ordered by ranks
+
+    """
+    count = [0] * (size + 1)
+    for value in column:
+        count[value + 1] += 1
+    starts = list(accumulate(count))
+
+    result = typed_array('q', bytes(order.itemsize * len(order)))
+    for index in order:
+        value = column[index]
+        result[starts[value]] = index
+        starts[value] += 1
+    return result
+
+
+def multi_key_order(arr: list[list[int]], keys: list[int]) -> typed_array:
+    """
+        Find the permutation which sorts rows by several key indexes.
+
+        This function extracts every key column once into a compact
+        array of counting ranks and performs stable LSD counting passes
+        from the last key to the first one over an array of row indexes,
+        so the rows themselves are neither copied nor moved. Columns
+        with the same value in every row are skipped. Rows without
+        a key index (or with -inf there) are put higher than the others,
+        as in `array_count_sort`.
+        Time to work: O(number of keys * (number of rows + range of
+        values in a key column)).
+
+        Parameters
+        ----------
+        arr : list[list[int]]
+            2-dimensional array of whole numbers
+
+        keys : list[int]
+            Key indexes, the first one is the most significant.
+
+        Returns
+        -------
+        array
+            array('q') of row indexes, the rows arr[i] for i in it
+            go in sorted order.
+
+    """
+    order = typed_array('q', range(len(arr)))
+    for key in reversed(keys):
+        column = _key_column(arr, key)
+        if column is not None:
+            order = _count_pass(order, *column)
+    return order
@@ -0,0 +1,359 @@
+"""
+Automatic Sort Module
+=====================
+
+This module provides `sort`, a single entry point which looks at the
+input and routes it to the sort which is the fastest for such inputs.
+
+The look at the input is cheap: the length, whether all elements are
+integers, their range and the number of descents (which give the number
+of ascending runs) take a few O(n) passes in C, the share of duplicates
+is estimated on a sample. By these statistics the input is classified
+like one of the benchmark distributions of `bench/distributions.py`
+(uniform, sorted, reversed, few_unique, zipf or sawtooth).
+
+The routing itself is not hardcoded: `calibrate` runs the benchmarks of
+`bench/runner.py` for the candidate sorts on every distribution, size
+and element type and ranks the candidates by the measured time. The
+rankings are saved into THRESHOLDS_PATH and `sort` takes the first
+candidate applicable to the input from the ranking of its class and of
+the closest measured size not bigger than the input. Rerun `calibrate`
+on the target machine to adapt the routing to it.
+
+Functions
+---------
+input_stats(array: list[float], sample_size: int = SAMPLE_SIZE) -> dict
+    Collect the statistics of the input which matter for sorting.
+
+classify(stats: dict) -> str
+    Find the benchmark distribution the input resembles.
+
+calibrate(sizes: list[int] = CALIBRATION_SIZES, repeat: int = 3,
+    path: str | None = THRESHOLDS_PATH, isolate: bool = True) -> dict
+    Measure the candidate sorts and rank them for every kind of input.
+
+load_thresholds(path: str = THRESHOLDS_PATH) -> dict
+    Read the rankings made by calibrate.
+
+choose_sort(array: list[float], thresholds: dict | None = None) -> str
+    Choose the name of the sort for the array.
+
+sort(array: list[float], thresholds: dict | None = None) -> list[float]
+    Sort the array by the sort which is the fastest for such inputs.
+
+Constants
+---------
+CANDIDATES: tuple[str]
+    Names of the sorts in the registry of benchmarks to choose from.
+
+SORTS_BY_NAME: dict[str, SortCase]
+    The candidate sorts with their parameters.
+
+CALIBRATION_SIZES: tuple[int]
+    Sizes measured by calibrate by default.
+
+THRESHOLDS_PATH: str
+    The file with the measured rankings next to this module.
+
+SAMPLE_SIZE: int
+    The number of elements sampled to estimate duplicates, 1000.
+
+"""
+
+
+import json
+import math
+import os
+import random
+
+
+from itertools import islice
+from multiprocessing import cpu_count
+from operator import gt, lt
+
+
+from Algorithms.python_solutions.bench.registry import SORTS
+from Algorithms.python_solutions.bench.runner import run_benchmarks
+from Algorithms.python_solutions.count_sort import DENSE_RATIO
+
+
+CANDIDATES = ('insert_sort_opt', 'merge_sort', 'merge_sort_adaptive',
+              'quick_sort_3way', 'sample_sort', 'count_sort',
+              'digit_sort_opt_256')
+SORTS_BY_NAME = {name: SORTS[name] for name in CANDIDATES}
+CALIBRATION_SIZES = (8, 32, 128, 1000, 10000, 100000)
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'auto_sort_thresholds.json')
+SAMPLE_SIZE = 1000
+
+# duplicates share of the input, above which it resembles the zipf
+# benchmark, and the distinct values share of a sample, below which
+# it resembles the few_unique one
+_ZIPF_DUPLICATES = 0.3
+_FEW_UNIQUE_DISTINCT = 0.05
+
+
+def input_stats(array: list[float], sample_size: int = SAMPLE_SIZE) -> dict:
+    """
+    Collect the statistics of the input which matter for sorting.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input.
+
+    sample_size: int
+        The number of elements sampled to estimate the share
+        of duplicates. Default is SAMPLE_SIZE.
+
+    Returns
+    -------
+    dict
+        'size', 'integers' - whether all elements are int,
+        'numbers' - whether all elements are int or float,
+        'min' and 'max' - for numbers, 'descents' and 'ascents' - the
+        numbers of neighbours in descending and ascending order,
+        'duplicates' - the estimated share of elements equal to another
+        one and 'distinct' - the share of distinct values in the sample.
+
+    """
+    size = len(array)
+    types = set(map(type, array))
+    stats = {'size': size, 'integers': types <= {int},
+             'numbers': types <= {int, float}}
+    if stats['numbers'] and size:
+        stats['min'], stats['max'] = min(array), max(array)
+
+    following = islice(array, 1, None)
+    stats['descents'] = sum(map(gt, array, following))
+    following = islice(array, 1, None)
+    stats['ascents'] = sum(map(lt, array, following))
+
+    sample = array if size <= sample_size else \
+        random.sample(array, sample_size)
+    try:
+        distinct = len(set(sample))
+    except TypeError:
+        distinct = len(sample)
+    stats['distinct'] = distinct / len(sample) if sample else 1.0
+    stats['duplicates'] = 1.0 - stats['distinct']
+    return stats
+
+
+def classify(stats: dict) -> str:
+    """
+    Find the benchmark distribution the input resembles.
+
+    Parameters
+    ----------
+    stats: dict
+        The result of `input_stats`.
+
+    Returns
+    -------
+    str
+        'sorted', 'reversed', 'sawtooth' (a few ascending runs, not more
+        than twice the square root of the size), 'few_unique', 'zipf' or
+        'uniform'.
+
+    """
+    size = stats['size']
+    if stats['descents'] == 0:
+        return 'sorted'
+    if stats['ascents'] == 0:
+        return 'reversed'
+    if stats['descents'] + 1 <= 2 * math.isqrt(size):
+        return 'sawtooth'
+    if stats['distinct'] <= _FEW_UNIQUE_DISTINCT:
+        return 'few_unique'
+    if stats['duplicates'] >= _ZIPF_DUPLICATES:
+        return 'zipf'
+    return 'uniform'
+
+
+def calibrate(sizes: list[int] = CALIBRATION_SIZES, repeat: int = 3,
+              path: str | None = THRESHOLDS_PATH,
+              isolate: bool = True) -> dict:
+    """
+    Measure the candidate sorts and rank them for every kind of input.
+
+    Every candidate is measured by `run_benchmarks` on every benchmark
+    distribution and size, once on integers and once on floats (where
+    it accepts floats), and for every element type, distribution and
+    size the candidates are ranked by the best time.
+
+    Parameters
+    ----------
+    sizes: list[int]
+        Sizes to measure. Default is CALIBRATION_SIZES.
+
+    repeat: int
+        The number of measured runs of every case. Default is 3.
+
+    path: str or None
+        The file to save the rankings to, None means not to save.
+        Default is THRESHOLDS_PATH.
+
+    isolate: bool
+        Whether to measure every case in a fresh worker process.
+        Default is True.
+
+    Returns
+    -------
+    dict
+        'meta' - the environment of the measurement and 'rankings' -
+        {'int' or 'float': {distribution: [[size, [sort names from
+        the fastest]], ...]}}.
+
+    """
+    rankings = {}
+    meta = None
+    for kind, integers in (('int', True), ('float', False)):
+        names = [name for name in CANDIDATES
+                 if integers or not SORTS_BY_NAME[name].integers]
+        results = run_benchmarks(names, sizes=sizes, repeat=repeat,
+                                 isolate=isolate, integers=integers)
+        meta = results['meta']
+        times = {}
+        for result in results['results']:
+            if 'error' not in result:
+                times.setdefault((result['distribution'], result['size']),
+                                 []).append((result['time'], result['sort']))
+        rankings[kind] = {}
+        for (distribution, size), measured in sorted(times.items()):
+            rankings[kind].setdefault(distribution, []).append(
+                [size, [name for _, name in sorted(measured)]])
+
+    thresholds = {'meta': {key: meta[key] for key in
+                           ('python', 'platform', 'cpu_count', 'timestamp',
+                            'repeat', 'sizes')},
+                  'rankings': rankings}
+    if path is not None:
+        with open(path, 'w') as file:
+            json.dump(thresholds, file, indent=1)
+    return thresholds
+
+
+def load_thresholds(path: str = THRESHOLDS_PATH) -> dict:
+    """
+    Read the rankings made by calibrate.
+
+    Parameters
+    ----------
+    path: str
+        The file written by `calibrate`. Default is THRESHOLDS_PATH.
+
+    Returns
+    -------
+    dict
+        The result of `calibrate`.
+
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+_thresholds = None
+
+
+def _applicable(name: str, stats: dict) -> bool:
+    """
+    Check whether the sort can handle the input well.
+
+    Parameters
+    ----------
+    name: str
+        The candidate name.
+
+    stats: dict
+        The result of `input_stats`.
+
+    Returns
+    -------
+    bool
+        False for sorts of integers if not all elements are integers,
+        for count_sort if the range of values is more than DENSE_RATIO
+        times the size and for the parallel sort on a single core.
+
+    """
+    if SORTS_BY_NAME[name].integers and not stats['integers']:
+        return False
+    if name == 'count_sort':
+        return stats['max'] - stats['min'] < DENSE_RATIO * stats['size']
+    if name == 'sample_sort':
+        return cpu_count() > 1
+    return True
+
+
+def choose_sort(array: list[float], thresholds: dict | None = None) -> str:
+    """
+    Choose the name of the sort for the array.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input.
+
+    thresholds: dict or None
+        The result of `calibrate`, None means the rankings saved
+        in THRESHOLDS_PATH. Default is None.
+
+    Returns
+    -------
+    str
+        One of CANDIDATES.
+
+    """
+    global _thresholds
+    if thresholds is None:
+        if _thresholds is None:
+            _thresholds = load_thresholds()
+        thresholds = _thresholds
+
+    stats = input_stats(array)
+    if not stats['numbers']:
+        # only comparisons are possible, the rankings of floats apply
+        stats['integers'] = False
+    kind = 'int' if stats['integers'] else 'float'
+    by_size = thresholds['rankings'][kind][classify(stats)]
+
+    ranking = by_size[0][1]
+    for size, names in by_size:
+        if size <= stats['size']:
+            ranking = names
+    for name in ranking:
+        if _applicable(name, stats):
+            return name
+    return 'merge_sort'
+
+
+def sort(array: list[float], thresholds: dict | None = None) -> list[float]:
+    """
+    Sort the array by the sort which is the fastest for such inputs.
+
+    The sort is chosen by `choose_sort` among count_sort, digit_sort_opt,
+    insert_sort_opt, merge_sort (adaptive or not), quick_sort (3-way) and
+    the parallel sample_sort from the measured rankings. Elements which
+    are not numbers are sorted by comparison sorts only.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input, it is sorted in-place whichever sort is chosen.
+
+    thresholds: dict or None
+        The result of `calibrate`, None means the rankings saved
+        in THRESHOLDS_PATH. Default is None.
+
+    Returns
+    -------
+    list[float]
+        The same array in sorted order.
+
+    """
+    if len(array) <= 1:
+        return array
+    case = SORTS_BY_NAME[choose_sort(array, thresholds)]
+    # some of the sorts return a new list instead of sorting in-place
+    array[:] = case.function(array, **case.params)
+    return array
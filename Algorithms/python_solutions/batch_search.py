@@ -0,0 +1,309 @@
+"""
+Batch Search Module
+===================
+
+This module answers many binary search queries against one sorted array
+at once. `bin_search`, `lower_bound` and `upper_bound` search for one
+value at a time from the whole array, so m queries cost
+O(m * log(n)) comparisons and as many Python calls.
+
+Here the queries are sorted once (or taken as they are if they are
+already sorted) and answered in one merge-like sweep over the array:
+the place of every query is searched by `merge_sort.gallop` starting
+from the place of the previous one, so the search needs only O(log(d))
+comparisons, where d - the distance between the places of neighbouring
+queries, and all the queries together take O(m * log(n / m + 1)).
+The results are put back into the order of the queries and returned as
+compact array('q') of indexes or array('B') of flags.
+
+The 'numpy' backend answers the queries by vectorized `np.searchsorted`
+instead and returns NumPy arrays for a NumPy array input.
+
+Functions
+---------
+batch_bisect(array: list[float], queries: list[float], right: bool = False,
+    presorted: bool = False, backend: str = 'python') -> array
+    Find the places of many values inside the sorted array.
+
+batch_lower_bound(array: list[float], queries: list[float],
+    presorted: bool = False, backend: str = 'python') -> array
+    Find the first element not less than every query.
+
+batch_upper_bound(array: list[float], queries: list[float],
+    presorted: bool = False, backend: str = 'python') -> array
+    Find the last element not greater than every query.
+
+batch_bin_search(array: list[float], queries: list[float],
+    presorted: bool = False, backend: str = 'python') -> array
+    Check which of the queries are inside the sorted array.
+
+Constants
+---------
+NUMPY_OPT: bool
+    True if NumPy can be imported and the 'numpy' backend is available.
+
+"""
+
+
+import logging
+
+
+from array import array as typed_array
+
+
+from Algorithms.python_solutions.merge_sort import gallop
+
+
+try:
+    import numpy as np
+    NUMPY_OPT = True
+except ImportError:
+    logging.info('numpy cannot be imported, defaulting to the pure ' +
+                 'python backend of batch search')
+    NUMPY_OPT = False
+
+
+def _sweep(array: list[float], queries: list[float], right: bool,
+           presorted: bool) -> typed_array:
+    """
+    Find the places of the queries by one galloping sweep over the array.
+
+    Parameters
+    ----------
+    array: list[float]
+        The sorted array.
+
+    queries: list[float]
+        The values to search places for.
+
+    right: bool
+        If False, the places before the elements equal to the queries
+        are found, otherwise the places after them.
+
+    presorted: bool
+        Whether the queries are sorted already.
+
+    Returns
+    -------
+    array
+        array('q') of the places in the order of the queries.
+
+    """
+    places = typed_array('q', bytes(8 * len(queries)))
+    order = range(len(queries)) if presorted else \
+        sorted(range(len(queries)), key=queries.__getitem__)
+
+    place, size = 0, len(array)
+    for index in order:
+        place = gallop(array, queries[index], place, size, right)
+        places[index] = place
+    return places
+
+
+def _searchsorted_numpy(array, queries, right: bool):
+    """
+    Find the places of the queries by np.searchsorted.
+
+    Parameters
+    ----------
+    array: list[float] or np.ndarray
+        The sorted array.
+
+    queries: list[float] or np.ndarray
+        The values to search places for.
+
+    right: bool
+        If False, the places before the elements equal to the queries
+        are found, otherwise the places after them.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The array and the queries as NumPy arrays and the places.
+
+    """
+    values = np.asarray(array)
+    targets = np.asarray(queries)
+    places = np.searchsorted(values, targets,
+                             side='right' if right else 'left')
+    return values, targets, places.astype(np.int64, copy=False)
+
+
+def batch_bisect(array: list[float], queries: list[float],
+                 right: bool = False, presorted: bool = False,
+                 backend: str = 'python') -> typed_array:
+    """
+    Find the places of many values inside the sorted array.
+
+    The place of a value is the index where it would be inserted to keep
+    the array sorted, as `bisect.bisect_left` (or `bisect.bisect_right`)
+    finds it.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array sorted in the ascending order.
+
+    queries: list[float]
+        The values to search places for, in any order.
+
+    right: bool
+        If False, the places before all the elements equal to a value are
+        found, otherwise the places after them. Default is False.
+
+    presorted: bool
+        Whether the queries are sorted in the ascending order already,
+        which saves sorting them. Default is False.
+
+    backend: 'python' or 'numpy'
+        'numpy' searches by `np.searchsorted`, a NumPy array is returned
+        for a NumPy array input. Falls back to 'python' if NumPy is not
+        installed. Default is 'python'.
+
+    Returns
+    -------
+    array
+        array('q') of the places in the order of the queries.
+
+    Raises
+    ------
+    ValueError
+        Raised if the backend option cannot be parsed.
+
+    """
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Cannot parse backend option')
+    if backend == 'numpy' and NUMPY_OPT:
+        _, _, places = _searchsorted_numpy(array, queries, right)
+        if isinstance(array, np.ndarray):
+            return places
+        return typed_array('q', places.tobytes())
+    return _sweep(array, queries, right, presorted)
+
+
+def batch_lower_bound(array: list[float], queries: list[float],
+                      presorted: bool = False,
+                      backend: str = 'python') -> typed_array:
+    """
+    Find the first element not less than every query.
+
+    For a query inside the array it is the index of its first encounter,
+    as `bounds.lower_bound` finds it.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array sorted in the ascending order.
+
+    queries: list[float]
+        The values to search for, in any order.
+
+    presorted: bool
+        Whether the queries are sorted in the ascending order already.
+        Default is False.
+
+    backend: 'python' or 'numpy'
+        The backend of `batch_bisect`. Default is 'python'.
+
+    Returns
+    -------
+    array
+        array('q') of indexes in the order of the queries, the size
+        of the array for queries bigger than every element.
+
+    """
+    return batch_bisect(array, queries, False, presorted, backend)
+
+
+def batch_upper_bound(array: list[float], queries: list[float],
+                      presorted: bool = False,
+                      backend: str = 'python') -> typed_array:
+    """
+    Find the last element not greater than every query.
+
+    For a query inside the array it is the index of its last encounter,
+    as `bounds.upper_bound` finds it.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array sorted in the ascending order.
+
+    queries: list[float]
+        The values to search for, in any order.
+
+    presorted: bool
+        Whether the queries are sorted in the ascending order already.
+        Default is False.
+
+    backend: 'python' or 'numpy'
+        The backend of `batch_bisect`. Default is 'python'.
+
+    Returns
+    -------
+    array
+        array('q') of indexes in the order of the queries, -1 for queries
+        less than every element.
+
+    """
+    places = batch_bisect(array, queries, True, presorted, backend)
+    if NUMPY_OPT and isinstance(places, np.ndarray):
+        return places - 1
+    for index, place in enumerate(places):
+        places[index] = place - 1
+    return places
+
+
+def batch_bin_search(array: list[float], queries: list[float],
+                     presorted: bool = False,
+                     backend: str = 'python') -> typed_array:
+    """
+    Check which of the queries are inside the sorted array.
+
+    A query is inside the array if the element at its lower bound equals
+    it, as `bin_search` checks it for one value.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array sorted in the ascending order.
+
+    queries: list[float]
+        The values to search for, in any order.
+
+    presorted: bool
+        Whether the queries are sorted in the ascending order already.
+        Default is False.
+
+    backend: 'python' or 'numpy'
+        'numpy' searches by `np.searchsorted`, a boolean NumPy array is
+        returned for a NumPy array input. Falls back to 'python' if NumPy
+        is not installed. Default is 'python'.
+
+    Returns
+    -------
+    array
+        array('B') of 1 for the queries inside the array and 0 for the
+        others, in the order of the queries.
+
+    Raises
+    ------
+    ValueError
+        Raised if the backend option cannot be parsed.
+
+    """
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Cannot parse backend option')
+    if backend == 'numpy' and NUMPY_OPT:
+        values, targets, places = _searchsorted_numpy(array, queries, False)
+        found = places < len(values)
+        found[found] = values[places[found]] == targets[found]
+        if isinstance(array, np.ndarray):
+            return found
+        return typed_array('B', found.astype(np.uint8).tobytes())
+
+    size = len(array)
+    return typed_array('B', [place < size and not query < array[place]
+                             for place, query in
+                             zip(_sweep(array, queries, False, presorted),
+                                 queries)])
@@ -0,0 +1,3 @@
+"""
+Sort benchmarks: `python -m Algorithms.python_solutions.bench sorts --help`
+"""
@@ -0,0 +1,114 @@
+"""
+Benchmark Command Line Interface
+================================
+
+Run the sort benchmarks headlessly, save them as JSON and compare them
+with a baseline:
+
+    python -m Algorithms.python_solutions.bench sorts \\
+        --sizes 1000 10000 --output current.json --baseline baseline.json
+
+The exit code is 1 if any regression against the baseline was found.
+
+Functions
+---------
+main(argv: list[str] | None = None) -> int
+    Parse the command line arguments and run the benchmarks.
+
+"""
+
+
+import argparse
+import sys
+
+
+from Algorithms.python_solutions.bench.distributions import DISTRIBUTIONS
+from Algorithms.python_solutions.bench.registry import SORTS
+from Algorithms.python_solutions.bench.runner import \
+    MEMORY_THRESHOLD, SIZES, TIME_THRESHOLD, compare, load_results, \
+    run_benchmarks, save_results
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    Build the parser of the command line arguments.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser with the 'sorts' command.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m Algorithms.python_solutions.bench')
+    commands = parser.add_subparsers(dest='command', required=True)
+    sorts = commands.add_parser(
+        'sorts', help='measure the sorts over sizes and distributions')
+    sorts.add_argument('--sorts', nargs='+', choices=list(SORTS),
+                       metavar='SORT', help='sorts to run, default all: ' +
+                       ', '.join(SORTS))
+    sorts.add_argument('--distributions', nargs='+',
+                       choices=list(DISTRIBUTIONS), metavar='DISTRIBUTION',
+                       help='distributions to run, default all: ' +
+                       ', '.join(DISTRIBUTIONS))
+    sorts.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    sorts.add_argument('--repeat', type=int, default=3)
+    sorts.add_argument('--seed', type=int, default=0)
+    sorts.add_argument('--no-isolate', action='store_true',
+                       help='measure in this process instead of a fresh ' +
+                       'worker process per case')
+    sorts.add_argument('--output', help='JSON file to write results to')
+    sorts.add_argument('--baseline', help='JSON file to compare with')
+    sorts.add_argument('--time-threshold', type=float,
+                       default=TIME_THRESHOLD)
+    sorts.add_argument('--memory-threshold', type=float,
+                       default=MEMORY_THRESHOLD)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Parse the command line arguments and run the benchmarks.
+
+    Parameters
+    ----------
+    argv: list[str] or None
+        The arguments, None means sys.argv[1:]. Default is None.
+
+    Returns
+    -------
+    int
+        0 if there are no regressions, 1 otherwise.
+
+    """
+    args = _parser().parse_args(argv)
+    results = run_benchmarks(args.sorts, args.distributions, args.sizes,
+                             args.seed, args.repeat, not args.no_isolate)
+
+    for result in results['results']:
+        case = f"{result['sort']:<24}{result['distribution']:<12}" + \
+            f"{result['size']:>9}"
+        if 'error' in result:
+            print(f"{case}  {result['error']}")
+        else:
+            print(f"{case}{result['time']:>12.6f} s" +
+                  f"{result['peak_rss'] / 2 ** 20:>10.1f} MiB")
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline is None:
+        return 0
+    regressions = compare(results, load_results(args.baseline),
+                          args.time_threshold, args.memory_threshold)
+    for regression in regressions:
+        ratio = '' if regression['ratio'] is None \
+            else f" x{regression['ratio']:.2f}"
+        print(f"REGRESSION {regression['sort']} " +
+              f"{regression['distribution']} {regression['size']} " +
+              f"{regression['metric']}: {regression['baseline']} -> " +
+              f"{regression['current']}{ratio}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
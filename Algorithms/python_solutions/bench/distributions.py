@@ -0,0 +1,267 @@
+"""
+Benchmark Input Distributions Module
+====================================
+
+This module generates reproducible input arrays for the sort benchmarks.
+Every generator takes the size of the array, a seeded random.Random and
+whether to produce integers or floats, so the same seed always gives the
+same arrays.
+
+Functions
+---------
+uniform(size: int, rng: random.Random, integers: bool = False)
+    -> list[float]
+    Uniformly distributed numbers in [-size, size].
+
+sorted_array(size: int, rng: random.Random, integers: bool = False)
+    -> list[float]
+    Uniform numbers in ascending order.
+
+reversed_array(size: int, rng: random.Random, integers: bool = False)
+    -> list[float]
+    Uniform numbers in descending order.
+
+few_unique(size: int, rng: random.Random, integers: bool = False)
+    -> list[float]
+    Numbers taking only FEW_UNIQUE distinct values.
+
+zipf(size: int, rng: random.Random, integers: bool = False) -> list[float]
+    Zipf distributed ranks: a few values repeat very often.
+
+sawtooth(size: int, rng: random.Random, integers: bool = False)
+    -> list[float]
+    Ascending runs of about sqrt(size) numbers one after another.
+
+make_array(distribution: str, size: int, seed: int = 0,
+    integers: bool = False) -> list[float]
+    Generate the array of the named distribution.
+
+Constants
+---------
+DISTRIBUTIONS: dict[str, Callable]
+    Generators by their names.
+
+FEW_UNIQUE: int
+    The number of distinct values in few_unique arrays, 8.
+
+ZIPF_EXPONENT: float
+    The exponent of the zipf distribution, 1.2.
+
+"""
+
+
+import random
+
+
+FEW_UNIQUE = 8
+ZIPF_EXPONENT = 1.2
+
+
+def uniform(size: int, rng: random.Random,
+            integers: bool = False) -> list[float]:
+    """
+    Uniformly distributed numbers in [-size, size].
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    if integers:
+        return [rng.randint(-size, size) for _ in range(size)]
+    return [rng.uniform(-size, size) for _ in range(size)]
+
+
+def sorted_array(size: int, rng: random.Random,
+                 integers: bool = False) -> list[float]:
+    """
+    Uniform numbers in ascending order.
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    return sorted(uniform(size, rng, integers))
+
+
+def reversed_array(size: int, rng: random.Random,
+                   integers: bool = False) -> list[float]:
+    """
+    Uniform numbers in descending order.
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    return sorted(uniform(size, rng, integers), reverse=True)
+
+
+def few_unique(size: int, rng: random.Random,
+               integers: bool = False) -> list[float]:
+    """
+    Numbers taking only FEW_UNIQUE distinct values.
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    values = uniform(FEW_UNIQUE, rng, integers)
+    return rng.choices(values, k=size)
+
+
+def zipf(size: int, rng: random.Random,
+         integers: bool = False) -> list[float]:
+    """
+    Zipf distributed ranks: a few values repeat very often.
+
+    The rank k from 1 to size is taken with the probability proportional
+    to 1 / k ** ZIPF_EXPONENT.
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    if size == 0:
+        return []
+    ranks = range(1, size + 1)
+    weights = [rank ** -ZIPF_EXPONENT for rank in ranks]
+    array = rng.choices(ranks, weights=weights, k=size)
+    return array if integers else [float(rank) for rank in array]
+
+
+def sawtooth(size: int, rng: random.Random,
+             integers: bool = False) -> list[float]:
+    """
+    Ascending runs of about sqrt(size) numbers one after another.
+
+    Parameters
+    ----------
+    size: int
+        The number of elements.
+
+    rng: random.Random
+        The source of randomness.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    """
+    tooth = max(int(size ** 0.5), 1)
+    offset = rng.randint(0, tooth)
+    array = [(i + offset) % tooth for i in range(size)]
+    return array if integers else [float(i) for i in array]
+
+
+DISTRIBUTIONS = {
+    'uniform': uniform,
+    'sorted': sorted_array,
+    'reversed': reversed_array,
+    'few_unique': few_unique,
+    'zipf': zipf,
+    'sawtooth': sawtooth,
+}
+
+
+def make_array(distribution: str, size: int, seed: int = 0,
+               integers: bool = False) -> list[float]:
+    """
+    Generate the array of the named distribution.
+
+    Parameters
+    ----------
+    distribution: str
+        One of the DISTRIBUTIONS names.
+
+    size: int
+        The number of elements.
+
+    seed: int
+        The seed of the random generator. Default is 0.
+
+    integers: bool
+        Whether to generate integers instead of floats. Default is False.
+
+    Returns
+    -------
+    list[float]
+        The generated array.
+
+    Raises
+    ------
+    ValueError
+        Raised if the distribution is unknown.
+
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f'Unknown distribution {distribution}')
+    rng = random.Random(f'{seed}-{distribution}-{size}')
+    return DISTRIBUTIONS[distribution](size, rng, integers)
@@ -0,0 +1,93 @@
+"""
+Benchmark Sorts Registry Module
+===============================
+
+This module lists the sorts measured by the benchmarks under stable
+names, so the results of different runs can be compared by name.
+Every entry tells which function to call with which parameters, whether
+the sort accepts only integers and the biggest size worth measuring
+(quadratic sorts are not run on big arrays).
+
+Classes
+-------
+SortCase
+    A named tuple of a sort function and its benchmark settings.
+
+Constants
+---------
+SORTS: dict[str, SortCase]
+    The benchmarked sorts by their names.
+
+"""
+
+
+from typing import Callable, NamedTuple
+
+
+from Algorithms.python_solutions.count_sort import count_sort
+from Algorithms.python_solutions.digit_sort import \
+    digit_sort, digit_sort_opt, radix_sort
+from Algorithms.python_solutions.heap import heap_sort
+from Algorithms.python_solutions.insert_sort import \
+    insert_sort, insert_sort_opt
+from Algorithms.python_solutions.merge_sort import \
+    merge_sort, merge_sort_parallel
+from Algorithms.python_solutions.quick_sort import quick_sort
+from Algorithms.python_solutions.sample_sort import sample_sort
+
+
+class SortCase(NamedTuple):
+    """
+    A named tuple of a sort function and its benchmark settings.
+
+    Attributes
+    ----------
+    function: Callable
+        The sort, called as function(array, **params).
+
+    params: dict
+        Keyword parameters of the call.
+
+    integers: bool
+        Whether the sort accepts integers only.
+
+    max_size: int or None
+        Bigger arrays are not measured, None means no limit.
+
+    """
+
+    function: Callable
+    params: dict = {}
+    integers: bool = False
+    max_size: int | None = None
+
+
+SORTS = {
+    'insert_sort': SortCase(insert_sort, max_size=5000),
+    'insert_sort_opt': SortCase(insert_sort_opt, max_size=10000),
+    'merge_sort': SortCase(merge_sort),
+    'merge_sort_no_opt': SortCase(merge_sort, {'opt': False}),
+    'merge_sort_no_recursion': SortCase(merge_sort, {'no_recursion': True}),
+    'merge_sort_adaptive': SortCase(merge_sort, {'adaptive': True}),
+    'merge_sort_parallel': SortCase(merge_sort_parallel),
+    'quick_sort_random': SortCase(quick_sort, {'pivot_str': 'random'}),
+    'quick_sort_clst_avg': SortCase(quick_sort, {'pivot_str': 'clst_avg'}),
+    'quick_sort_m3': SortCase(quick_sort, {'pivot_str': 'm3'}),
+    'quick_sort_mm': SortCase(quick_sort, {'pivot_str': 'mm'}),
+    'quick_sort_intro': SortCase(quick_sort, {'pivot_str': 'intro'}),
+    'quick_sort_3way': SortCase(quick_sort, {'partition': '3way'}),
+    'quick_sort_dual_pivot': SortCase(quick_sort,
+                                      {'partition': 'dual_pivot'}),
+    'sample_sort': SortCase(sample_sort),
+    'heap_sort': SortCase(heap_sort),
+    'count_sort': SortCase(count_sort, integers=True),
+    'count_sort_numpy': SortCase(count_sort, {'backend': 'numpy'},
+                                 integers=True),
+    'digit_sort': SortCase(digit_sort, integers=True, max_size=100000),
+    'digit_sort_opt': SortCase(digit_sort_opt, integers=True),
+    'digit_sort_opt_256': SortCase(digit_sort_opt, {'base': 256},
+                                   integers=True),
+    'digit_sort_opt_numpy': SortCase(digit_sort_opt, {'backend': 'numpy'},
+                                     integers=True),
+    'radix_sort': SortCase(radix_sort),
+}
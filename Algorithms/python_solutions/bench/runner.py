@@ -0,0 +1,368 @@
+"""
+Benchmark Runner Module
+=======================
+
+This module measures the sorts of `registry.py` over a matrix of sizes
+and input distributions of `distributions.py`, saves the results as JSON
+and compares them with a saved baseline to reveal regressions.
+
+Every case is measured in a fresh worker process by default, so the
+peak resident set size (RSS) of one sort is not affected by the memory
+left behind by another. RSS is sampled by a background thread through
+psutil while the sort runs. Wall time is the best of several repeats,
+as the least noisy estimate.
+
+Functions
+---------
+measure(function: Callable, array: list[float], params: dict = {},
+    repeat: int = 3) -> dict
+    Measure wall time and peak RSS of sorting copies of the array.
+
+run_case(sort: str, distribution: str, size: int, seed: int = 0,
+    repeat: int = 3, integers: bool | None = None) -> dict
+    Measure one sort on one generated input.
+
+run_benchmarks(sorts: list[str] | None = None,
+    distributions: list[str] | None = None,
+    sizes: list[int] = SIZES, seed: int = 0, repeat: int = 3,
+    isolate: bool = True, integers: bool | None = None) -> dict
+    Measure every sort on every distribution and size.
+
+save_results(results: dict, path: str) -> None
+    Write benchmark results to a JSON file.
+
+load_results(path: str) -> dict
+    Read benchmark results from a JSON file.
+
+compare(current: dict, baseline: dict,
+    time_threshold: float = TIME_THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD) -> list[dict]
+    Find the cases which got slower or hungrier than in the baseline.
+
+Constants
+---------
+SIZES: tuple[int]
+    Default sizes of the input arrays, (1000, 10000, 100000).
+
+TIME_THRESHOLD: float
+    Relative slowdown reported as a regression, 0.25.
+
+MEMORY_THRESHOLD: float
+    Relative growth of memory reported as a regression, 0.25.
+
+TIME_SLACK: float
+    Slowdowns not bigger than this number of seconds are noise, 0.001.
+
+MEMORY_SLACK: int
+    Memory growth not bigger than this number of bytes is noise, 1 MiB.
+
+SAMPLING_INTERVAL: float
+    Seconds between RSS samples, 0.001.
+
+"""
+
+
+import json
+import platform
+import threading
+import time
+
+
+from concurrent.futures import ProcessPoolExecutor as Pool
+from multiprocessing import cpu_count
+from typing import Callable
+
+import psutil
+
+from Algorithms.python_solutions.bench.distributions import \
+    DISTRIBUTIONS, make_array
+from Algorithms.python_solutions.bench.registry import SORTS
+
+
+SIZES = (1000, 10000, 100000)
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.25
+TIME_SLACK = 0.001
+MEMORY_SLACK = 1024 * 1024
+SAMPLING_INTERVAL = 0.001
+
+
+def measure(function: Callable, array: list[float], params: dict = {},
+            repeat: int = 3) -> dict:
+    """
+    Measure wall time and peak RSS of sorting copies of the array.
+
+    Parameters
+    ----------
+    function: Callable
+        The sort, called as function(copy_of_array, **params).
+
+    array: list[float]
+        The input, it is not changed.
+
+    params: dict
+        Keyword parameters of the sort. Default is {}.
+
+    repeat: int
+        The number of measured runs. Default is 3.
+
+    Returns
+    -------
+    dict
+        'time' - the best wall time in seconds, 'times' - all of them,
+        'peak_rss' - the peak RSS of the process in bytes and
+        'rss_growth' - how much the peak exceeds RSS before sorting.
+
+    """
+    process = psutil.Process()
+    start_rss = peak_rss = process.memory_info().rss
+    stop = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak_rss
+        while not stop.wait(SAMPLING_INTERVAL):
+            peak_rss = max(peak_rss, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    times = []
+    try:
+        for _ in range(repeat):
+            array_copy = array.copy()
+            start = time.perf_counter()
+            function(array_copy, **params)
+            times.append(time.perf_counter() - start)
+            del array_copy
+    finally:
+        stop.set()
+        sampler.join()
+    peak_rss = max(peak_rss, process.memory_info().rss)
+
+    return {'time': min(times), 'times': times, 'peak_rss': peak_rss,
+            'rss_growth': peak_rss - start_rss}
+
+
+def run_case(sort: str, distribution: str, size: int, seed: int = 0,
+             repeat: int = 3, integers: bool | None = None) -> dict:
+    """
+    Measure one sort on one generated input.
+
+    The input is generated inside this function, so the case can be sent
+    to a worker process by names only. Errors of the sort are recorded
+    instead of raised, so one broken sort does not stop the whole run.
+
+    Parameters
+    ----------
+    sort: str
+        The name of the sort in SORTS.
+
+    distribution: str
+        The name of the distribution in DISTRIBUTIONS.
+
+    size: int
+        The size of the input.
+
+    seed: int
+        The seed of the input generator. Default is 0.
+
+    repeat: int
+        The number of measured runs. Default is 3.
+
+    integers: bool or None
+        Whether to sort integers or floats, None means integers for
+        the sorts which accept integers only and floats for the others.
+        Default is None.
+
+    Returns
+    -------
+    dict
+        The case names together with the `measure` results or
+        with the 'error' message.
+
+    """
+    case = SORTS[sort]
+    if integers is None:
+        integers = case.integers
+    array = make_array(distribution, size, seed, integers)
+    result = {'sort': sort, 'distribution': distribution, 'size': size}
+    try:
+        result.update(measure(case.function, array, case.params, repeat))
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+    return result
+
+
+def run_benchmarks(sorts: list[str] | None = None,
+                   distributions: list[str] | None = None,
+                   sizes: list[int] = SIZES, seed: int = 0,
+                   repeat: int = 3, isolate: bool = True,
+                   integers: bool | None = None) -> dict:
+    """
+    Measure every sort on every distribution and size.
+
+    Sizes bigger than the max_size of a sort are skipped.
+
+    Parameters
+    ----------
+    sorts: list[str] or None
+        Names of the sorts, None means all of SORTS. Default is None.
+
+    distributions: list[str] or None
+        Names of the distributions, None means all of DISTRIBUTIONS.
+        Default is None.
+
+    sizes: list[int]
+        Sizes of the inputs. Default is SIZES.
+
+    seed: int
+        The seed of the input generator. Default is 0.
+
+    repeat: int
+        The number of measured runs of every case. Default is 3.
+
+    isolate: bool
+        Whether to measure every case in a fresh worker process.
+        Default is True.
+
+    integers: bool or None
+        Whether to sort integers or floats, see `run_case`.
+        Default is None.
+
+    Returns
+    -------
+    dict
+        'meta' - the settings and the environment of the run and
+        'results' - the list of `run_case` results.
+
+    Raises
+    ------
+    ValueError
+        Raised if a sort or a distribution is unknown.
+
+    """
+    sorts = list(SORTS) if sorts is None else sorts
+    distributions = list(DISTRIBUTIONS) if distributions is None \
+        else distributions
+    unknown = [name for name in sorts if name not in SORTS] + \
+        [name for name in distributions if name not in DISTRIBUTIONS]
+    if unknown:
+        raise ValueError(f'Unknown sorts or distributions: {unknown}')
+
+    results = []
+    for sort in sorts:
+        max_size = SORTS[sort].max_size
+        for distribution in distributions:
+            for size in sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                case = (sort, distribution, size, seed, repeat, integers)
+                if isolate:
+                    with Pool(max_workers=1) as pool:
+                        results.append(pool.submit(run_case, *case).result())
+                else:
+                    results.append(run_case(*case))
+
+    meta = {'python': platform.python_version(),
+            'platform': platform.platform(), 'cpu_count': cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'seed': seed, 'repeat': repeat, 'sizes': list(sizes),
+            'isolate': isolate, 'integers': integers}
+    return {'meta': meta, 'results': results}
+
+
+def save_results(results: dict, path: str) -> None:
+    """
+    Write benchmark results to a JSON file.
+
+    Parameters
+    ----------
+    results: dict
+        The results of `run_benchmarks`.
+
+    path: str
+        The path of the file.
+
+    """
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load_results(path: str) -> dict:
+    """
+    Read benchmark results from a JSON file.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file written by `save_results`.
+
+    Returns
+    -------
+    dict
+        The results of `run_benchmarks`.
+
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(current: dict, baseline: dict,
+            time_threshold: float = TIME_THRESHOLD,
+            memory_threshold: float = MEMORY_THRESHOLD) -> list[dict]:
+    """
+    Find the cases which got slower or hungrier than in the baseline.
+
+    Cases are matched by the sort, the distribution and the size, the
+    ones absent from either run are ignored. A case which fails now but
+    did not fail in the baseline is a regression too. Differences within
+    TIME_SLACK and MEMORY_SLACK are never reported, since timer and
+    allocator noise dominate there.
+
+    Parameters
+    ----------
+    current: dict
+        The results of `run_benchmarks` to check.
+
+    baseline: dict
+        The results of `run_benchmarks` to compare with.
+
+    time_threshold: float
+        Relative slowdown of the best time reported as a regression.
+        Default is TIME_THRESHOLD.
+
+    memory_threshold: float
+        Relative growth of rss_growth reported as a regression.
+        Default is MEMORY_THRESHOLD.
+
+    Returns
+    -------
+    list[dict]
+        The regressions with the case names, the 'metric' ('time',
+        'rss_growth' or 'error'), the 'baseline' and 'current' values and
+        their 'ratio'.
+
+    """
+    def key(result: dict) -> tuple:
+        return result['sort'], result['distribution'], result['size']
+
+    old_results = {key(result): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = old_results.get(key(result))
+        if old is None or 'error' in old:
+            continue
+        case = dict(zip(('sort', 'distribution', 'size'), key(result)))
+        if 'error' in result:
+            regressions.append({**case, 'metric': 'error', 'baseline': None,
+                                'current': result['error'], 'ratio': None})
+            continue
+        for metric, threshold, slack in (
+                ('time', time_threshold, TIME_SLACK),
+                ('rss_growth', memory_threshold, MEMORY_SLACK)):
+            before, after = old[metric], result[metric]
+            if after > before * (1 + threshold) and after - before > slack:
+                regressions.append({
+                    **case, 'metric': metric, 'baseline': before,
+                    'current': after,
+                    'ratio': after / before if before else float('inf')})
+    return regressions
@@ -8,16 +8,39 @@ Two implementations are available: one with recursion and another
 without recursion. The choice between the two depends on your
 requirements for space efficiency and time complexity.
 
+Two more modes do not halve the cut blindly. Interpolation search probes
+where the value should be if the elements grew linearly between the
+edges of the cut, which takes O(log(log(n))) probes on uniformly
+distributed elements. Exponential search probes the indexes 1, 2, 4, ...
+until it passes the value and searches inside the last bracket, so it
+needs no length and works on unbounded sorted sources.
+
 Functions
 ---------
-bin_search(array: list[int], value_to_search: int, no_recursion=False) -> bool
+bin_search(array: list[int], value_to_search: int, no_recursion=False,
+    mode: str = 'binary') -> bool
     Binary search in a sorted array.
 
 _bin_search(array, left_edge, right_edge, value_to_search) -> bool
     Helper function for binary search with recursion.
+
+_interpolation_search(array, value_to_search) -> bool
+    Helper function for interpolation search with the bisection guard.
+
+_exponential_search(array, value_to_search) -> bool
+    Helper function for exponential search without the length.
+
+Constants
+---------
+MODES: tuple[str]
+    Names of the search modes, 'binary', 'interpolation'
+    and 'exponential'.
 """
 
 
+MODES = ('binary', 'interpolation', 'exponential')
+
+
 def _bin_search(array, left_edge, right_edge, value_to_search) -> bool:
     '''
         This is the binary search with recursion implementation helper.
@@ -81,8 +104,137 @@ def _bin_search(array, left_edge, right_edge, value_to_search) -> bool:
         return _bin_search(array, middle, right_edge, value_to_search)
 
 
-def bin_search(array: list[int], value_to_search: int, no_recursion=False) \
-        -> bool:
+def _interpolation_search(array, value_to_search) -> bool:
+    '''
+        This is the interpolation search helper.
+
+        The probe is put where the value would be if the elements of
+        the cut grew linearly from its left edge to its right one.
+        Skewed data makes such probes land next to an edge again and
+        again, so an interpolation probe which does not halve the cut
+        is followed by a plain bisection probe, which keeps the worst
+        case at O(log2 of the size of the array) probes. Bisection is
+        also used when infinite elements make the probe not finite.
+
+        Parameters
+        ----------
+        array: list[int]
+            One-dimensional sorted array of numbers.
+
+        value_to_search: int
+            Value to be searched inside the array.
+
+        Returns
+        -------
+        bool
+            Whether searched value is inside the array
+    '''
+    # the edge elements are probed once, afterwards the value
+    # always lies strictly between the elements at the edges
+    if len(array) == 0:
+        return False
+    left_edge, left_value = 0, array[0]
+    if not left_value < value_to_search:
+        return left_value == value_to_search
+    right_edge = len(array) - 1
+    right_value = array[right_edge]
+    if not value_to_search < right_value:
+        return right_value == value_to_search
+    interpolate = True
+
+    while right_edge - left_edge > 1:
+        middle = (left_edge + right_edge) // 2
+        if interpolate:
+            try:
+                probe = left_edge + int(
+                    (value_to_search - left_value) *
+                    (right_edge - left_edge) // (right_value - left_value))
+                middle = min(max(probe, left_edge + 1), right_edge - 1)
+            except (ValueError, OverflowError):
+                # infinite elements make the probe nan or infinite,
+                # the bisection probe is taken instead
+                pass
+
+        middle_value = array[middle]
+        if middle_value == value_to_search:
+            return True
+
+        width = right_edge - left_edge
+        if middle_value < value_to_search:
+            left_edge, left_value = middle, middle_value
+        else:
+            right_edge, right_value = middle, middle_value
+
+        # the guard against skewed data
+        interpolate = not interpolate or \
+            right_edge - left_edge <= width // 2
+
+    return False
+
+
+def _exponential_search(array, value_to_search) -> bool:
+    '''
+        This is the exponential search helper.
+
+        The indexes 1, 2, 4, 8 and so on are probed until an element not
+        less than the value is met or the index is out of the array,
+        then binary search runs inside the last bracket. It takes
+        O(log2 of the index of the value) probes and asks the array
+        only for elements, never for its length.
+
+        Parameters
+        ----------
+        array: Sequence[int]
+            One-dimensional sorted array of numbers or any object which
+            returns its elements by indexes and raises IndexError past
+            its end.
+
+        value_to_search: int
+            Value to be searched inside the array.
+
+        Returns
+        -------
+        bool
+            Whether searched value is inside the array
+    '''
+    def element(index):
+        # past the end of the array every element is
+        # considered bigger than the searched value
+        try:
+            return array[index], True
+        except IndexError:
+            return None, False
+
+    # find the bracket (left_edge, right_edge]
+    # where the first element not less than the value is
+    left_edge = 0
+    right_edge = 1
+    first, exists = element(0)
+    if not exists or not first < value_to_search:
+        return exists and first == value_to_search
+    while True:
+        current, exists = element(right_edge)
+        if not exists or not current < value_to_search:
+            break
+        left_edge = right_edge
+        right_edge *= 2
+
+    # binary search for the first element not less than the value
+    left_edge += 1
+    while left_edge < right_edge:
+        middle = (left_edge + right_edge) // 2
+        current, exists = element(middle)
+        if exists and current < value_to_search:
+            left_edge = middle + 1
+        else:
+            right_edge = middle
+
+    current, exists = element(right_edge)
+    return exists and current == value_to_search
+
+
+def bin_search(array: list[int], value_to_search: int, no_recursion=False,
+               mode: str = 'binary') -> bool:
     '''
         This function performs a binary search inside sorted array
         consisting of whole numbers.
@@ -105,11 +257,36 @@ def bin_search(array: list[int], value_to_search: int, no_recursion=False) \
             The recursion implementation requires space up to O(log2 of
             the size of the array), and time cuts up to the same value.
 
+        mode: 'binary', 'interpolation' or 'exponential'
+            'binary' halves the cut as described above.
+            'interpolation' probes where the value should be if the
+            elements grew linearly, which takes O(log2(log2 of the size
+            of the array)) probes on uniformly distributed numbers and
+            falls back to halving on skewed ones, see
+            `_interpolation_search`.
+            'exponential' finds the bracket of the value by probing
+            doubling indexes, so the array may be any object returning
+            elements by indexes without the length, see
+            `_exponential_search`.
+            no_recursion is ignored by the last two, they have no
+            recursion. Default is 'binary'.
+
         Returns
         -------
         bool
             Whether searched value is inside the array
+
+        Raises
+        ------
+        ValueError
+            Raised if the mode option cannot be parsed.
     '''
+    if mode not in MODES:
+        raise ValueError('Cannot parse mode option')
+    if mode == 'interpolation':
+        return _interpolation_search(array, value_to_search)
+    if mode == 'exponential':
+        return _exponential_search(array, value_to_search)
 
     # this is no recursion realization
     if no_recursion:
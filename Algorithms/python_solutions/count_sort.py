@@ -10,37 +10,188 @@ in the input array and uses this information to create a sorted array.
 It is particularly efficient when the range of values is small compared
 to the array size.
 
+A dense list of max - min + 1 counters is not always affordable: one
+outlier can make the range huge. Hence the counting is done by one of
+three strategies chosen by the range of values, the size of the array
+and the memory budget for the counters:
+
+- 'dense' - a list of max - min + 1 counters,
+- 'sparse' - a dict of counters for the distinct values only, which are
+  sorted afterwards,
+- 'chunked' - the numbers are put into buckets by sub-ranges of values
+  in one pass and every non-empty bucket is counted on its own, so
+  the counters never take more memory than the budget,
+- 'comparison' - the fallback to the comparison sort, if the range is
+  split into more than MAX_CHUNKS sub-ranges, since the numbers are too
+  spread out for counting to pay off.
+
+With NumPy installed counting and expanding can be done by vectorized
+`np.bincount` and `np.repeat` instead of Python loops, which matters
+for arrays of millions of small integers. Without NumPy the pure Python
+path is used.
+
 Functions
 ---------
-count_sort(array: list[int]) -> list[int]
+choose_count_strategy(array: list[int], memory_limit: int = MEMORY_LIMIT,
+    bounds: tuple[int, int] | None = None) -> str
+    Choose the counting strategy for the array.
+
+count_sort(array: list[int], backend: str = 'python',
+    strategy: str = 'auto', memory_limit: int = MEMORY_LIMIT) -> list[int]
     Sorts an array of whole numbers using the counting sort algorithm.
 
+count_argsort(array: list[int], key: Callable | None = None,
+    reverse: bool = False, memory_limit: int = MEMORY_LIMIT) -> array
+    Finds the stable permutation which sorts whole numbers by counting.
+
+Constants
+---------
+NUMPY_OPT: bool
+    True if NumPy can be imported and the 'numpy' backend is available.
+
+MEMORY_LIMIT: int
+    Default memory budget for the counters in bytes, 64 MiB.
+
+DENSE_RATIO: int
+    Dense counting is preferred while the range of values is not bigger
+    than DENSE_RATIO times the size of the array, 8.
+
+MAX_CHUNKS: int
+    The biggest number of sub-ranges chunked counting is chosen for, 64.
+
+STRATEGIES: tuple[str]
+    Names of the counting strategies.
+
 """
 
 
-def count_sort(array: list[int]) -> list[int]:
+import logging
+
+
+from array import array as typed_array
+from typing import Callable
+
+
+from Algorithms.python_solutions.array_count_sort import _count_pass
+
+
+try:
+    import numpy as np
+    NUMPY_OPT = True
+except ImportError:
+    logging.info('numpy cannot be imported, defaulting to the pure ' +
+                 'python backend of count_sort')
+    NUMPY_OPT = False
+
+
+MEMORY_LIMIT = 64 * 1024 * 1024
+DENSE_RATIO = 8
+MAX_CHUNKS = 64
+STRATEGIES = ('dense', 'sparse', 'chunked', 'comparison')
+
+# approximate memory taken by one dense counter (a list slot or int64)
+# and by one entry of the dict of counters together with its sorted key
+_DENSE_ITEM_BYTES = 8
+_SPARSE_ITEM_BYTES = 112
+
+
+def _bounds(array) -> tuple[int, int]:
     """
-        This function implements counting sort on the array of whole numbers.
+        Find the smallest and the biggest numbers of a non-empty array.
 
-        The algorithm of counting sort employs the basic counting
-        of the whole numbers inside array. It creates another array with
-        (max - min + 1) size, and counts, how many elements with each number
-        are inside the array to be sorted.
-        Time to work: O(size of array + difference between the biggest and
-        the smallest elements)
+        NumPy arrays are scanned by vectorized min and max, the built-in
+        ones would step through their elements one at a time.
+
+        Parameters
+        ----------
+        array: list[int] or np.ndarray
+            array of whole numbers
+
+        Returns
+        -------
+        tuple[int, int]
+            the smallest and the biggest numbers
+    """
+    if NUMPY_OPT and isinstance(array, np.ndarray):
+        return int(array.min()), int(array.max())
+    return min(array), max(array)
+
+
+def choose_count_strategy(array: list[int],
+                          memory_limit: int = MEMORY_LIMIT,
+                          bounds: tuple[int, int] | None = None) -> str:
+    """
+        Choose the counting strategy for the array.
+
+        Dense counting is the fastest while the range of values is
+        comparable to the size of the array, sparse counting wins when
+        the range is much bigger, since it only pays for distinct values
+        and their sorting. Every strategy is considered only if its
+        counters fit into the memory budget (for sparse counting all
+        values are assumed distinct), chunked counting always fits and
+        costs one bucketing pass more than dense counting. If neither
+        fits and the range is split into more than MAX_CHUNKS sub-ranges
+        of the budget, the numbers are too spread out for counting and
+        the comparison sort is chosen.
 
         Parameters
         ----------
         array: list[int]
             array to be sorted consisting of whole numbers
 
+        memory_limit: int
+            memory budget for the counters in bytes
+
+        bounds: tuple[int, int] or None
+            the smallest and the biggest numbers of the array if they are
+            known already, None means to find them by `_bounds`.
+            Default is None.
+
+        Returns
+        -------
+        str
+            'dense', 'sparse', 'chunked' or 'comparison'
+    """
+    if len(array) == 0:
+        return 'dense'
+
+    min_of_array, max_of_array = _bounds(array) if bounds is None \
+        else bounds
+    value_range = max_of_array - min_of_array + 1
+    dense_fits = value_range * _DENSE_ITEM_BYTES <= memory_limit
+    sparse_fits = len(array) * _SPARSE_ITEM_BYTES <= memory_limit
+
+    if dense_fits and (value_range <= DENSE_RATIO * len(array)
+                       or not sparse_fits):
+        return 'dense'
+    if sparse_fits:
+        return 'sparse'
+    chunk_size = max(memory_limit // _DENSE_ITEM_BYTES, 1)
+    if value_range > MAX_CHUNKS * chunk_size:
+        return 'comparison'
+    return 'chunked'
+
+
+def _count_sort_dense(array, min_of_array, max_of_array):
+    """
+        Counting sort with a list of counters for every value in range.
+
+        Parameters
+        ----------
+        array: list[int]
+            array to be sorted consisting of whole numbers
+
+        min_of_array: int
+            the smallest number of the array
+
+        max_of_array: int
+            the biggest number of the array
+
         Returns
         -------
         list[int]
             sorted array
     """
-    min_of_array = min(array)
-    max_of_array = max(array)
     frequency_array = [0 for _ in range(max_of_array + 1 - min_of_array)]
     for number in array:
         frequency_array[number - min_of_array] += 1
@@ -50,3 +201,318 @@ def count_sort(array: list[int]) -> list[int]:
         sorted_array.extend([index + min_of_array] * count)
 
     return sorted_array
+
+
+def _count_sort_sparse(array):
+    """
+        Counting sort with a dict of counters for the distinct values.
+
+        Takes O(n + d * log(d)) time, where d - the number of distinct
+        values, independently of the range of values.
+
+        Parameters
+        ----------
+        array: list[int]
+            array to be sorted consisting of whole numbers
+
+        Returns
+        -------
+        list[int]
+            sorted array
+    """
+    frequency_dict = {}
+    get = frequency_dict.get
+    for number in array:
+        frequency_dict[number] = get(number, 0) + 1
+
+    sorted_array = []
+    for number in sorted(frequency_dict):
+        sorted_array.extend([number] * frequency_dict[number])
+
+    return sorted_array
+
+
+def _count_sort_chunked(array, min_of_array, max_of_array, chunk_size):
+    """
+        Counting sort of one sub-range of values at a time.
+
+        One pass over the array puts the numbers into buckets by their
+        sub-ranges of chunk_size values, only the non-empty sub-ranges
+        get a bucket. The buckets are taken in order and each one is
+        counted by the strategy `choose_count_strategy` picks for it:
+        dense counters over the span of its numbers, or a dict of
+        counters for a few numbers spread over the sub-range.
+        Takes O(n + c * log(c) + r) time, where c - the number of
+        non-empty sub-ranges and r - the total span of the densely
+        counted ones, and the memory for chunk_size counters at once
+        besides the buckets themselves.
+
+        Parameters
+        ----------
+        array: list[int]
+            array to be sorted consisting of whole numbers
+
+        min_of_array: int
+            the smallest number of the array
+
+        max_of_array: int
+            the biggest number of the array
+
+        chunk_size: int
+            the number of counters allowed at once
+
+        Returns
+        -------
+        list[int]
+            sorted array
+    """
+    buckets = {}
+    for number in array:
+        chunk = (number - min_of_array) // chunk_size
+        bucket = buckets.get(chunk)
+        if bucket is None:
+            buckets[chunk] = [number]
+        else:
+            bucket.append(number)
+
+    sorted_array = []
+    for chunk in sorted(buckets):
+        bucket = buckets.pop(chunk)
+        low, high = min(bucket), max(bucket)
+        if choose_count_strategy(bucket, chunk_size * _DENSE_ITEM_BYTES,
+                                 (low, high)) == 'dense':
+            sorted_array.extend(_count_sort_dense(bucket, low, high))
+        else:
+            sorted_array.extend(_count_sort_sparse(bucket))
+
+    return sorted_array
+
+
+def _count_sort_numpy(array, values, min_of_array, max_of_array, strategy,
+                      chunk_size):
+    """
+        Counting sort on NumPy arrays.
+
+        The frequencies are counted by np.bincount (np.unique for sparse
+        counting) and the sorted array is produced by np.repeat of every
+        value by its frequency.
+
+        Parameters
+        ----------
+        array: list[int] or np.ndarray
+            array to be sorted consisting of whole numbers
+
+        values: np.ndarray
+            the array as int64 NumPy array
+
+        min_of_array: int
+            the smallest number of the array
+
+        max_of_array: int
+            the biggest number of the array
+
+        strategy: str
+            'dense', 'sparse', 'chunked' or 'comparison'
+
+        chunk_size: int
+            the number of counters allowed at once for chunked counting
+
+        Returns
+        -------
+        list[int] or np.ndarray
+            sorted array of the same type as the input one
+    """
+
+    if strategy == 'comparison':
+        sorted_array = np.sort(values)
+    elif strategy == 'sparse':
+        distinct, frequency_array = np.unique(values, return_counts=True)
+        sorted_array = np.repeat(distinct, frequency_array)
+    elif strategy == 'dense':
+        frequency_array = np.bincount(
+            values - min_of_array, minlength=max_of_array + 1 - min_of_array)
+        sorted_array = np.repeat(
+            np.arange(min_of_array, max_of_array + 1, dtype=np.int64),
+            frequency_array)
+    else:
+        # group the numbers by their sub-ranges of chunk_size values
+        # at once, as the buckets of `_count_sort_chunked`
+        chunks = (values - min_of_array) // chunk_size
+        order = np.argsort(chunks, kind='stable')
+        grouped = values[order]
+        edges = np.flatnonzero(np.diff(chunks[order])) + 1
+        parts = []
+        for bucket in np.split(grouped, edges):
+            low, high = int(bucket.min()), int(bucket.max())
+            if high - low + 1 <= DENSE_RATIO * len(bucket):
+                frequency_array = np.bincount(bucket - low,
+                                              minlength=high + 1 - low)
+                parts.append(np.repeat(
+                    np.arange(low, high + 1, dtype=np.int64),
+                    frequency_array))
+            else:
+                parts.append(np.sort(bucket))
+        sorted_array = np.concatenate(parts)
+
+    if isinstance(array, np.ndarray):
+        return sorted_array.astype(array.dtype, copy=False)
+    return sorted_array.tolist()
+
+
+def count_sort(array: list[int], backend: str = 'python',
+               strategy: str = 'auto',
+               memory_limit: int = MEMORY_LIMIT) -> list[int]:
+    """
+        This function implements counting sort on the array of whole numbers.
+
+        The algorithm of counting sort employs the basic counting
+        of the whole numbers inside array. It creates another array with
+        (max - min + 1) size, and counts, how many elements with each number
+        are inside the array to be sorted.
+        Time to work: O(size of array + difference between the biggest and
+        the smallest elements)
+        If the range is too big for the memory budget or much bigger than
+        the array, only the distinct numbers are counted, the range is
+        counted by sub-ranges or too spread out numbers are sorted by
+        comparisons, see `choose_count_strategy`.
+
+        Parameters
+        ----------
+        array: list[int]
+            array to be sorted consisting of whole numbers
+
+        backend: 'python' or 'numpy'
+            'numpy' counts and expands with vectorized NumPy functions,
+            a NumPy array is returned for a NumPy array input.
+            Falls back to 'python' if NumPy is not installed or
+            the numbers do not fit into int64. Default is 'python'.
+
+        strategy: 'auto', 'dense', 'sparse', 'chunked' or 'comparison'
+            The counting strategy, 'auto' chooses it by
+            `choose_count_strategy` and logs the choice. Default is 'auto'.
+
+        memory_limit: int
+            Memory budget for the counters in bytes, bounds the sub-ranges
+            of chunked counting. Default is MEMORY_LIMIT.
+
+        Returns
+        -------
+        list[int]
+            sorted array
+
+        Raises
+        ------
+        ValueError
+            Raised if the backend or strategy option cannot be parsed
+            or the 'numpy' backend gets numbers which are not whole.
+    """
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Cannot parse backend option')
+    if strategy != 'auto' and strategy not in STRATEGIES:
+        raise ValueError('Cannot parse strategy option')
+    if len(array) == 0:
+        return array[:]
+
+    chunk_size = max(memory_limit // _DENSE_ITEM_BYTES, 1)
+
+    # the bounds are found once and shared by the choice of
+    # the strategy and the counting itself
+    values = None
+    if backend == 'numpy' and NUMPY_OPT:
+        values = np.asarray(array)
+        if values.dtype.kind == 'O':
+            # python ints which do not fit into int64
+            logging.info('numbers do not fit into int64, defaulting ' +
+                         'to the pure python backend of count_sort')
+            values = None
+        elif values.dtype.kind not in 'biu':
+            raise ValueError('count_sort sorts whole numbers only')
+        else:
+            values = values.astype(np.int64, copy=False)
+    if values is not None:
+        min_of_array, max_of_array = _bounds(values)
+    else:
+        min_of_array, max_of_array = _bounds(array)
+
+    if strategy == 'auto':
+        strategy = choose_count_strategy(array, memory_limit,
+                                         (min_of_array, max_of_array))
+        logging.debug(f'count_sort uses {strategy} counting')
+
+    if values is not None:
+        return _count_sort_numpy(array, values, min_of_array, max_of_array,
+                                 strategy, chunk_size)
+
+    if strategy == 'comparison':
+        return sorted(array)
+
+    if strategy == 'sparse':
+        return _count_sort_sparse(array)
+
+    if strategy == 'chunked':
+        return _count_sort_chunked(array, min_of_array, max_of_array,
+                                   chunk_size)
+    return _count_sort_dense(array, min_of_array, max_of_array)
+
+
+def count_argsort(array: list[int], key: Callable | None = None,
+                  reverse: bool = False,
+                  memory_limit: int = MEMORY_LIMIT) -> typed_array:
+    """
+        This function finds the permutation which sorts the array
+        of whole numbers by counting.
+
+        Every key is turned into a rank: the key minus the smallest key
+        for dense counting, the index among the sorted distinct keys
+        otherwise (the counters of chunked counting would not be smaller
+        than the distinct keys there). One stable counting pass over
+        the positions orders them by the ranks, the descending order
+        takes the ranks from the biggest key, so equal keys keep their
+        order in both.
+        Time to work: O(size of array + number of ranks), plus sorting
+        of the distinct keys if the range is too big for dense counting.
+
+        Parameters
+        ----------
+        array: list[int]
+            array of whole numbers or of elements with whole number keys,
+            it is not changed
+
+        key: Callable or None
+            the function of an element returning a whole number to sort
+            by, computed once per element, None means the elements
+            themselves. Default is None.
+
+        reverse: bool
+            whether the order is descending. Default is False.
+
+        memory_limit: int
+            Memory budget for the counters in bytes, dense counting is
+            chosen by `choose_count_strategy`. Default is MEMORY_LIMIT.
+
+        Returns
+        -------
+        array
+            array('q') of positions, array[i] for i in it go in sorted
+            order
+    """
+    keys = list(array) if key is None else list(map(key, array))
+    if not keys:
+        return typed_array('q')
+
+    min_of_keys, max_of_keys = min(keys), max(keys)
+    if choose_count_strategy(keys, memory_limit,
+                             (min_of_keys, max_of_keys)) == 'dense':
+        if reverse:
+            ranks = [max_of_keys - k for k in keys]
+        else:
+            ranks = [k - min_of_keys for k in keys]
+        size = max_of_keys - min_of_keys + 1
+    else:
+        distinct = sorted(set(keys), reverse=reverse)
+        rank_of = {k: rank for rank, k in enumerate(distinct)}
+        ranks = [rank_of[k] for k in keys]
+        size = len(distinct)
+
+    return _count_pass(typed_array('q', range(len(keys))),
+                       typed_array('q', ranks), size)
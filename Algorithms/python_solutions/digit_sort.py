@@ -7,7 +7,8 @@ specifically designed for integers.
 
 Functions
 ---------
-digit_sort(array: list[int], base: int = 10) -> list[int]
+digit_sort(array: list[int], base: int = 10, key: Callable | None = None,
+    reverse: bool = False) -> list[int]
     Sort a list of non-negative integers using the digit sort algorithm.
 
 to_m_based(number: int, base: int) -> list[int]
@@ -16,11 +17,58 @@ to_m_based(number: int, base: int) -> list[int]
 restore_to_nums(array: list[int], base: int = 10) -> int
     Restore an M-based representation to its decimal form.
 
+digit_sort_opt(array: list[int], base: int = 10, backend: str = 'python',
+    key: Callable | None = None, reverse: bool = False) -> list[int]
+    Sort a list of integers using the digit + radix sort algorithm.
+
+digit_argsort(array: list[int], base: int = 10, backend: str = 'python',
+    key: Callable | None = None, reverse: bool = False) -> array
+    Find the stable permutation which sorts integers by digits.
+
+float_keys(array: list[float]) -> array
+    Map floats to unsigned integers with the same order.
+
+restore_floats(keys: array) -> list[float]
+    Map unsigned integer keys made by float_keys back to floats.
+
+radix_sort(array: list[float], digit_bits: int = 8,
+    key: Callable | None = None, reverse: bool = False) -> list[float]
+    Sort integers or floats by digits of digit_bits bits.
+
+Constants
+---------
+NUMPY_OPT: bool
+    True if NumPy can be imported and the 'numpy' backend of
+    digit_sort_opt is available.
+
 """
+
+
+import logging
+
+
+from array import array as typed_array
+from functools import reduce
+from itertools import chain
+from numbers import Integral
+from operator import and_, index, or_
+from typing import Callable
+
+
+from Algorithms.python_solutions.array_count_sort import multi_key_order
 from Algorithms.python_solutions.two_dim_array_count_sort \
     import two_dim_array_count_sort
 
 
+try:
+    import numpy as np
+    NUMPY_OPT = True
+except ImportError:
+    logging.info('numpy cannot be imported, defaulting to the pure ' +
+                 'python backend of digit_sort_opt')
+    NUMPY_OPT = False
+
+
 def to_m_based(number: int, base: int) -> list[int]:
     """
         Convert a decimal number to an M-based representation.
@@ -54,7 +102,8 @@ def to_m_based(number: int, base: int) -> list[int]:
     m_based = []
     while number != 0:
         number, remainder = divmod(number, base)
-        m_based.insert(0, remainder)
+        m_based.append(remainder)
+    m_based.reverse()
     return m_based
 
 
@@ -89,7 +138,9 @@ def restore_to_nums(array: list[int], base: int = 10) -> int:
     return number
 
 
-def digit_sort(array: list[int], base: int = 10) -> list[int]:
+def digit_sort(array: list[int], base: int = 10,
+               key: Callable | None = None,
+               reverse: bool = False) -> list[int]:
     """
         This function performs digit sort on a list of non-negative integers.
 
@@ -110,6 +161,13 @@ def digit_sort(array: list[int], base: int = 10) -> list[int]:
         base: int
             The array's integers' base depending on which number of digits
             will be determined.
+        key: Callable or None
+            The function of an element returning an integer to sort by.
+            Keys are computed once, their digits are sorted by
+            `multi_key_order` and the elements are taken by the found
+            positions, so the sort is stable. Default is None.
+        reverse: bool
+            Whether to sort in the descending order. Default is False.
 
         Returns
         -------
@@ -117,6 +175,22 @@ def digit_sort(array: list[int], base: int = 10) -> list[int]:
             A sorted list of non-negative integers.
 
     """
+    if key is not None:
+        keys = list(map(key, array))
+        if reverse:
+            # the ties are reversed back with the result
+            keys.reverse()
+        min_of_keys = min(keys, default=0)
+        rows = [to_m_based(k - min_of_keys, base) for k in keys]
+        width = max(map(len, rows), default=0)
+        rows = [[0] * (width - len(row)) + row for row in rows]
+        order = multi_key_order(rows, list(range(width)))
+        if reverse:
+            last = len(array) - 1
+            return [array[last - i] for i in reversed(order)]
+        return [array[i] for i in order]
+    if reverse:
+        return digit_sort(array, base)[::-1]
 
     # extend on negative numbers (- base^k < array[i] < base^k)
     min_of_array = min(array, default=0)
@@ -139,48 +213,504 @@ def digit_sort(array: list[int], base: int = 10) -> list[int]:
     return array
 
 
-def digit_sort_opt(array: list[int], base: int = 10) -> list[int]:
+def _digit_sort_numpy(array, base: int = 10):
+    """
+    Stable LSD radix sort on NumPy arrays.
+
+    Every pass extracts the current digit of all numbers at once and
+    reorders them with a stable argsort of the digits, which NumPy
+    performs as a counting-based radix sort for digits fitting
+    into 8 or 16 bits.
+
+    Parameters
+    ----------
+    array: list[int] or np.ndarray
+        A list of integers to be sorted.
+    base: int
+        The base depending on which the digits are determined.
+
+    Returns
+    -------
+    list[int] or np.ndarray
+        A sorted array of the same type as the input one.
+
+    """
+    values = np.asarray(array, dtype=np.int64)
+    # the offsets from the minimum fit into uint64 even if the range
+    # is wider than 2^63, subtraction wraps around to the right value
+    min_of_array = values.min().view(np.uint64)
+    values = values.view(np.uint64) - min_of_array
+    max_of_array = int(values.max())
+    digit_type = np.uint8 if base <= 1 << 8 else \
+        np.uint16 if base <= 1 << 16 else np.int64
+
+    place = 1
+    while max_of_array // place > 0:
+        digits = (values // place % base).astype(digit_type)
+        values = values[np.argsort(digits, kind='stable')]
+        place *= base
+
+    values = (values + min_of_array).view(np.int64)
+    if isinstance(array, np.ndarray):
+        return values.astype(array.dtype, copy=False)
+    return values.tolist()
+
+
+def _digit_order_numpy(keys, base: int = 10, reverse: bool = False):
+    """
+    Stable LSD radix sort of positions by integer keys on NumPy arrays.
+
+    Parameters
+    ----------
+    keys: list[int] or np.ndarray
+        The integer keys of the elements.
+    base: int
+        The base depending on which the digits are determined.
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    Returns
+    -------
+    np.ndarray
+        The positions of the elements in sorted order.
+
+    """
+    values = np.asarray(keys, dtype=np.int64)
+    # uint64 offsets from the minimum, see `_digit_sort_numpy`
+    values = values.view(np.uint64) - values.min().view(np.uint64)
+    max_of_values = int(values.max())
+    digit_type = np.uint8 if base <= 1 << 8 else \
+        np.uint16 if base <= 1 << 16 else np.int64
+
+    # the ties of the reverse order go in the original order
+    order = np.arange(len(values))
+    if reverse:
+        order = order[::-1]
+    place = 1
+    while max_of_values // place > 0:
+        digits = (values[order] // place % base).astype(digit_type)
+        order = order[np.argsort(digits, kind='stable')]
+        place *= base
+    return order[::-1] if reverse else order
+
+
+def _digit_order(keys: list[int], base: int = 10,
+                 reverse: bool = False) -> list[int]:
+    """
+    Stable LSD radix sort of positions by integer keys in any base.
+
+    Positions are distributed into buckets by the digits of their keys
+    from the least significant one until the place value exceeds
+    the biggest key, the keys are never moved.
+
+    Parameters
+    ----------
+    keys: list[int]
+        The integer keys of the elements.
+    base: int
+        The base depending on which the digits are determined.
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    Returns
+    -------
+    list[int]
+        The positions of the elements in sorted order.
+
+    """
+    min_of_keys = min(keys, default=0)
+    keys = [k - min_of_keys for k in keys]
+    max_of_keys = max(keys, default=0)
+
+    # the ties of the reverse order go in the original order
+    order = list(range(len(keys)))
+    if reverse:
+        order.reverse()
+    place = 1
+    while max_of_keys // place > 0:
+        buckets = [[] for _ in range(base)]
+        appends = [bucket.append for bucket in buckets]
+        for i in order:
+            appends[keys[i] // place % base](i)
+        order = list(chain.from_iterable(buckets))
+        place *= base
+    if reverse:
+        order.reverse()
+    return order
+
+
+def _digit_opt_order(keys: list[int], base: int, backend: str,
+                     reverse: bool):
+    """
+    Stable order of positions by integer keys as digit_sort_opt sorts.
+
+    Parameters
+    ----------
+    keys: list[int] or np.ndarray
+        The integer keys of the elements.
+    base: int
+        The base depending on which the digits are determined.
+    backend: 'python' or 'numpy'
+        The backend of digit_sort_opt.
+    reverse: bool
+        Whether the order is descending.
+
+    Returns
+    -------
+    list[int] or np.ndarray
+        The positions of the elements in sorted order, a NumPy array
+        for the 'numpy' backend.
+
     """
-    Sort a list of non-negative integers using the digit + radix sort
-    algorithm.
+    if backend == 'numpy' and NUMPY_OPT and len(keys) > 0:
+        try:
+            return _digit_order_numpy(keys, base, reverse)
+        except OverflowError:
+            logging.info('keys do not fit into int64, defaulting ' +
+                         'to the pure python backend of digit_sort_opt')
+    if NUMPY_OPT and isinstance(keys, np.ndarray):
+        keys = keys.tolist()
+    if base & (base - 1) == 0 and 2 <= base <= 1 << 16:
+        return _radix_order(keys, base.bit_length() - 1, reverse)
+    return _digit_order(keys, base, reverse)
+
+
+def digit_sort_opt(array: list[int], base: int = 10,
+                   backend: str = 'python', key: Callable | None = None,
+                   reverse: bool = False) -> list[int]:
+    """
+    Sort a list of integers using the digit + radix sort algorithm.
 
     Parameters
     ----------
     array: list[int]
-        A list of non-negative integers to be sorted using digit sort.
+        A list of integers to be sorted using digit sort.
     base: int
         The array's integers' base depending on which number of digits
         will be determined.
+    backend: 'python' or 'numpy'
+        'numpy' performs the radix passes on NumPy arrays, a NumPy array
+        is returned for a NumPy array input. Falls back to 'python'
+        if NumPy is not installed or the numbers do not fit into int64.
+        Default is 'python'.
+        The 'python' backend sorts by `radix_sort` with shifts and masks
+        if the base is a power of two not bigger than 2^16.
+    key: Callable or None
+        The function of an element returning an integer to sort by.
+        Keys are computed once into a parallel list, the positions of the
+        elements are sorted by the digits of the keys and the elements are
+        taken by the sorted positions, so the sort is stable.
+        Default is None.
+    reverse: bool
+        Whether to sort in the descending order. Default is False.
 
     Returns
     -------
     list[int]
-        A sorted list of non-negative integers.
+        A sorted list of integers.
+
+    Raises
+    ------
+    ValueError
+        Raised if the backend option cannot be parsed.
 
     """
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Cannot parse backend option')
+    if key is not None:
+        order = _digit_opt_order(list(map(key, array)), base, backend,
+                                 reverse)
+        if NUMPY_OPT and isinstance(order, np.ndarray):
+            if isinstance(array, np.ndarray):
+                return array[order]
+            order = order.tolist()
+        return [array[i] for i in order]
+    if reverse:
+        return digit_sort_opt(array, base, backend)[::-1]
+    if backend == 'numpy' and NUMPY_OPT and len(array) > 0:
+        try:
+            return _digit_sort_numpy(array, base)
+        except OverflowError:
+            logging.info('numbers do not fit into int64, defaulting ' +
+                         'to the pure python backend of digit_sort_opt')
+
+    if base & (base - 1) == 0 and 2 <= base <= 1 << 16:
+        return radix_sort(array, base.bit_length() - 1)
+
     # Extend on negative numbers (- base^k < array[i] < base^k)
     min_of_array = min(array, default=0)
 
     # Normalize the array to positive values
     array = [i - min_of_array for i in array]
 
-    # Find the maximum number of digits in any integer in the array
-    max_digits = max([len(str(i)) for i in array], default=1)
-
     # Perform radix sort on each digit from least significant to most
-    # significant
-    for digit_place in range(max_digits):
+    # significant until the place value exceeds the biggest number
+    max_of_array = max(array, default=0)
+    place = 1
+    while max_of_array // place > 0:
         buckets = [[] for _ in range(base)]
 
         for num in array:
             # Extract the digit at the current place value
-            digit = (num // (base ** digit_place)) % base
-            buckets[digit].append(num)
+            buckets[num // place % base].append(num)
 
         # Reconstruct the array based on the current digit place
         array = [num for bucket in buckets for num in bucket]
+        place *= base
 
     # Restore numbers to their original form
     array = [num + min_of_array for num in array]
 
     return array
+
+
+def digit_argsort(array: list[int], base: int = 10,
+                  backend: str = 'python', key: Callable | None = None,
+                  reverse: bool = False) -> typed_array:
+    """
+    Find the stable permutation which sorts integers by digits.
+
+    The positions are distributed by the digits of the keys exactly as
+    the key option of `digit_sort_opt` does, the elements are never
+    moved and the array is not changed.
+
+    Parameters
+    ----------
+    array: list[int]
+        Integers or elements with integer keys.
+    base: int
+        The base depending on which the digits are determined,
+        powers of two up to 2^16 are sorted with shifts and masks.
+        Default is 10.
+    backend: 'python' or 'numpy'
+        'numpy' performs the radix passes on NumPy arrays and falls back
+        to 'python' if NumPy is not installed or the keys do not fit
+        into int64. Default is 'python'.
+    key: Callable or None
+        The function of an element returning an integer to sort by,
+        computed once per element, None means the elements themselves.
+        Default is None.
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    Returns
+    -------
+    array
+        array('q') of positions, array[i] for i in it go in sorted order
+        and equal keys keep their order.
+
+    Raises
+    ------
+    ValueError
+        Raised if the backend option cannot be parsed.
+
+    """
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Cannot parse backend option')
+    keys = array if key is None else list(map(key, array))
+    order = _digit_opt_order(keys, base, backend, reverse)
+    if NUMPY_OPT and isinstance(order, np.ndarray):
+        return typed_array('q', order.astype(np.int64).tobytes())
+    return typed_array('q', order)
+
+
+def float_keys(array: list[float]) -> typed_array:
+    """
+    Map floats to unsigned integers with the same order.
+
+    The IEEE-754 bits of a double are read as an unsigned 64-bit integer,
+    then the sign bit is set for non-negative numbers and all bits are
+    inverted for negative ones. Unsigned comparison of the results
+    matches the comparison of the floats, except -0.0 < 0.0 and NaNs
+    placed beyond the infinities according to their sign bit.
+
+    Parameters
+    ----------
+    array: list[float]
+        The floats to be mapped.
+
+    Returns
+    -------
+    array
+        array('Q') of the keys.
+
+    """
+    sign, full = 1 << 63, (1 << 64) - 1
+    bits = typed_array('Q', typed_array('d', array).tobytes())
+    return typed_array('Q', [key ^ full if key & sign else key | sign
+                             for key in bits])
+
+
+def restore_floats(keys: typed_array) -> list[float]:
+    """
+    Map unsigned integer keys made by float_keys back to floats.
+
+    Parameters
+    ----------
+    keys: array or list[int]
+        The keys made by float_keys.
+
+    Returns
+    -------
+    list[float]
+        The floats which the keys were made from.
+
+    """
+    sign, full = 1 << 63, (1 << 64) - 1
+    bits = typed_array('Q', [key ^ sign if key & sign else key ^ full
+                             for key in keys])
+    return typed_array('d', bits.tobytes()).tolist()
+
+
+def _radix_sort_keys(keys: list[int], digit_bits: int) -> list[int]:
+    """
+    LSD radix sort of non-negative integers by digits of digit_bits bits.
+
+    The bits which differ between the keys are found at once as
+    the bitwise OR of all keys XOR their bitwise AND, and the passes
+    whose digits are the same for every key are skipped, as well as
+    all passes above the highest differing bit.
+
+    Parameters
+    ----------
+    keys: list[int]
+        Non-negative integers to be sorted.
+    digit_bits: int
+        The number of bits in one digit.
+
+    Returns
+    -------
+    list[int]
+        The sorted keys.
+
+    """
+    if len(keys) <= 1:
+        return list(keys)
+
+    mask = (1 << digit_bits) - 1
+    varying = reduce(or_, keys) ^ reduce(and_, keys)
+    shift = 0
+    while varying >> shift:
+        if varying >> shift & mask:
+            buckets = [[] for _ in range(mask + 1)]
+            appends = [bucket.append for bucket in buckets]
+            for key in keys:
+                appends[key >> shift & mask](key)
+            keys = list(chain.from_iterable(buckets))
+        shift += digit_bits
+    return keys
+
+
+def _radix_order(keys: list[float], digit_bits: int,
+                 reverse: bool = False) -> list[int]:
+    """
+    Stable LSD radix sort of positions by integer or float keys.
+
+    The keys are made non-negative integers as in `radix_sort`, then
+    positions are distributed into buckets by the digits of their keys,
+    skipping the passes whose digits are the same for every key.
+
+    Parameters
+    ----------
+    keys: list[float]
+        The integer or float keys of the elements.
+    digit_bits: int
+        The number of bits in one digit.
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    Returns
+    -------
+    list[int]
+        The positions of the elements in sorted order.
+
+    """
+    if all(isinstance(k, Integral) for k in keys):
+        keys = list(map(index, keys))
+        min_of_keys = min(keys, default=0)
+        keys = [k - min_of_keys for k in keys]
+    else:
+        keys = float_keys(keys).tolist()
+
+    # the ties of the reverse order go in the original order
+    order = list(range(len(keys)))
+    if reverse:
+        order.reverse()
+    if len(keys) > 1:
+        mask = (1 << digit_bits) - 1
+        varying = reduce(or_, keys) ^ reduce(and_, keys)
+        shift = 0
+        while varying >> shift:
+            if varying >> shift & mask:
+                buckets = [[] for _ in range(mask + 1)]
+                appends = [bucket.append for bucket in buckets]
+                for i in order:
+                    appends[keys[i] >> shift & mask](i)
+                order = list(chain.from_iterable(buckets))
+            shift += digit_bits
+    if reverse:
+        order.reverse()
+    return order
+
+
+def radix_sort(array: list[float], digit_bits: int = 8,
+               key: Callable | None = None,
+               reverse: bool = False) -> list[float]:
+    """
+    Sort integers or floats by digits of digit_bits bits.
+
+    Integers are shifted by the minimum to become non-negative, floats
+    are mapped to unsigned integers by `float_keys`, so one LSD radix
+    path sorts ints, negative numbers and doubles. Digits are extracted
+    by shifts and masks and passes where every key has the same digit
+    are skipped. Time complexity is O(n * w / digit_bits), where w -
+    the number of bits in which the keys differ. If any element is
+    a float, all of them are sorted and returned as floats.
+
+    Parameters
+    ----------
+    array: list[float]
+        The integers or floats to be sorted.
+    digit_bits: int
+        The number of bits in one digit, from 1 to 16. 8 and 16 are
+        the usual choices: 16-bit digits halve the number of passes
+        but every pass distributes into 65536 buckets. Default is 8.
+    key: Callable or None
+        The function of an element returning an integer or a float to
+        sort by. Keys are computed once into a parallel list, positions
+        are sorted by them and the elements are taken by the sorted
+        positions, so the sort is stable. Default is None.
+    reverse: bool
+        Whether to sort in the descending order. Default is False.
+
+    Returns
+    -------
+    list[float]
+        A new sorted list.
+
+    Raises
+    ------
+    ValueError
+        Raised if digit_bits is not an integer from 1 to 16.
+
+    """
+    if not isinstance(digit_bits, int) or not 1 <= digit_bits <= 16:
+        raise ValueError('digit_bits must be an integer from 1 to 16')
+    if key is not None:
+        keys = list(map(key, array))
+        return [array[i] for i in _radix_order(keys, digit_bits, reverse)]
+    if reverse:
+        return radix_sort(array, digit_bits)[::-1]
+    if len(array) == 0:
+        return []
+
+    if all(isinstance(number, Integral) for number in array):
+        # NumPy integers become python ints, which cannot overflow
+        array = list(map(index, array))
+        min_of_array = min(array)
+        keys = _radix_sort_keys([number - min_of_array for number in array],
+                                digit_bits)
+        return [key + min_of_array for key in keys]
+
+    return restore_floats(_radix_sort_keys(float_keys(array).tolist(),
+                                           digit_bits))
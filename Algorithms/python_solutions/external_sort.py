@@ -0,0 +1,496 @@
+"""
+External Merge Sort Module
+==========================
+
+This module provides an out-of-core sort for datasets which do not fit
+into memory. The input is cut into chunks bounded by the given memory
+limit, every chunk is sorted by merge sort or quick sort and spilled to
+a temporary file in a compact binary format (`array` for numbers,
+`struct` for records). Then the sorted runs are streamed back through
+the k-way merge of `kway_merge.py` built on a loser tree. If there are
+too many runs to keep a read buffer for each of them within the memory
+limit, the runs are merged in several passes.
+
+Functions
+---------
+external_sort(source, typecode: str = 'd', record_format: str | None = None,
+    memory_limit: int = MEMORY_LIMIT, algorithm: str = 'merge',
+    temp_dir: str | None = None) -> Generator
+    Sort numbers or records from a binary file or an iterable
+    and stream them in ascending order.
+
+external_sort_file(input_path: str, output_path: str, typecode: str = 'd',
+    record_format: str | None = None, memory_limit: int = MEMORY_LIMIT,
+    algorithm: str = 'merge', temp_dir: str | None = None) -> int
+    Sort a binary file of numbers or records into another binary file.
+
+read_items(path: str, typecode: str = 'd', record_format: str | None = None,
+    buffer_size: int = BUFFER_SIZE) -> Generator
+    Stream numbers or records from a binary file.
+
+write_items(file, items: list, typecode: str = 'd',
+    record_format: str | None = None) -> None
+    Write numbers or records to an opened binary file.
+
+Constants
+---------
+MEMORY_LIMIT: int
+    Default peak memory in bytes for the sorted chunks and read buffers,
+    64 MiB.
+
+BUFFER_SIZE: int
+    Default size in bytes of the buffer used for reading a file, 64 KiB.
+
+MIN_BUFFER_SIZE: int
+    The smallest read buffer per run in bytes, it limits the number of
+    runs merged in one pass.
+
+"""
+
+
+import os
+import struct
+import sys
+import tempfile
+
+
+from array import array as typed_array
+from itertools import islice
+from typing import Generator, Iterable
+
+
+from Algorithms.python_solutions.kway_merge import loser_tree_merge
+from Algorithms.python_solutions.merge_sort import merge_sort
+from Algorithms.python_solutions.quick_sort import quick_sort
+
+
+MEMORY_LIMIT = 64 * 2**20
+
+BUFFER_SIZE = 64 * 2**10
+
+MIN_BUFFER_SIZE = 4 * 2**10
+
+
+def _item_bytes(typecode: str, record_format: str | None) -> int:
+    """
+    Calculate the size of one number or record inside a file.
+
+    Parameters
+    ----------
+    typecode : str
+        The array typecode of the numbers.
+
+    record_format : str or None
+        The struct format of the records, it overrides typecode.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    """
+    if record_format is not None:
+        return struct.calcsize(record_format)
+    return typed_array(typecode).itemsize
+
+
+def _memory_per_item(item) -> int:
+    """
+    Estimate the memory taken by one item while its chunk is sorted.
+
+    The estimate consists of the item object itself, its fields for
+    records and three list slots: one in the chunk, one in the sort's
+    auxiliary storage and one for building the chunk.
+
+    Parameters
+    ----------
+    item : float or tuple
+        A sample item of the input.
+
+    Returns
+    -------
+    int
+        The estimated size in bytes.
+
+    """
+    size = sys.getsizeof(item) + 3 * 8
+    if isinstance(item, tuple):
+        size += sum(sys.getsizeof(field) for field in item)
+    return size
+
+
+def read_items(path: str, typecode: str = 'd',
+               record_format: str | None = None,
+               buffer_size: int = BUFFER_SIZE) -> Generator:
+    """
+    Stream numbers or records from a binary file.
+
+    The file is read in blocks of about buffer_size bytes, so the memory
+    taken does not depend on the size of the file. A block is held twice:
+    as bytes and as unpacked items.
+
+    Parameters
+    ----------
+    path : str
+        The path to the binary file.
+
+    typecode : str, optional
+        The array typecode of the numbers, by default 'd'.
+
+    record_format : str or None, optional
+        The struct format of the records, by default None. If given,
+        tuples are yielded instead of numbers.
+
+    buffer_size : int, optional
+        The size of the read buffer in bytes, by default BUFFER_SIZE.
+
+    Yields
+    ------
+    float or tuple
+        The numbers or records in the order of the file.
+
+    """
+    item_bytes = _item_bytes(typecode, record_format)
+    block = max(1, buffer_size // item_bytes) * item_bytes
+    # the file is not buffered, since there may be many of them opened
+    # at once and every read is a whole block anyway
+    with open(path, 'rb', buffering=0) as file:
+        while True:
+            data = file.read(block)
+            if not data:
+                return
+            while len(data) % item_bytes:
+                tail = file.read(item_bytes - len(data) % item_bytes)
+                if not tail:
+                    break
+                data += tail
+            if record_format is not None:
+                yield from struct.iter_unpack(record_format, data)
+            else:
+                yield from typed_array(typecode, data)
+
+
+def write_items(file, items: list, typecode: str = 'd',
+                record_format: str | None = None) -> None:
+    """
+    Write numbers or records to an opened binary file.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The file opened for binary writing.
+
+    items : list
+        The numbers or records to write.
+
+    typecode : str, optional
+        The array typecode of the numbers, by default 'd'.
+
+    record_format : str or None, optional
+        The struct format of the records, by default None.
+
+    Returns
+    -------
+    None
+
+    """
+    if record_format is not None:
+        packer = struct.Struct(record_format)
+        file.write(b''.join(packer.pack(*record) for record in items))
+    else:
+        typed_array(typecode, items).tofile(file)
+
+
+def _spill_runs(items: Iterable, directory: str, typecode: str,
+                record_format: str | None, memory_limit: int,
+                algorithm: str) -> list[str]:
+    """
+    Cut the items into chunks, sort them and write them to run files.
+
+    Parameters
+    ----------
+    items : Iterable
+        The numbers or records to be sorted.
+
+    directory : str
+        The directory for the run files.
+
+    typecode : str
+        The array typecode of the numbers.
+
+    record_format : str or None
+        The struct format of the records.
+
+    memory_limit : int
+        The memory in bytes a chunk may take while it is sorted.
+
+    algorithm : str
+        'merge' or 'quick'.
+
+    Returns
+    -------
+    list[str]
+        Paths to the run files in the order of the input.
+
+    """
+    iterator = iter(items)
+    paths = []
+    chunk_size = None
+    while True:
+        if chunk_size is None:
+            first = list(islice(iterator, 1))
+            if not first:
+                return paths
+            chunk_size = max(1, memory_limit // _memory_per_item(first[0]))
+            chunk = first + list(islice(iterator, chunk_size - 1))
+        else:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return paths
+
+        chunk = merge_sort(chunk, adaptive=True) if algorithm == 'merge' \
+            else quick_sort(chunk)
+
+        path = os.path.join(directory, f'run_{len(paths)}.bin')
+        with open(path, 'wb') as file:
+            write_items(file, chunk, typecode, record_format)
+        paths.append(path)
+        del chunk
+
+
+def external_sort(source, typecode: str = 'd',
+                  record_format: str | None = None,
+                  memory_limit: int = MEMORY_LIMIT,
+                  algorithm: str = 'merge',
+                  temp_dir: str | None = None) -> Generator:
+    """
+    External Merge Sort
+
+    This function sorts numbers or records which do not fit into memory.
+    The input is cut into chunks as large as the memory limit allows,
+    each chunk is sorted and written to a temporary run file. Then the
+    runs are merged by `kway_merge.loser_tree_merge` with one read buffer
+    per run, which takes ceil(log2(k)) comparisons per item. If the
+    buffers of all runs do not fit into the memory limit, groups of runs
+    are merged into longer runs first. The temporary files are removed
+    once the generator is exhausted or closed.
+    Time complexity is O(n*log(n)), memory is bounded by memory_limit
+    plus O(k) for the loser tree and the opened runs, where k - the number
+    of runs merged at once, disk space taken is twice the input size at
+    most.
+
+    Parameters
+    ----------
+    source : str, PathLike or Iterable
+        A path to a binary file of numbers packed as typecode (or records
+        packed as record_format) or any iterable of numbers or tuples.
+
+    typecode : str, optional
+        The array typecode used for the run files (and the source file),
+        by default 'd'. Use 'q' for 64-bit integers.
+
+    record_format : str or None, optional
+        The struct format of the records, e.g. '<qd' for (int, float)
+        pairs, by default None, meaning the items are numbers.
+        Records are compared as tuples.
+
+    memory_limit : int, optional
+        The peak memory in bytes for a sorted chunk or for read buffers
+        of the merge, by default MEMORY_LIMIT.
+
+    algorithm : 'merge' or 'quick', optional
+        The sort applied to the chunks, by default 'merge'.
+
+    temp_dir : str or None, optional
+        The directory for temporary run files, by default None, meaning
+        the system default.
+
+    Returns
+    -------
+    Generator
+        A generator of the items of the source in ascending order.
+
+    Raises
+    ------
+    ValueError
+        Raised if the algorithm cannot be parsed or the memory limit is
+        too small for one read buffer.
+
+    """
+    if algorithm not in ('merge', 'quick'):
+        raise ValueError('Cannot parse algorithm option')
+    if memory_limit < 8 * MIN_BUFFER_SIZE:
+        raise ValueError('memory_limit has to be at least ' +
+                         f'{8 * MIN_BUFFER_SIZE} bytes')
+    return _external_sort(source, typecode, record_format, memory_limit,
+                          algorithm, temp_dir)
+
+
+def _external_sort(source, typecode: str, record_format: str | None,
+                   memory_limit: int, algorithm: str,
+                   temp_dir: str | None) -> Generator:
+    """
+    Generator-helper for external_sort which spills and merges the runs.
+
+    Parameters
+    ----------
+    source : str, PathLike or Iterable
+        A path to a binary file or an iterable of numbers or tuples.
+
+    typecode : str
+        The array typecode of the numbers.
+
+    record_format : str or None
+        The struct format of the records.
+
+    memory_limit : int
+        The peak memory in bytes.
+
+    algorithm : str
+        'merge' or 'quick'.
+
+    temp_dir : str or None
+        The directory for temporary run files.
+
+    Yields
+    ------
+    float or tuple
+        The items of the source in ascending order.
+
+    """
+    chunk_limit = memory_limit
+    if isinstance(source, (str, os.PathLike)):
+        buffer_size = min(BUFFER_SIZE, memory_limit // 8)
+        source = read_items(source, typecode, record_format, buffer_size)
+        chunk_limit -= 2 * buffer_size
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        paths = _spill_runs(source, directory, typecode, record_format,
+                            chunk_limit, algorithm)
+
+        # every run needs its own read buffer plus one for writing,
+        # each of them is held twice, see read_items
+        max_runs = max(2, memory_limit // (2 * MIN_BUFFER_SIZE) - 1)
+        merge_pass = 0
+        while len(paths) > max_runs:
+            merged_paths = []
+            for i in range(0, len(paths), max_runs):
+                group = paths[i:i + max_runs]
+                buffer_size = memory_limit // (2 * (len(group) + 1))
+                path = os.path.join(
+                    directory, f'pass_{merge_pass}_{len(merged_paths)}.bin')
+                with open(path, 'wb', buffering=buffer_size) as file:
+                    _write_stream(file, loser_tree_merge(
+                        [read_items(run, typecode, record_format,
+                                    buffer_size) for run in group]),
+                        typecode, record_format, buffer_size)
+                for run in group:
+                    os.remove(run)
+                merged_paths.append(path)
+            paths = merged_paths
+            merge_pass += 1
+
+        buffer_size = memory_limit // (2 * (len(paths) + 1))
+        yield from loser_tree_merge([read_items(run, typecode,
+                                                record_format, buffer_size)
+                                     for run in paths])
+
+
+def _write_stream(file, items: Iterable, typecode: str,
+                  record_format: str | None, buffer_size: int) -> int:
+    """
+    Write a stream of items to an opened binary file block by block.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        The file opened for binary writing.
+
+    items : Iterable
+        The numbers or records to write.
+
+    typecode : str
+        The array typecode of the numbers.
+
+    record_format : str or None
+        The struct format of the records.
+
+    buffer_size : int
+        The memory in bytes a block of items may take.
+
+    Returns
+    -------
+    int
+        The number of items written.
+
+    """
+    iterator = iter(items)
+    block = None
+    written = 0
+    while True:
+        items_block = list(islice(iterator, block if block else 1))
+        if not items_block:
+            return written
+        if block is None:
+            block = max(1, buffer_size // (
+                _memory_per_item(items_block[0]) +
+                _item_bytes(typecode, record_format)))
+        write_items(file, items_block, typecode, record_format)
+        written += len(items_block)
+
+
+def external_sort_file(input_path: str, output_path: str,
+                       typecode: str = 'd',
+                       record_format: str | None = None,
+                       memory_limit: int = MEMORY_LIMIT,
+                       algorithm: str = 'merge',
+                       temp_dir: str | None = None) -> int:
+    """
+    Sort a binary file of numbers or records into another binary file.
+
+    This is a wrapper around `external_sort` which writes the sorted
+    stream in the same binary format as the input.
+
+    Parameters
+    ----------
+    input_path : str
+        The path to the binary file to be sorted.
+
+    output_path : str
+        The path to the resulting binary file, it may not be input_path.
+
+    typecode : str, optional
+        The array typecode of the numbers, by default 'd'.
+
+    record_format : str or None, optional
+        The struct format of the records, by default None.
+
+    memory_limit : int, optional
+        The peak memory in bytes, by default MEMORY_LIMIT.
+
+    algorithm : 'merge' or 'quick', optional
+        The sort applied to the chunks, by default 'merge'.
+
+    temp_dir : str or None, optional
+        The directory for temporary run files, by default None.
+
+    Returns
+    -------
+    int
+        The number of items written.
+
+    Raises
+    ------
+    ValueError
+        Raised if output_path points to the input file.
+
+    """
+    if os.path.exists(output_path) and \
+            os.path.samefile(input_path, output_path):
+        raise ValueError('output_path cannot point to the input file')
+    buffer_size = min(BUFFER_SIZE, memory_limit // 8)
+    with open(output_path, 'wb', buffering=buffer_size) as file:
+        return _write_stream(
+            file, external_sort(input_path, typecode, record_format,
+                                memory_limit, algorithm, temp_dir),
+            typecode, record_format, buffer_size)
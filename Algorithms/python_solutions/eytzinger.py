@@ -0,0 +1,373 @@
+"""
+Eytzinger Search Index Module
+=============================
+
+This module defines StaticSearchIndex, an immutable index over a sorted
+array answering lower bound, upper bound and membership queries.
+
+Binary search over a sorted list jumps across the whole list on the first
+steps and touches a new cache line on almost every one. The index stores
+the keys in the Eytzinger layout instead: the keys are placed in the
+order of the breadth-first traversal of the implicit binary search tree
+(node k has the children 2k and 2k + 1), so the first levels of every
+search lie close together at the start of one `array.array` buffer of
+unboxed numbers. The descent `k = 2 * k + (keys[k] < value)` has no
+branch on the comparison result, and the answer is restored from the
+final k by dropping its trailing ones.
+
+The blocked layout is the B-tree-like variant: every node holds
+block_size sorted keys and has block_size + 1 children, so a search
+visits only log(n) / log(block_size + 1) nodes and the position inside
+a node is found by `bisect` over one contiguous slice.
+
+The bounds follow `bounds.lower_bound` and `bounds.upper_bound`: the
+lower bound is the index of the first element not less than the value
+(the first encounter of a present value) and the upper bound is the
+index of the last element not greater than it (the last encounter).
+
+Classes
+-------
+StaticSearchIndex
+    An immutable search index over a sorted array in the Eytzinger
+    or the blocked layout.
+
+Constants
+---------
+LAYOUTS: tuple[str]
+    Names of the layouts, 'eytzinger' and 'blocked'.
+
+BLOCK_SIZE: int
+    The default number of keys in a node of the blocked layout, 16.
+
+"""
+
+
+from array import array as typed_array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+
+LAYOUTS = ('eytzinger', 'blocked')
+BLOCK_SIZE = 16
+
+_INT64_MIN, _INT64_MAX = -1 << 63, (1 << 63) - 1
+
+
+def _key_storage(keys: list) -> list:
+    """
+    Put the keys into a compact array if they are all of one number type.
+
+    Parameters
+    ----------
+    keys: list
+        The keys in the layout order.
+
+    Returns
+    -------
+    array or list
+        array('q') for integers fitting into int64, array('d') for floats,
+        the list itself for other keys.
+
+    """
+    types = set(map(type, keys))
+    if types == {int} and _INT64_MIN <= min(keys) and \
+            max(keys) <= _INT64_MAX:
+        return typed_array('q', keys)
+    if types == {float}:
+        return typed_array('d', keys)
+    return keys
+
+
+class StaticSearchIndex:
+    """
+    An immutable search index over a sorted array in the Eytzinger
+    or the blocked layout.
+
+    Attributes
+    ----------
+    size : int
+        The number of keys.
+
+    layout : str
+        'eytzinger' or 'blocked'.
+
+    block_size : int
+        The number of keys in a node of the blocked layout.
+
+    keys : array or list
+        The keys in the layout order, array('q') or array('d') for
+        numbers of one type. Position 0 of the Eytzinger layout is unused.
+
+    ranks : array
+        array('q') of the indexes of the keys inside the sorted array
+        for every position of the layout. Unused positions hold size.
+
+    Methods
+    -------
+    __init__(self, array: Iterable, layout: str = 'eytzinger',
+             block_size: int = BLOCK_SIZE) -> None
+        Build the index of the sorted array.
+
+    lower_bound(self, value: float) -> int
+        Find the index of the first element not less than the value.
+
+    upper_bound(self, value: float) -> int
+        Find the index of the last element not greater than the value.
+
+    contains(self, value: float) -> bool
+        Check whether the value is inside the array.
+
+    __len__, __contains__
+        The usual container methods.
+
+    """
+
+    def __init__(self, array: Iterable, layout: str = 'eytzinger',
+                 block_size: int = BLOCK_SIZE) -> None:
+        """
+        Build the index of the sorted array in O(n).
+
+        Parameters
+        ----------
+        array : Iterable
+            The elements sorted in the ascending order.
+
+        layout : 'eytzinger' or 'blocked', optional
+            The layout of the keys, by default 'eytzinger'.
+
+        block_size : int, optional
+            The number of keys in a node of the blocked layout,
+            by default BLOCK_SIZE.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if the layout option cannot be parsed, block_size is
+            less than 1 or the array is not sorted.
+
+        """
+        if layout not in LAYOUTS:
+            raise ValueError('Cannot parse layout option')
+        if block_size < 1:
+            raise ValueError('block_size has to be at least 1')
+        array = list(array)
+        if any(following < preceding for preceding, following
+               in zip(array, array[1:])):
+            raise ValueError('array is not sorted')
+
+        self.size = len(array)
+        self.layout = layout
+        self.block_size = block_size
+        if layout == 'eytzinger':
+            keys, ranks = self._build_eytzinger(array)
+        else:
+            keys, ranks = self._build_blocked(array)
+        self.keys = _key_storage(keys)
+        self.ranks = typed_array('q', ranks)
+
+    def _build_eytzinger(self, array: list) -> tuple[list, list[int]]:
+        """
+        Place the keys in the breadth-first order of the implicit tree.
+
+        The positions 1..n of the tree are visited in order, which is
+        the sorted order of their keys, by an iterative traversal.
+
+        Parameters
+        ----------
+        array : list
+            The sorted elements.
+
+        Returns
+        -------
+        tuple[list, list[int]]
+            The keys and their ranks by positions.
+
+        """
+        size = self.size
+        keys = [array[0] if size else None] * (size + 1)
+        ranks = [size] * (size + 1)
+
+        rank, node, path = 0, 1, []
+        while path or node <= size:
+            while node <= size:
+                path.append(node)
+                node *= 2
+            node = path.pop()
+            keys[node] = array[rank]
+            ranks[node] = rank
+            rank += 1
+            node = 2 * node + 1
+        return keys, ranks
+
+    def _build_blocked(self, array: list) -> tuple[list, list[int]]:
+        """
+        Place the keys into nodes of block_size keys of a B-tree.
+
+        Node k has the children k * (block_size + 1) + 1 + j, j from 0 to
+        block_size, the nodes are visited in order by an iterative
+        traversal. The slots after the last key repeat it and have
+        the rank size, they are never the first one not less than
+        a value since the real last key comes before them.
+
+        Parameters
+        ----------
+        array : list
+            The sorted elements.
+
+        Returns
+        -------
+        tuple[list, list[int]]
+            The keys and their ranks by positions.
+
+        """
+        size, block = self.size, self.block_size
+        blocks = -(-size // block)
+        keys = [array[-1] if size else None] * (blocks * block)
+        ranks = [size] * (blocks * block)
+
+        rank, path = 0, [(0, 0)]
+        while path:
+            node, slot = path.pop()
+            if node >= blocks:
+                continue
+            if slot > 0:
+                position = node * block + slot - 1
+                if rank < size:
+                    keys[position] = array[rank]
+                    ranks[position] = rank
+                rank += 1
+            if slot < block:
+                path.append((node, slot + 1))
+            path.append((node * (block + 1) + 1 + slot, 0))
+        return keys, ranks
+
+    def _search(self, value: float, right: bool) -> int:
+        """
+        Find the rank of the first key greater than (or not less than)
+        the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        right : bool
+            If False, the first key not less than the value is found,
+            otherwise the first key greater than it.
+
+        Returns
+        -------
+        int
+            The index of the key inside the sorted array, the size if
+            there is no such key.
+
+        """
+        keys, size = self.keys, self.size
+        if self.layout == 'eytzinger':
+            node = 1
+            if right:
+                while node <= size:
+                    node = 2 * node + (not value < keys[node])
+            else:
+                while node <= size:
+                    node = 2 * node + (keys[node] < value)
+            # the last turn to the left is where the answer is
+            return self.ranks[node >> (~node & (node + 1)).bit_length()]
+
+        block = self.block_size
+        search = bisect_right if right else bisect_left
+        blocks = len(keys) // block
+        node, position = 0, -1
+        while node < blocks:
+            start = node * block
+            slot = search(keys, value, start, start + block) - start
+            if slot < block:
+                position = start + slot
+            node = node * (block + 1) + 1 + slot
+        return self.ranks[position] if position >= 0 else size
+
+    def lower_bound(self, value: float) -> int:
+        """
+        Find the index of the first element not less than the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        int
+            The index of the first encounter of a present value,
+            the size of the array if every element is less.
+
+        """
+        return self._search(value, False)
+
+    def upper_bound(self, value: float) -> int:
+        """
+        Find the index of the last element not greater than the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        int
+            The index of the last encounter of a present value,
+            -1 if every element is greater.
+
+        """
+        return self._search(value, True) - 1
+
+    def contains(self, value: float) -> bool:
+        """
+        Check whether the value is inside the array.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        bool
+            True if an element equals the value.
+
+        """
+        return self._search(value, True) > self._search(value, False)
+
+    def __len__(self) -> int:
+        """
+        Return the number of keys.
+
+        Returns
+        -------
+        int
+            The number of keys.
+
+        """
+        return self.size
+
+    def __contains__(self, value: float) -> bool:
+        """
+        Check whether the value is inside the array.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        bool
+            True if an element equals the value.
+
+        """
+        return self.contains(value)
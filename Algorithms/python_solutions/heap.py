@@ -18,11 +18,22 @@ Heap
 
 Functions
 ---------
-heap_sort(array: list[float]) -> list[float]
+heap_sort(array: list[float], key: Callable | None = None,
+    reverse: bool = False) -> list[float]
     Sorts an array in ascending order using the heap sort algorithm.
     Heap sort is an efficient comparison-based sorting algorithm that uses
     a binary heap to perform the sorting.
 
+heap_sort_range(array: list[float], left: int, right: int) -> None
+    Sorts a slice of an array in-place using the heap sort algorithm.
+
+heapify(a: list[float], size: int | None = None, offset: int = 0) -> None
+    Turns a list into a min-heap in-place in O(n).
+
+top_k(iterable: Iterable, k: int, key: Callable | None = None,
+    largest: bool = False) -> list
+    Finds the k smallest or largest items of a stream in one pass.
+
 sift_up(array: list[float], element_index: int, size: int) -> None
     Performs the sift-up operation to maintain the heap property.
 
@@ -32,6 +43,10 @@ sift_down(array: list[float], element_index: int) -> None
 """
 
 
+from typing import Callable, Iterable
+
+
+from Algorithms.python_solutions.sort_keys import sort_by_key
 from Algorithms.python_solutions.vector import Vector
 
 
@@ -61,6 +76,9 @@ class Heap(Vector):
              size: int = 0, capacity: int = 1) -> None
         Initialize the heap.
 
+    from_iterable(cls, iterable: Iterable[float]) -> Heap
+        Build a heap of the elements in O(n).
+
     append(self, x: float) -> None
         Append an element to the heap.
 
@@ -93,7 +111,7 @@ class Heap(Vector):
         ----------
         elements : list or None, optional
             An optional list of initial elements for the heap,
-            by default None.
+            by default None. The list is copied and heapified in O(n).
 
         size : int, optional
             The initial size of the heap, by default 0.
@@ -110,8 +128,35 @@ class Heap(Vector):
         self.capacity = capacity
         self.elements = []
         if elements is not None:
-            for i in elements:
-                self.insert(i)
+            self.elements = list(elements)
+            self.size = len(self.elements)
+            # the list stays as long as capacity, which exceeds the size
+            self.capacity = max(2 * self.size, 1)
+            self.elements.extend([None] * (self.capacity - self.size))
+            heapify(self.elements, self.size)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[float]) -> 'Heap':
+        """
+        Build a heap of the elements in O(n).
+
+        The elements are collected into the list of the heap as they are,
+        then every parent node is sifted down starting from the last one
+        (Floyd's method), instead of inserting the elements one by one
+        in O(n log n).
+
+        Parameters
+        ----------
+        iterable : Iterable
+            The elements of the heap.
+
+        Returns
+        -------
+        Heap
+            The heap of the elements.
+
+        """
+        return cls(elements=list(iterable))
 
     def append(self, x: float) -> None:
         """
@@ -225,7 +270,8 @@ class Heap(Vector):
         self.elements[0], self.elements[self.size - 1] = \
             self.elements[self.size - 1], self.elements[0]
         _return = self.elements[self.size - 1]
-        del self.elements[self.size - 1]
+        # keep the freed slot, so that the list stays as long as capacity
+        self.elements[self.size - 1] = None
         self.size -= 1
         i = 0
 
@@ -304,7 +350,7 @@ def sift_up(a: list[float], i: int) -> None:
             break
 
 
-def sift_down(a: list[float], i: int, size: int) -> None:
+def sift_down(a: list[float], i: int, size: int, offset: int = 0) -> None:
     """
     Perform the sift-down operation to maintain heap property.
 
@@ -314,11 +360,16 @@ def sift_down(a: list[float], i: int, size: int) -> None:
         The list representing the elements of the heap.
 
     i : int
-        The index at which the sift-down operation is performed.
+        The index at which the sift-down operation is performed,
+        counted from offset.
 
     size : int
         The size of the heap.
 
+    offset : int, optional
+        The index of the heap's root inside the list, so that a heap
+        can occupy any slice a[offset:offset + size]. By default 0.
+
     Returns
     -------
     None
@@ -328,55 +379,252 @@ def sift_down(a: list[float], i: int, size: int) -> None:
         right_child = 2 * i + 2
         left_child = 2 * i + 1
         if size > right_child:
-            if (a[i] > a[right_child] and a[left_child] >= a[right_child]):
-                a[i], a[right_child] = a[right_child], a[i]
+            current = a[offset + i]
+            left = a[offset + left_child]
+            right = a[offset + right_child]
+            if (current > right and left >= right):
+                a[offset + i], a[offset + right_child] = right, current
                 i = right_child
-            elif (a[i] > a[left_child] and a[right_child] >= a[left_child]):
-                a[i], a[left_child] = a[left_child], a[i]
+            elif (current > left and right >= left):
+                a[offset + i], a[offset + left_child] = left, current
                 i = left_child
             else:
                 break
         elif size > left_child:
-            if a[i] > a[left_child]:
-                a[i], a[left_child] = a[left_child], a[i]
+            if a[offset + i] > a[offset + left_child]:
+                a[offset + i], a[offset + left_child] = \
+                    a[offset + left_child], a[offset + i]
                 break
             break
         else:
             break
 
 
-def heap_sort(array: list[float]) -> list[float]:
+def heapify(a: list[float], size: int | None = None,
+            offset: int = 0) -> None:
+    """
+    Turn a list into a min-heap in-place in O(n).
+
+    Every parent node is sifted down starting from the last one, so
+    every sift-down works on two subtrees which are heaps already.
+    Most of the nodes are near the leaves and sift down only a few
+    levels, which gives O(n) in total.
+
+    Parameters
+    ----------
+    a : list
+        The list to turn into a heap.
+
+    size : int or None, optional
+        The number of elements of the heap, None means the rest of the
+        list after offset. By default None.
+
+    offset : int, optional
+        The index of the heap's root inside the list. By default 0.
+
+    Returns
+    -------
+    None
+
+    """
+    if size is None:
+        size = len(a) - offset
+    for i in range(size // 2 - 1, -1, -1):
+        sift_down(a, i, size, offset)
+
+
+def _sift_down_max(a: list[float], i: int, size: int, offset: int) -> None:
+    """
+    Sift an element down a max-heap by the bottom-up method.
+
+    The hole left by the element descends to a leaf along the larger
+    children, costing one comparison per level instead of two, then the
+    element climbs up from the leaf to its place. Since the element
+    usually comes from the bottom of the heap, it rarely climbs far.
+
+    Parameters
+    ----------
+    a : list
+        The list holding the heap.
+
+    i : int
+        The index of the element to sift down, counted from offset.
+
+    size : int
+        The size of the heap.
+
+    offset : int
+        The index of the heap's root inside the list.
+
+    Returns
+    -------
+    None
+
+    """
+    item = a[offset + i]
+    start = i
+    child = 2 * i + 1
+    while child < size:
+        right = child + 1
+        if right < size and a[offset + child] < a[offset + right]:
+            child = right
+        a[offset + i] = a[offset + child]
+        i = child
+        child = 2 * i + 1
+    while i > start:
+        parent = (i - 1) // 2
+        if a[offset + parent] < item:
+            a[offset + i] = a[offset + parent]
+            i = parent
+        else:
+            break
+    a[offset + i] = item
+
+
+def heap_sort_range(array: list[float], left: int, right: int) -> None:
+    """
+    Sort a slice of an array in-place using the heap sort algorithm.
+
+    The slice array[left:right] is turned into a max-heap in O(n) by
+    sifting down every parent node starting from the last one, then the
+    maximum is repeatedly swapped to the end of the shrinking heap and
+    the element which took its place is sifted down by the bottom-up
+    method. No additional space is used. Time complexity is O(n log n)
+    in the worst case.
+
+    Parameters
+    ----------
+    array : list
+        The list whose slice is to be sorted.
+
+    left : int
+        The starting index of the slice.
+
+    right : int
+        The ending index (exclusive) of the slice.
+
+    Returns
+    -------
+    None
+
+    """
+    size = right - left
+    for i in range(size // 2 - 1, -1, -1):
+        _sift_down_max(array, i, size, left)
+    for end in range(size - 1, 0, -1):
+        array[left], array[left + end] = array[left + end], array[left]
+        _sift_down_max(array, 0, end, left)
+
+
+def heap_sort(array: list[float], key: Callable | None = None,
+              reverse: bool = False) -> list[float]:
     """
     Sort an array in ascending order using the heap sort algorithm.
     Heap sort is a comparison-based sorting algorithm that builds a binary
-    heap data structure and repeatedly extracts the minimum element from the
-    heap. The sorted elements are stored in the original array. This algorithm
-    has a time complexity of O(n log n) in the worst case, making it efficient
-    for large datasets. However, it is not an in-place sorting algorithm since
-    it requires additional space for the heap, making its O(n) space
+    heap data structure and repeatedly extracts the maximum element from the
+    heap. This algorithm has a time complexity of O(n log n) in the worst
+    case, making it efficient for large datasets. It is an in-place sorting
+    algorithm: the heap occupies the array itself, making its O(1) space
     complexity.
     The heap sort algorithm consists of two main phases: heapify and sorting.
-    The "heapify" phase builds a binary heap from the input array,
-    ensuring that the heap property is maintained (parent nodes have smaller
-    values than their children).
-    The "sorting" phase repeatedly removes the minimum element from the heap
-    and places it at the end of the array until the heap is empty.
+    The "heapify" phase builds a binary max-heap from the input array in
+    O(n), ensuring that the heap property is maintained (parent nodes have
+    bigger values than their children).
+    The "sorting" phase repeatedly swaps the maximum element of the heap
+    with its last element, so the sorted tail of the array grows while
+    the heap shrinks.
 
     Parameters
     ----------
     array : list
         The list to be sorted.
 
+    key : Callable or None, optional
+        The function of an element to sort by, computed once per element,
+        see `sort_keys.sort_by_key`. The sort is stable with a key, since
+        ties are broken by the positions. By default None.
+
+    reverse : bool, optional
+        Whether to sort in the descending order. By default False.
+
     Returns
     -------
     list
-        The sorted list in ascending order.
+        The same list sorted in ascending order.
 
     """
-    heap = Heap()
-    length = len(array)
-    for i in range(length):
-        heap.insert(array[i])
-    for i in range(length):
-        array[i] = heap.erase()
+    if key is not None or reverse:
+        array[:] = sort_by_key(heap_sort, array, key, reverse)
+        return array
+    heap_sort_range(array, 0, len(array))
     return array
+
+
+def top_k(iterable: Iterable, k: int, key: Callable | None = None,
+          largest: bool = False) -> list:
+    """
+    Find the k smallest or largest items of a stream in one pass.
+
+    The best k items seen so far are kept in a bounded heap whose root is
+    the worst of them: a max-heap for the smallest items and a min-heap
+    for the largest ones. Every next item is compared with the root only
+    and replaces it if the item is better, so the time complexity is
+    O(n log k) and only O(k) items are held in memory.
+    The result is the same as sorted(iterable, key=key,
+    reverse=largest)[:k], including the order of items with equal keys,
+    and the items themselves are never compared, only their keys.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        The items, read once.
+
+    k : int
+        The number of items to find. Non-positive k gives no items.
+
+    key : Callable or None, optional
+        The function of an item to compare items by, None means the items
+        themselves. By default None.
+
+    largest : bool, optional
+        Whether to find the largest items instead of the smallest ones.
+        By default False.
+
+    Returns
+    -------
+    list
+        The found items, the smallest (or the largest) first.
+
+    """
+    if k <= 0:
+        return []
+    iterator = iter(iterable)
+    # an entry is (key, tie breaker, item): equal keys are ordered by
+    # the position in the stream, the earlier item being the better one
+    sign = -1 if largest else 1
+    heap = []
+    for index, item in enumerate(iterator):
+        heap.append((item if key is None else key(item), sign * index, item))
+        if len(heap) == k:
+            break
+    size = len(heap)
+    for i in range(size // 2 - 1, -1, -1):
+        if largest:
+            sift_down(heap, i, size)
+        else:
+            _sift_down_max(heap, i, size, 0)
+
+    for index, item in enumerate(iterator, size):
+        item_key = item if key is None else key(item)
+        if largest:
+            if heap[0][0] < item_key:
+                heap[0] = (item_key, -index, item)
+                sift_down(heap, 0, size)
+        elif item_key < heap[0][0]:
+            heap[0] = (item_key, index, item)
+            _sift_down_max(heap, 0, size, 0)
+
+    heap_sort_range(heap, 0, size)
+    if largest:
+        heap.reverse()
+    return [item for _, _, item in heap]
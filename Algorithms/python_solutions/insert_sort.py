@@ -10,13 +10,16 @@ portion of the list. This process continues until the entire list is sorted.
 
 Functions
 ---------
-insert_sort(array: list[float]) -> list[float]
+insert_sort(array: list[float], key: Callable | None = None,
+    reverse: bool = False) -> list[float]
     Sorts a list of elements using the Insertion Sort algorithm.
 
-bin_search_fl(array: list[float], value: float, start: int, end: int) -> int:
+bin_search_fl(array: list[float], value: float, start: int, end: int,
+    right: bool = False) -> int:
     A binary search in the array slice consisting of floats.
 
-insert_sort_opt(array: list[float]) -> list[float]
+insert_sort_opt(array: list[float], key: Callable | None = None,
+    reverse: bool = False) -> list[float]
     Sorts a list of elements using the optimized Insertion Sort algorithm.
     This version uses binary search to find the correct position for each
     element, reducing the number of comparisons and improving efficiency.
@@ -24,7 +27,14 @@ insert_sort_opt(array: list[float]) -> list[float]
 """
 
 
-def insert_sort(array: list[float]) -> list[float]:
+from typing import Callable
+
+
+from Algorithms.python_solutions.sort_keys import sort_by_key
+
+
+def insert_sort(array: list[float], key: Callable | None = None,
+                reverse: bool = False) -> list[float]:
     """
     This function implements the Insertion Sort algorithm
     to sort a list of elements in-place.
@@ -36,18 +46,29 @@ def insert_sort(array: list[float]) -> list[float]:
     This process continues until the entire list is sorted.
     Worst and average cases time complexity - O(n^2).
     Space complexity - O(1) as sorting is done in-place.
+    The sort is stable.
 
     Parameters
     ----------
     array : list
         The input list to be sorted.
 
+    key : Callable or None
+        The function of an element to sort by, computed once per element,
+        see `sort_keys.sort_by_key`. Default is None.
+
+    reverse : bool
+        Whether to sort in the descending order. Default is False.
+
     Returns
     -------
     list
         A list containing the elements of the input list in sorted order.
 
     """
+    if key is not None or reverse:
+        array[:] = sort_by_key(insert_sort, array, key, reverse)
+        return array
 
     for i in range(len(array)):
         k = i
@@ -58,7 +79,7 @@ def insert_sort(array: list[float]) -> list[float]:
 
 
 def bin_search_fl(array: list[float], value: float,
-                  start: int, end: int) -> int:
+                  start: int, end: int, right: bool = False) -> int:
     '''
     A binary search in the array slice consisting of floats.
 
@@ -79,6 +100,10 @@ def bin_search_fl(array: list[float], value: float,
     end: int
         An index pointing at the slice's right border inclusively.
 
+    right: bool
+        If False, the place before all the elements equal to the value is
+        returned, otherwise the place after them. Default is False.
+
     Returns
     -------
     int
@@ -86,6 +111,15 @@ def bin_search_fl(array: list[float], value: float,
 
     '''
 
+    if right:
+        while start < end:
+            mid = (start + end) // 2
+            if value < array[mid]:
+                end = mid
+            else:
+                start = mid + 1
+        return start
+
     while start < end:
         mid = (start + end) // 2
         if array[mid] < value:
@@ -95,7 +129,8 @@ def bin_search_fl(array: list[float], value: float,
     return start
 
 
-def insert_sort_opt(array: list[float]) -> list[float]:
+def insert_sort_opt(array: list[float], key: Callable | None = None,
+                    reverse: bool = False) -> list[float]:
     """
     This function implements the in-place Insertion sort algorithm
     enhanced by binary search.
@@ -103,22 +138,33 @@ def insert_sort_opt(array: list[float]) -> list[float]:
     Sorts a list of elements using the optimized Insertion Sort algorithm.
     This version uses binary search to find the correct position for each
     element, reducing the number of comparisons and improving efficiency.
+    Every element is put after the equal ones, so the sort is stable.
 
     Parameters
     ----------
     array : list
         The input list to be sorted.
 
+    key : Callable or None
+        The function of an element to sort by, computed once per element,
+        see `sort_keys.sort_by_key`. Default is None.
+
+    reverse : bool
+        Whether to sort in the descending order. Default is False.
+
     Returns
     -------
     list
         A list containing the elements of the input list in sorted order.
 
     """
+    if key is not None or reverse:
+        array[:] = sort_by_key(insert_sort_opt, array, key, reverse)
+        return array
 
     for i in range(1, len(array)):
         current_element = array[i]
-        correct_pos = bin_search_fl(array, current_element, 0, i)
+        correct_pos = bin_search_fl(array, current_element, 0, i, right=True)
 
         # Shift elements to make space for the current_element
         array[correct_pos + 1:i + 1] = array[correct_pos:i]
@@ -0,0 +1,389 @@
+"""
+K-Way Merge Module
+==================
+
+This module merges any number of sorted runs into one sorted stream.
+The runs may be lists, arrays, generators or files read by
+`external_sort.read_items`, since they are only iterated over.
+
+The merge is lazy: a loser tree (a tournament tree whose inner nodes keep
+the loser of the match played there) holds the current head of every
+run, the winner of the tournament is yielded and only the matches on
+the path from its leaf to the root are replayed for the next head of
+its run. That is exactly ceil(log2(k)) comparisons per item, where k -
+the number of runs, and O(k) memory. Equal items are yielded in the
+order of their runs, so the merge is stable.
+
+Runs which support len and indexing can be merged by several worker
+processes instead: the output is cut into equal ranges and the start of
+every range inside every run is found by co-ranking, a binary search
+over the runs, so every worker merges its own slices of the runs and
+the parts are simply concatenated.
+
+Functions
+---------
+loser_tree_merge(runs: list[Iterable], key: Callable | None = None,
+    reverse: bool = False) -> Generator
+    Lazily merge sorted iterables through a loser tree.
+
+co_rank(runs: list[Sequence], rank: int, key: Callable | None = None,
+    reverse: bool = False) -> list[int]
+    Find how many items of every run precede the item of the given rank.
+
+kway_merge(runs: list[Iterable], key: Callable | None = None,
+    reverse: bool = False, parallel: bool = False,
+    max_workers: int | None = None, pool: MergeSortPool | None = None)
+    -> Generator
+    Merge sorted runs lazily or in parallel.
+
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor as Pool
+from itertools import repeat
+from multiprocessing import cpu_count
+from typing import Callable, Generator, Iterable, Sequence
+
+
+from Algorithms.python_solutions.merge_sort import MergeSortPool
+
+
+def loser_tree_merge(runs: list[Iterable], key: Callable | None = None,
+                     reverse: bool = False) -> Generator:
+    """
+    Lazily merge sorted iterables through a loser tree.
+
+    The leaves of the tree are the runs, an inner node keeps the index of
+    the run which lost the match there and the overall winner is kept
+    apart. The key of every item is computed once, when the item becomes
+    the head of its run. An exhausted run loses every match.
+
+    Parameters
+    ----------
+    runs : list[Iterable]
+        Iterables sorted by the key in the order given by reverse.
+
+    key : Callable or None, optional
+        The function of an item to compare items by, None means the items
+        themselves. By default None.
+
+    reverse : bool, optional
+        Whether the runs are sorted in the descending order.
+        By default False.
+
+    Yields
+    ------
+    Any
+        The items of all runs in sorted order, equal items in the order
+        of their runs.
+
+    """
+    iterators = [iter(run) for run in runs]
+    size = len(iterators)
+    if size == 0:
+        return
+    if size == 1:
+        yield from iterators[0]
+        return
+
+    heads = [None] * size
+    keys = [None] * size
+    alive = [False] * size
+
+    def advance(run: int) -> None:
+        for item in iterators[run]:
+            heads[run] = item
+            keys[run] = item if key is None else key(item)
+            return
+        alive[run] = False
+
+    def beats(first: int, second: int) -> bool:
+        if not alive[second]:
+            return alive[first] or first < second
+        if not alive[first]:
+            return False
+        if reverse:
+            first_key, second_key = keys[second], keys[first]
+        else:
+            first_key, second_key = keys[first], keys[second]
+        if first_key < second_key:
+            return True
+        return first < second and not second_key < first_key
+
+    for run in range(size):
+        alive[run] = True
+        advance(run)
+
+    # nodes 1..size - 1 are inner, size..2 * size - 1 are the leaves
+    tree = [0] * size
+    winners = [0] * size + list(range(size))
+    for node in range(size - 1, 0, -1):
+        left, right = winners[2 * node], winners[2 * node + 1]
+        if beats(left, right):
+            winners[node], tree[node] = left, right
+        else:
+            winners[node], tree[node] = right, left
+    winner = winners[1]
+    del winners
+
+    while alive[winner]:
+        yield heads[winner]
+        advance(winner)
+        node = (winner + size) >> 1
+        while node:
+            if beats(tree[node], winner):
+                tree[node], winner = winner, tree[node]
+            node >>= 1
+
+
+def _search(run: Sequence, value, key: Callable | None, reverse: bool,
+            right: bool) -> int:
+    """
+    Find the place of the key inside a sorted run by binary search.
+
+    Parameters
+    ----------
+    run : Sequence
+        The sorted run.
+
+    value : Any
+        The key to search a place for.
+
+    key : Callable or None
+        The function of an item to compare items by.
+
+    reverse : bool
+        Whether the run is sorted in the descending order.
+
+    right : bool
+        If False, the place before all the items with keys equal to the
+        value is returned, otherwise the place after them.
+
+    Returns
+    -------
+    int
+        The number of items of the run preceding the place.
+
+    """
+    low, high = 0, len(run)
+    while low < high:
+        mid = (low + high) // 2
+        item_key = run[mid] if key is None else key(run[mid])
+        first, second = (value, item_key) if reverse else (item_key, value)
+        if (not second < first) if right else first < second:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def co_rank(runs: list[Sequence], rank: int, key: Callable | None = None,
+            reverse: bool = False) -> list[int]:
+    """
+    Find how many items of every run precede the item of the given rank.
+
+    The positions are consistent with the stable merge: merging the
+    prefixes run[:position] gives exactly the first rank items of the
+    merge of the whole runs. For every run the item with the rank is
+    searched by binary search over the positions of the run, the rank of
+    an item being found by binary searches in the other runs, which
+    costs O(k^2 * log(n)^2) comparisons, where k - the number of runs
+    and n - the length of the longest one.
+
+    Parameters
+    ----------
+    runs : list[Sequence]
+        Sorted runs supporting len and indexing.
+
+    rank : int
+        The number of items of the merge to split off.
+
+    key : Callable or None, optional
+        The function of an item to compare items by, None means the items
+        themselves. By default None.
+
+    reverse : bool, optional
+        Whether the runs are sorted in the descending order.
+        By default False.
+
+    Returns
+    -------
+    list[int]
+        The positions inside the runs, their sum equals rank clipped to
+        the total length of the runs.
+
+    Raises
+    ------
+    ValueError
+        Raised if no consistent positions are found, which is possible
+        for unsorted runs only.
+
+    """
+    lengths = [len(run) for run in runs]
+    if rank <= 0:
+        return [0] * len(runs)
+    if rank >= sum(lengths):
+        return lengths
+
+    def positions(run: int, index: int) -> list[int]:
+        # items of the previous runs equal to the item precede it,
+        # those of the next runs follow it
+        value = runs[run][index] if key is None else key(runs[run][index])
+        return [_search(other, value, key, reverse, right=number < run)
+                if number != run else index
+                for number, other in enumerate(runs)]
+
+    for run, length in enumerate(lengths):
+        low, high = 0, length
+        while low < high:
+            mid = (low + high) // 2
+            if sum(positions(run, mid)) < rank:
+                low = mid + 1
+            else:
+                high = mid
+        if low < length:
+            found = positions(run, low)
+            if sum(found) == rank:
+                return found
+    raise ValueError('runs are not sorted')
+
+
+def _merge_part(parts: list[Sequence], key: Callable | None,
+                reverse: bool) -> list:
+    """
+    Merge the slices of the runs inside a worker process.
+
+    Parameters
+    ----------
+    parts : list[Sequence]
+        Sorted slices of the runs.
+
+    key : Callable or None
+        The function of an item to compare items by.
+
+    reverse : bool
+        Whether the slices are sorted in the descending order.
+
+    Returns
+    -------
+    list
+        The merged items.
+
+    """
+    return list(loser_tree_merge(parts, key, reverse))
+
+
+def _parallel_merge(runs: list[Sequence], key: Callable | None,
+                    reverse: bool, max_workers: int | None,
+                    pool: MergeSortPool | None) -> Generator:
+    """
+    Generator-helper for kway_merge which merges ranges in parallel.
+
+    Parameters
+    ----------
+    runs : list[Sequence]
+        Sorted runs supporting len and indexing.
+
+    key : Callable or None
+        The function of an item to compare items by.
+
+    reverse : bool
+        Whether the runs are sorted in the descending order.
+
+    max_workers : int or None
+        The number of worker processes, None means cpu_count.
+
+    pool : MergeSortPool or None
+        A pool whose workers are used instead of a new one.
+
+    Yields
+    ------
+    Any
+        The items of all runs in sorted order.
+
+    """
+    if pool is not None:
+        executor, workers = pool.executor, pool.max_workers
+    else:
+        workers = max_workers if max_workers is not None else cpu_count()
+        executor = Pool(max_workers=workers)
+
+    try:
+        total = sum(len(run) for run in runs)
+        bounds = [co_rank(runs, total * part // workers, key, reverse)
+                  for part in range(workers + 1)]
+        slices = [[run[start:end] for run, start, end
+                   in zip(runs, bounds[part], bounds[part + 1])]
+                  for part in range(workers)]
+        for merged in executor.map(_merge_part, slices, repeat(key),
+                                   repeat(reverse)):
+            yield from merged
+    finally:
+        if pool is None:
+            executor.shutdown()
+
+
+def kway_merge(runs: list[Iterable], key: Callable | None = None,
+               reverse: bool = False, parallel: bool = False,
+               max_workers: int | None = None,
+               pool: MergeSortPool | None = None) -> Generator:
+    """
+    Merge sorted runs lazily or in parallel.
+
+    By default the runs are merged by `loser_tree_merge`, lazily and with
+    O(k) memory, so they may be iterators or files of any size. With
+    parallel=True the output is cut into max_workers ranges of equal
+    length, the starts of the ranges inside the runs are found by
+    `co_rank` and every worker process merges its slices of the runs.
+    The merged parts are yielded in order as soon as they are ready,
+    every part is held in memory then.
+
+    Parameters
+    ----------
+    runs : list[Iterable]
+        Iterables sorted by the key in the order given by reverse. They
+        have to support len and indexing for parallel=True.
+
+    key : Callable or None, optional
+        The function of an item to compare items by, None means the items
+        themselves. It has to be picklable for parallel=True, e.g.
+        a function defined at the top level of a module.
+        By default None.
+
+    reverse : bool, optional
+        Whether the runs are sorted in the descending order.
+        By default False.
+
+    parallel : bool, optional
+        Whether to merge in worker processes. By default False.
+
+    max_workers : int or None, optional
+        The number of worker processes for parallel=True, None means
+        cpu_count. By default None.
+
+    pool : MergeSortPool or None, optional
+        A pool whose long-lived workers are used for parallel=True
+        instead of starting new processes, max_workers is ignored then.
+        By default None.
+
+    Returns
+    -------
+    Generator
+        A generator of the items of all runs in sorted order, equal items
+        in the order of their runs.
+
+    Raises
+    ------
+    TypeError
+        Raised if parallel is True and a run does not support len
+        and indexing.
+
+    """
+    if not parallel:
+        return loser_tree_merge(runs, key, reverse)
+    runs = list(runs)
+    if not all(hasattr(run, '__getitem__') and hasattr(run, '__len__')
+               for run in runs):
+        raise TypeError('parallel merge needs runs supporting len ' +
+                        'and indexing')
+    return _parallel_merge(runs, key, reverse, max_workers, pool)
@@ -13,21 +13,54 @@ merge(array: list[float], part_one: list[float], part_two: list[float])
     -> None
     Merge two sorted arrays into a single sorted array.
 
-merge_sort(array: list[float], opt: bool = True, batch_size: int = 3)
-    -> list[float]
+merge_runs(target: list[float], source: list[float], start: int, mid: int,
+    end: int) -> None
+    Merge two adjacent sorted runs of one array into another array.
+
+merge_sort(array: list[float], opt: bool = True, batch_size: int = 3,
+    no_recursion: bool = False, adaptive: bool = False,
+    key: Callable | None = None, reverse: bool = False) -> list[float]
     Sort a list of elements using the Merge Sort algorithm.
     Optimised version (opt=True) calls Insertion Sort for small arrays.
+    The no_recursion version merges runs bottom-up with one scratch buffer.
+    The adaptive version merges natural runs of the input with galloping.
 
-merge_sort_parallel(array: list[float], batch_size=None, depth=0)
-    -> list[float]
+merge_argsort(array: list[float], key: Callable | None = None,
+    reverse: bool = False, **params) -> array
+    Find the stable permutation which sorts the array by merge sort.
+
+gallop(array: list[float], value: float, start: int, end: int,
+    right: bool = False) -> int
+    Find the place of the value inside a sorted slice by exponential search.
+
+gallop_merge(array: list[float], start: int, mid: int, end: int,
+    min_gallop: int = MIN_GALLOP) -> None
+    Merge two adjacent sorted runs in-place with galloping.
+
+merge_sort_parallel(array: list[float], batch_size=None, depth=0,
+    pool=None, shared_memory=False) -> list[float]
     Sort a list of elements with multiprocessing using the Merge Sort
-    algorithm.
+    algorithm. If a MergeSortPool is given, its long-lived workers are used.
 
 parallel_merge_sort(arr: list[float], batch_size=None, depth=0)
     -> list[float]
     Function-helper for merge_sort_parallel which handles recursion
     and multiprocessing.
 
+k_way_merge(array: list[float], parts: list[list[float]]) -> None
+    Merge any number of sorted arrays into a single sorted array.
+
+shared_memory_sort(arr, typecode=None, algorithm='merge', max_workers=None,
+    pool=None, pivot_str='random')
+    Sort an array of ints or floats in parallel through shared memory
+    blocks, so that no elements are pickled between processes.
+
+Classes
+-------
+MergeSortPool
+    A long-lived pool of worker processes which sorts an array by splitting
+    it into one chunk per worker and merging the sorted chunks once.
+
 Constants
 ---------
 MERGE_OPT: bool
@@ -40,17 +73,29 @@ MAX_DEPTH: int
     merge sort implementation will not call recursion any longer.
     Default is set to cpu_count.
 
+MIN_GALLOP: int
+    The number of consecutive elements taken from the same run after which
+    gallop_merge switches from one-by-one merging to galloping.
+
 """
 
+import heapq
 import logging
 
 
+from array import array as typed_array
 from multiprocessing import cpu_count
+from multiprocessing.shared_memory import SharedMemory
 from concurrent.futures import ProcessPoolExecutor as Pool
+from typing import Callable
+
+
+from Algorithms.python_solutions.sort_keys import argsort_by, sort_by_key
 
 
 try:
-    from Algorithms.python_solutions.insert_sort import insert_sort_opt
+    from Algorithms.python_solutions.insert_sort import \
+        bin_search_fl, insert_sort_opt
     MERGE_OPT = True
 except ImportError:
     logging.info('insert_sort_opt function cannot be imported, ' +
@@ -60,6 +105,8 @@ except ImportError:
 
 MAX_DEPTH = cpu_count()
 
+MIN_GALLOP = 7
+
 
 def merge(array: list[float], part_one: list[float],
           part_two: list[float]) -> None:
@@ -69,7 +116,8 @@ def merge(array: list[float], part_one: list[float],
     This function merges two sorted arrays, `part_one` and `part_two`, into
     a single sorted array. This is a helper for the Merge Sort function.
     Both space and time complexities are O(n), where n - the number of
-    elements inside two arrays combined.
+    elements inside two arrays combined. Equal elements of `part_one` go
+    first, so the merge is stable.
 
     Parameters
     ----------
@@ -94,7 +142,7 @@ def merge(array: list[float], part_one: list[float],
     index_for_part_two = 0
     index_for_array = 0
 
-    if part_one[-1] < part_two[0]:
+    if not part_two[0] < part_one[-1]:
         array[:len(part_one)] = part_one
         array[len(part_one):] = part_two
         return
@@ -102,16 +150,16 @@ def merge(array: list[float], part_one: list[float],
     while (index_for_part_one < length_part_one and
            index_for_part_two < length_part_two):
 
-        if (part_one[index_for_part_one] <
-                part_two[index_for_part_two]):
+        if (part_two[index_for_part_two] <
+                part_one[index_for_part_one]):
 
-            array[index_for_array] = part_one[index_for_part_one]
-            index_for_part_one += 1
+            array[index_for_array] = part_two[index_for_part_two]
+            index_for_part_two += 1
 
         else:
 
-            array[index_for_array] = part_two[index_for_part_two]
-            index_for_part_two += 1
+            array[index_for_array] = part_one[index_for_part_one]
+            index_for_part_one += 1
         index_for_array += 1
 
     while index_for_part_one < length_part_one:
@@ -125,8 +173,442 @@ def merge(array: list[float], part_one: list[float],
         index_for_array += 1
 
 
+def k_way_merge(array: list[float], parts: list[list[float]]) -> None:
+    """
+    Merge K Sorted Arrays
+
+    This function merges any number of sorted arrays into `array` in a
+    single pass, keeping the current head of every part inside a min-heap.
+    Time complexity is O(n*log(k)), where n - the number of elements inside
+    all the parts combined and k - the number of parts.
+
+    Parameters
+    ----------
+    array: list[float]
+        The resulting array, its length has to be equal to the number
+        of elements inside all the parts combined.
+
+    parts: list[list[float]]
+        Sorted arrays to be merged.
+
+    Returns
+    -------
+    None
+
+    """
+    parts = [part for part in parts if part]
+    if len(parts) == 1:
+        array[:] = parts[0]
+        return
+    array[:] = heapq.merge(*parts)
+
+
+def merge_runs(target: list[float], source: list[float],
+               start: int, mid: int, end: int) -> None:
+    """
+    Merge Two Adjacent Runs
+
+    This function merges two adjacent sorted runs `source[start:mid]` and
+    `source[mid:end]` into the same place `target[start:end]` of another
+    array of the same length. No temporary lists are created, which makes
+    it a helper for the bottom-up Merge Sort. Equal elements keep their
+    order, so the merge is stable. Time complexity is O(end - start).
+
+    Parameters
+    ----------
+    target: list[float]
+        The array receiving the merged run.
+
+    source: list[float]
+        The array holding both runs.
+
+    start: int
+        The starting index of the first run.
+
+    mid: int
+        The starting index of the second run.
+
+    end: int
+        The ending index (exclusive) of the second run.
+
+    Returns
+    -------
+    None
+
+    """
+    if mid >= end or not source[mid] < source[mid - 1]:
+        target[start:end] = source[start:end]
+        return
+
+    index_for_part_one = start
+    index_for_part_two = mid
+    index_for_target = start
+    # current heads of both runs are kept in locals to index source once
+    head_one = source[start]
+    head_two = source[mid]
+
+    while True:
+        if head_two < head_one:
+            target[index_for_target] = head_two
+            index_for_target += 1
+            index_for_part_two += 1
+            if index_for_part_two == end:
+                break
+            head_two = source[index_for_part_two]
+        else:
+            target[index_for_target] = head_one
+            index_for_target += 1
+            index_for_part_one += 1
+            if index_for_part_one == mid:
+                break
+            head_one = source[index_for_part_one]
+
+    # only one of the runs can have leftovers
+    if index_for_part_one < mid:
+        target[index_for_target:end] = source[index_for_part_one:mid]
+    else:
+        target[index_for_target:end] = source[index_for_part_two:end]
+
+
+def _merge_sort_bottom_up(array: list[float], opt: bool = MERGE_OPT,
+                          batch_size=3, scratch=None) -> list[float]:
+    """
+    Bottom-up Merge Sort
+
+    This function sorts the array without recursion: runs of batch_size
+    elements are sorted by insertion sort (or runs of one element are
+    taken if opt is False) and then runs of doubling width are merged by
+    `merge_runs`, ping-ponging between the array and a single scratch
+    buffer of the same length. Only indexing and slice assignment are
+    used, so the array and the scratch buffer may be memoryviews of
+    shared memory, which are sorted without copying them into lists.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input list to be sorted.
+
+    opt: bool
+        A switch between starting from insertion-sorted runs of
+        batch_size elements and starting from single elements.
+
+    batch_size: int
+        The width of the initial runs, if opt is True.
+
+    scratch: list[float], memoryview or None
+        A buffer of the same length and type as the array to merge into,
+        None means a new list. Default is None.
+
+    Returns
+    -------
+    list[float]
+        The same list with its elements in sorted order.
+
+    """
+    length_array = len(array)
+    if length_array <= 1:
+        return array
+
+    width = 1
+    if opt and batch_size > 1:
+        width = batch_size
+        for start in range(0, length_array, width):
+            array[start:start + width] = \
+                insert_sort_opt(array[start:start + width])
+
+    source = array
+    target = [None] * length_array if scratch is None else scratch
+    while width < length_array:
+        for start in range(0, length_array, 2 * width):
+            merge_runs(target, source, start,
+                       min(start + width, length_array),
+                       min(start + 2 * width, length_array))
+        source, target = target, source
+        width *= 2
+
+    if source is not array:
+        array[:] = source
+    return array
+
+
+def gallop(array: list[float], value: float, start: int, end: int,
+           right: bool = False) -> int:
+    """
+    Galloping Search
+
+    This function finds the place of the value inside the sorted slice
+    `array[start:end]` by exponential search: it probes start, start + 1,
+    start + 3, start + 7 and so on until the value is bracketed and then
+    runs binary search inside the bracket only. Thus it needs
+    O(log(k)) comparisons, where k - the distance from start to the found
+    place, which beats binary search when the place is close to start.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array to search in.
+
+    value: float
+        The value to search a place for.
+
+    start: int
+        The starting index of the sorted slice.
+
+    end: int
+        The ending index (exclusive) of the sorted slice.
+
+    right: bool
+        If False, the place before all the elements equal to the value is
+        returned, otherwise the place after them. Default is False.
+
+    Returns
+    -------
+    int
+        An index pointing to the place where the value should land.
+
+    """
+    low = start
+    high = start
+    step = 1
+    while high < end and (array[high] < value or
+                          (right and not value < array[high])):
+        low = high + 1
+        high = start + step
+        step = 2 * step + 1
+    high = min(high, end)
+    return bin_search_fl(array, value, low, high, right)
+
+
+def gallop_merge(array: list[float], start: int, mid: int, end: int,
+                 min_gallop: int = MIN_GALLOP) -> None:
+    """
+    Merge Two Adjacent Runs with Galloping
+
+    This function merges the sorted runs `array[start:mid]` and
+    `array[mid:end]` in-place, copying only the first run aside.
+    Elements of the first run not greater than the head of the second run
+    and elements of the second run not less than the tail of the first
+    run are already in place and are cut off by `gallop` beforehand.
+    Then elements are merged one by one until one of the runs wins
+    min_gallop times in a row, after which whole blocks of elements are
+    found by `gallop` and moved by slice assignment, until the blocks
+    become shorter than min_gallop again. The merge is stable and needs
+    O(log) comparisons for runs which barely overlap.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array holding both runs.
+
+    start: int
+        The starting index of the first run.
+
+    mid: int
+        The starting index of the second run.
+
+    end: int
+        The ending index (exclusive) of the second run.
+
+    min_gallop: int
+        The number of consecutive wins of one run which switches
+        merging to galloping. Default is MIN_GALLOP.
+
+    Returns
+    -------
+    None
+
+    """
+    start = gallop(array, array[mid], start, mid, right=True)
+    if start == mid:
+        return
+    end = gallop(array, array[mid - 1], mid, end)
+
+    left = array[start:mid]
+    length_left = mid - start
+    index_for_left = 0
+    index_for_right = mid
+    index_for_array = start
+
+    while index_for_left < length_left and index_for_right < end:
+
+        # one by one merging until one of the runs keeps winning
+        count_left = count_right = 0
+        while (index_for_left < length_left and index_for_right < end and
+               count_left < min_gallop and count_right < min_gallop):
+            if array[index_for_right] < left[index_for_left]:
+                array[index_for_array] = array[index_for_right]
+                index_for_right += 1
+                count_right += 1
+                count_left = 0
+            else:
+                array[index_for_array] = left[index_for_left]
+                index_for_left += 1
+                count_left += 1
+                count_right = 0
+            index_for_array += 1
+
+        # galloping while the moved blocks are long enough
+        while index_for_left < length_left and index_for_right < end:
+            next_left = gallop(left, array[index_for_right],
+                               index_for_left, length_left, right=True)
+            moved_left = next_left - index_for_left
+            array[index_for_array:index_for_array + moved_left] = \
+                left[index_for_left:next_left]
+            index_for_array += moved_left
+            index_for_left = next_left
+            if index_for_left == length_left:
+                break
+
+            next_right = gallop(array, left[index_for_left],
+                                index_for_right, end)
+            moved_right = next_right - index_for_right
+            array[index_for_array:index_for_array + moved_right] = \
+                array[index_for_right:next_right]
+            index_for_array += moved_right
+            index_for_right = next_right
+
+            if moved_left < min_gallop and moved_right < min_gallop:
+                break
+
+    # leftovers of the second run are in place already
+    array[index_for_array:index_for_array + length_left - index_for_left] = \
+        left[index_for_left:]
+
+
+def _min_run(length: int) -> int:
+    """
+    Calculate the minimal length of a natural run.
+
+    The result lies between 32 and 64, so that the number of runs of
+    a random array is a power of two or slightly less, which keeps
+    the merges balanced.
+
+    Parameters
+    ----------
+    length: int
+        The length of the array to be sorted.
+
+    Returns
+    -------
+    int
+        The minimal length of a run.
+
+    """
+    remainder = 0
+    while length >= 64:
+        remainder |= length & 1
+        length >>= 1
+    return length + remainder
+
+
+def _count_run(array: list[float], start: int, end: int) -> int:
+    """
+    Find the end of the natural run beginning at start.
+
+    A run is either non-descending or strictly descending, the latter is
+    reversed in-place, which cannot break stability.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array to search runs in.
+
+    start: int
+        The starting index of the run.
+
+    end: int
+        The ending index (exclusive) of the slice to search in.
+
+    Returns
+    -------
+    int
+        The ending index (exclusive) of the run.
+
+    """
+    run_end = start + 1
+    if run_end == end:
+        return run_end
+
+    if array[run_end] < array[start]:
+        while run_end < end and array[run_end] < array[run_end - 1]:
+            run_end += 1
+        array[start:run_end] = array[start:run_end][::-1]
+    else:
+        while run_end < end and not array[run_end] < array[run_end - 1]:
+            run_end += 1
+    return run_end
+
+
+def _merge_sort_natural(array: list[float]) -> list[float]:
+    """
+    Natural Merge Sort
+
+    This function finds natural runs of the array, extends the runs
+    shorter than `_min_run` by insertion sort and pushes them on a stack,
+    merging the topmost runs by `gallop_merge` whenever the lengths on
+    the stack stop decreasing faster than Fibonacci numbers. The invariant
+    keeps the merges balanced and the stack short.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input list to be sorted.
+
+    Returns
+    -------
+    list[float]
+        The same list with its elements in sorted order.
+
+    """
+    length_array = len(array)
+    if length_array <= 1:
+        return array
+
+    min_run = _min_run(length_array)
+    runs = []
+
+    def merge_at(i):
+        run_start, run_length = runs[i]
+        next_start, next_length = runs[i + 1]
+        gallop_merge(array, run_start, next_start, next_start + next_length)
+        runs[i] = (run_start, run_length + next_length)
+        del runs[i + 1]
+
+    start = 0
+    while start < length_array:
+        end = _count_run(array, start, length_array)
+        if end - start < min_run:
+            end = min(start + min_run, length_array)
+            array[start:end] = insert_sort_opt(array[start:end])
+        runs.append((start, end - start))
+        start = end
+
+        # restore the invariant for the lengths A, B, C of the topmost
+        # runs: A > B + C and B > C
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) \
+                    or (n > 1 and
+                        runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            merge_at(n)
+
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        merge_at(n)
+
+    return array
+
+
 def merge_sort(array: list[float], opt: bool = MERGE_OPT,
-               batch_size=3) -> list[float]:
+               batch_size=3, no_recursion: bool = False,
+               adaptive: bool = False, key: Callable | None = None,
+               reverse: bool = False) -> list[float]:
     '''
     Merge Sort
 
@@ -138,6 +620,14 @@ def merge_sort(array: list[float], opt: bool = MERGE_OPT,
     two sorted halves into one sorted list.
     Time Complexity is O(n*log(n)), space complexity - O(n).
     Space is used for storing divided subarrays during sorting.
+    The no_recursion version works bottom-up instead: it merges runs of
+    doubling width back and forth between the array and one scratch
+    buffer, so exactly n extra slots are used and no subarrays are
+    sliced.
+    The adaptive version finds already sorted (or strictly descending)
+    runs inside the input and merges them with galloping, so nearly
+    sorted input is sorted in close to O(n) time.
+    All the versions are stable.
 
     Parameters
     ----------
@@ -153,15 +643,50 @@ def merge_sort(array: list[float], opt: bool = MERGE_OPT,
         binary search optimized insertion sort, if opt is True.
         Default, tuned for the best performance, value is 3.
 
+    no_recursion: bool
+        Switcher between recursive and bottom-up non-recursive algorithms.
+        Default is False.
+
+    adaptive: bool
+        Switcher to the natural merge sort with galloping merges, it
+        requires opt to be True. Default is False.
+
+    key: Callable or None
+        The function of an element to sort by, computed once per element,
+        see `sort_keys.sort_by_key`. Default is None.
+
+    reverse: bool
+        Whether to sort in the descending order. Default is False.
+
     Returns
     -------
     list[float]
         A new list containing the elements of the input list
         in sorted order.
+
+    Raises
+    ------
+    AttributeError
+        Raised if adaptive is True while opt is False.
     '''
+    if key is not None or reverse:
+        array[:] = sort_by_key(merge_sort, array, key, reverse, opt=opt,
+                               batch_size=batch_size,
+                               no_recursion=no_recursion, adaptive=adaptive)
+        return array
+
+    if adaptive:
+        if not opt:
+            raise AttributeError('adaptive merge sort without insertion' +
+                                 ' sort is not available')
+        return _merge_sort_natural(array)
+
+    if no_recursion:
+        return _merge_sort_bottom_up(array, opt=opt, batch_size=batch_size)
+
     length_array = len(array)
 
-    if (length_array == 1):
+    if length_array <= 1:
         return array
 
     if opt and length_array <= batch_size:
@@ -179,6 +704,45 @@ def merge_sort(array: list[float], opt: bool = MERGE_OPT,
     return array
 
 
+def merge_argsort(array: list[float], key: Callable | None = None,
+                  reverse: bool = False, **params) -> typed_array:
+    '''
+    Find the stable permutation which sorts the array by merge sort.
+
+    The (key, position) pairs of `sort_keys.decorate` are sorted and
+    their positions are returned, the array itself is not changed, so
+    parallel columns can be reordered by `sort_keys.reorder`.
+
+    Parameters
+    ----------
+    array: list[float]
+        The elements to sort by.
+
+    key: Callable or None
+        The function of an element to sort by, computed once per element.
+        Default is None.
+
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    **params: dict
+        Other keyword parameters of `merge_sort`: opt, batch_size,
+        no_recursion and adaptive.
+
+    Returns
+    -------
+    array
+        array('q') of positions, array[i] for i in it go in sorted order
+        and equal elements keep their order.
+
+    Raises
+    ------
+    AttributeError
+        Raised if adaptive is True while opt is False.
+    '''
+    return argsort_by(merge_sort, array, key, reverse, **params)
+
+
 def parallel_merge_sort(arr: list[float],
                         batch_size=None, depth=0) -> list[float]:
 
@@ -216,13 +780,442 @@ def parallel_merge_sort(arr: list[float],
         return arr
 
 
+class MergeSortPool:
+    """
+    A long-lived pool of worker processes for parallel merge sort.
+
+    Unlike `parallel_merge_sort`, which opens a new process pool on every
+    recursion level, this class starts its workers once and reuses them
+    for every call of `sort`. The input is split into one chunk per worker,
+    each chunk is sorted by `merge_sort` inside a worker and the sorted
+    chunks are merged once by `k_way_merge`. Thus every element is pickled
+    only twice per sort: on the way to a worker and on the way back.
+    The pool has to be closed explicitly by `close` or used as a context
+    manager.
+
+    Attributes
+    ----------
+    max_workers : int or None, optional
+        The number of worker processes, by default None, which
+        translates to cpu_count.
+
+    batch_size : int, optional
+        Arrays not longer than batch_size are sorted inside the calling
+        process, since sending them to workers costs more than sorting.
+        By default 1000.
+
+    Methods
+    -------
+    __init__(self, max_workers: int | None = None,
+             batch_size: int = 1000) -> None
+        Start the worker processes.
+
+    executor(self) -> ProcessPoolExecutor
+        Property. The underlying executor, for other parallel sorts to
+        share the workers.
+
+    sort(self, array: list[float]) -> list[float]
+        Sort the array in-place using the workers of the pool.
+
+    close(self) -> None
+        Shut down the worker processes.
+
+    __enter__(self) -> MergeSortPool
+        Return the pool itself for usage inside the with statement.
+
+    __exit__(self, *args) -> None
+        Close the pool on exit from the with statement.
+
+    """
+
+    def __init__(self, max_workers: int | None = None,
+                 batch_size: int = 1000) -> None:
+        """
+        Initialize a new MergeSortPool instance and start its workers.
+
+        Parameters
+        ----------
+        max_workers : int or None, optional
+            The number of worker processes, by default None, which
+            translates to cpu_count.
+
+        batch_size : int, optional
+            Arrays not longer than batch_size are sorted inside the
+            calling process. By default 1000.
+
+        Returns
+        -------
+        None
+
+        """
+        self.max_workers = max_workers if max_workers is not None \
+            else cpu_count()
+        self.batch_size = batch_size
+        self._executor = Pool(max_workers=self.max_workers)
+
+    @property
+    def executor(self) -> Pool:
+        """
+        Get the underlying executor, so that other parallel sorts can
+        submit their tasks to the same workers.
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            The executor of the pool.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the pool has already been closed.
+
+        """
+        if self._executor is None:
+            raise RuntimeError('cannot sort with a closed MergeSortPool')
+        return self._executor
+
+    def sort(self, array: list[float]) -> list[float]:
+        """
+        Sort the array in-place using the workers of the pool.
+
+        Parameters
+        ----------
+        array : list[float]
+            The input list to be sorted.
+
+        Returns
+        -------
+        list[float]
+            The same list with its elements in sorted order.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if the pool has already been closed.
+
+        """
+        executor = self.executor
+
+        length = len(array)
+        if length <= 1:
+            return array
+        if length <= self.batch_size:
+            return merge_sort(array)
+
+        chunk_size = -(-length // self.max_workers)
+        chunks = [array[i:i + chunk_size]
+                  for i in range(0, length, chunk_size)]
+        k_way_merge(array, list(executor.map(merge_sort, chunks)))
+        return array
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes. Calling it twice is harmless.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'MergeSortPool':
+        """
+        Return the pool itself for usage inside the with statement.
+
+        Returns
+        -------
+        MergeSortPool
+            The pool itself.
+
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Close the pool on exit from the with statement.
+
+        Returns
+        -------
+        None
+
+        """
+        self.close()
+
+
+def _attach_shared(name: str, typecode: str) -> tuple:
+    """
+    Attach to an existing shared memory block inside a worker process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+
+    typecode : str
+        The typecode of the elements stored inside the block.
+
+    Returns
+    -------
+    tuple
+        The SharedMemory object and a memoryview of the block cast to
+        the typecode. The view has to be released before the block is
+        closed.
+
+    """
+    shm = SharedMemory(name=name)
+    return shm, shm.buf.cast(typecode)
+
+
+def _shared_sort_slice(name: str, scratch_name: str, typecode: str,
+                       start: int, end: int, algorithm: str = 'merge',
+                       pivot_str: str = 'random') -> None:
+    """
+    Sort a slice of a shared memory block in-place in a worker process.
+
+    Only the names of the blocks and the edges of the slice are pickled.
+    The slice is sorted directly inside the shared memory through
+    a memoryview: quick sort swaps its elements in place, bottom-up merge
+    sort merges its runs back and forth between the slice and the same
+    slice of the scratch block, so no copy of the slice is made.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block.
+
+    scratch_name : str
+        The name of the shared memory block of the same size used as
+        the merge buffer.
+
+    typecode : str
+        The typecode of the elements stored inside the block.
+
+    start : int
+        The starting index of the slice.
+
+    end : int
+        The ending index (exclusive) of the slice.
+
+    algorithm : 'merge' or 'quick', optional
+        The sort applied to the slice, by default 'merge'.
+
+    pivot_str : str, optional
+        A strategy to choose pivot element for quick sort,
+        by default 'random'.
+
+    Returns
+    -------
+    None
+
+    """
+    shm, view = _attach_shared(name, typecode)
+    scratch_shm, scratch = _attach_shared(scratch_name, typecode)
+    try:
+        if algorithm == 'quick':
+            from Algorithms.python_solutions.quick_sort import _quick_sort
+            # median of medians is available in the recursive version only
+            _quick_sort(view, start, end, pivot_str=pivot_str,
+                        no_recursion=pivot_str != 'mm')
+        else:
+            part, scratch_part = view[start:end], scratch[start:end]
+            _merge_sort_bottom_up(part, scratch=scratch_part)
+            part.release()
+            scratch_part.release()
+    finally:
+        view.release()
+        scratch.release()
+        shm.close()
+        scratch_shm.close()
+
+
+def _shared_merge_runs(src_name: str, dst_name: str, typecode: str,
+                       start: int, mid: int, end: int) -> None:
+    """
+    Merge two adjacent sorted runs of one shared memory block into the
+    same place of another shared memory block in a worker process.
+
+    The runs are merged by `merge_runs` directly between memoryviews of
+    the blocks, no element is copied into a list.
+
+    Parameters
+    ----------
+    src_name : str
+        The name of the shared memory block holding the runs.
+
+    dst_name : str
+        The name of the shared memory block receiving the merged run.
+
+    typecode : str
+        The typecode of the elements stored inside the blocks.
+
+    start : int
+        The starting index of the first run.
+
+    mid : int
+        The starting index of the second run.
+
+    end : int
+        The ending index (exclusive) of the second run.
+
+    Returns
+    -------
+    None
+
+    """
+    src_shm, src = _attach_shared(src_name, typecode)
+    dst_shm, dst = _attach_shared(dst_name, typecode)
+    try:
+        merge_runs(dst, src, start, mid, end)
+    finally:
+        src.release()
+        dst.release()
+        src_shm.close()
+        dst_shm.close()
+
+
+def shared_memory_sort(arr, typecode: str | None = None,
+                       algorithm: str = 'merge',
+                       max_workers: int | None = None,
+                       pool: MergeSortPool | None = None,
+                       pivot_str: str = 'random'):
+    """
+    Parallel sort of numeric arrays through shared memory
+
+    This function copies the input once into a
+    `multiprocessing.shared_memory` block, lets the workers sort disjoint
+    slices of it in-place (the second block serves as the merge buffer)
+    and then merges the sorted slices pairwise,
+    with every merge pass running in parallel between two shared blocks.
+    No part of the array is pickled in either direction, only names of the
+    blocks and edges of the slices are sent to the workers, so the extra
+    memory is two blocks of the input's size.
+    Time complexity is O(n*log(n)), with O(n*log(p)) of it spent on
+    log2(p) merge passes, where p - the number of workers.
+
+    Parameters
+    ----------
+    arr: list[float], array.array or memoryview
+        The input to be sorted in-place. It has to consist of numbers
+        representable by the typecode.
+
+    typecode: str or None
+        The typecode of the shared buffer, 'd' for doubles and 'q' for
+        64-bit integers. Default is None, which translates to the typecode
+        of array.array or memoryview inputs, to 'q' for lists of integers
+        and to 'd' for other lists.
+
+    algorithm: 'merge' or 'quick'
+        The sort applied by the workers to their slices. Default is 'merge'.
+
+    max_workers: int or None
+        The number of worker processes to start if pool is not provided.
+        Default is None, which translates to cpu_count.
+
+    pool: MergeSortPool or None
+        A long-lived pool whose workers are used instead of starting new
+        ones. Default is None.
+
+    pivot_str: str
+        A strategy to choose pivot element for quick sort.
+        Default is 'random'.
+
+    Returns
+    -------
+    list[float], array.array or memoryview
+        The same input with its elements in sorted order.
+
+    Raises
+    ------
+    ValueError
+        Raised if the algorithm option cannot be parsed.
+
+    """
+    if algorithm not in ('merge', 'quick'):
+        raise ValueError('Cannot parse algorithm option')
+
+    length = len(arr)
+    if length <= 1:
+        return arr
+
+    if typecode is None:
+        if isinstance(arr, memoryview):
+            typecode = arr.format
+        elif isinstance(arr, typed_array):
+            typecode = arr.typecode
+        else:
+            typecode = 'q' if all(isinstance(i, int) for i in arr) else 'd'
+
+    if pool is not None:
+        executor, workers = pool.executor, pool.max_workers
+    else:
+        workers = max_workers if max_workers is not None else cpu_count()
+        executor = Pool(max_workers=workers)
+
+    itemsize = typed_array(typecode).itemsize
+    src_shm = SharedMemory(create=True, size=length * itemsize)
+    dst_shm = SharedMemory(create=True, size=length * itemsize)
+    src = src_shm.buf[:length * itemsize].cast(typecode)
+    dst = dst_shm.buf[:length * itemsize].cast(typecode)
+    try:
+        src[:] = typed_array(typecode, arr) if isinstance(arr, list) \
+            else arr
+
+        chunk_size = -(-length // workers)
+        edges = list(range(0, length, chunk_size)) + [length]
+        jobs = [executor.submit(_shared_sort_slice, src_shm.name,
+                                dst_shm.name, typecode, edges[i],
+                                edges[i + 1], algorithm, pivot_str)
+                for i in range(len(edges) - 1)]
+        for job in jobs:
+            job.result()
+
+        # merge passes ping-pong between the two shared blocks
+        while len(edges) > 2:
+            jobs = []
+            for i in range(0, len(edges) - 2, 2):
+                jobs.append(executor.submit(
+                    _shared_merge_runs, src_shm.name, dst_shm.name,
+                    typecode, edges[i], edges[i + 1], edges[i + 2]))
+            if len(edges) % 2 == 0:
+                # odd number of runs, the last one has no pair
+                dst[edges[-2]:] = src[edges[-2]:]
+            for job in jobs:
+                job.result()
+            edges = edges[::2] + ([length] if len(edges) % 2 == 0 else [])
+            src, dst = dst, src
+            src_shm, dst_shm = dst_shm, src_shm
+
+        if isinstance(arr, list):
+            arr[:] = src.tolist()
+        else:
+            memoryview(arr).cast('B')[:] = src.cast('B')
+    finally:
+        src.release()
+        dst.release()
+        for shm in (src_shm, dst_shm):
+            shm.close()
+            shm.unlink()
+        if pool is None:
+            executor.shutdown()
+    return arr
+
+
 def merge_sort_parallel(array: list[float],
-                        batch_size=None, depth=0) -> list[float]:
+                        batch_size=None, depth=0,
+                        pool: MergeSortPool | None = None,
+                        shared_memory: bool = False) -> list[float]:
     '''
     Parallel Merge Sort using dynamic ThreadPoolExecutor
 
     This function implements the Merge Sort algorithm in parallel
-    to sort a list of elements.
+    to sort a list of elements. If a MergeSortPool is provided,
+    the array is sorted by its long-lived workers in one
+    split-sort-merge round instead of recursive process pools.
+    For numeric inputs shared_memory=True avoids pickling the array
+    altogether, see `shared_memory_sort`.
 
     Parameters
     ----------
@@ -239,10 +1232,23 @@ def merge_sort_parallel(array: list[float],
         Recursion depth control parameter, used for avoiding overheading.
         Default is 4. If set to None will translate to the number of cores.
 
+    pool: MergeSortPool or None
+        A long-lived pool to sort with, batch_size and depth are ignored
+        if it is given. The pool is not closed after sorting, so that
+        it can be reused by the following calls. Default is None.
+
+    shared_memory: bool
+        Switcher to sorting through shared memory blocks, which is
+        available for arrays of ints or floats only. Default is False.
+
     Returns
     -------
     list[float]
         A new list containing the elements of the input list in sorted order.
 
     '''
+    if shared_memory:
+        return shared_memory_sort(array, algorithm='merge', pool=pool)
+    if pool is not None:
+        return pool.sort(array)
     return parallel_merge_sort(array, batch_size=batch_size, depth=depth)
@@ -8,13 +8,32 @@ a pivot value, divides the input array, and sorts the resulting parts.
 
 Functions
 ---------
-quick_sort(array: list[float], pivot_str: str = 'random') -> list[float]
+quick_sort(array: list[float], pivot_str: str = 'random',
+    no_recursion: bool = False, shared_memory: bool = False,
+    max_workers: int | None = None, partition: str = 'two_pass',
+    key: Callable | None = None, reverse: bool = False) -> list[float]
     Sorts a list of elements using the Quick Sort algorithm.
 
+quick_argsort(array: list[float], key: Callable | None = None,
+    reverse: bool = False, **params) -> array
+    Finds the stable permutation which sorts the array by quick sort.
+
 split(a: list[float], pivot: float, left_edge: int, right_edge: int) ->
     tuple
     Divides the input array into two parts relative to the pivot value.
 
+split_3way(a: list[float], pivot: float, left_edge: int, right_edge: int)
+    -> tuple
+    Divides the input array into three parts relative to the pivot value
+    in a single pass.
+
+split_dual_pivot(a: list[float], left_edge: int, right_edge: int) -> tuple
+    Divides the input array into three parts relative to two pivots.
+
+dual_pivot_sort(array: list[float], left_edge: int, right_edge: int,
+    no_recursion: bool = False) -> list[float]
+    Sorts a part of the array by dual-pivot quick sort.
+
 avg(a: list[float], left_edge: int, right_edge: int) -> float
     Calculates the average value of elements in a specified range.
 
@@ -41,6 +60,23 @@ median_of_three(array: list[float], left: int, right: int) -> float
     Finds the median of three elements in a given array within specified
     indices.
 
+intro_sort(array: list[float], left_edge: int, right_edge: int,
+    no_recursion: bool = False, cutoff: int = INTRO_CUTOFF) -> list[float]
+    Sorts a part of the array by quick sort which switches to heap sort
+    once the recursion becomes too deep and to insertion sort for small
+    parts.
+
+lazy_sorted(iterable: Iterable[float], cutoff: int = INTRO_CUTOFF)
+    -> Generator
+    Yields the elements in ascending order, sorting only as much as
+    the consumer takes.
+
+Constants
+---------
+INTRO_CUTOFF: int
+    Parts of the array not longer than this are sorted by insertion sort
+    inside the intro sort.
+
 """
 
 
@@ -48,6 +84,19 @@ import logging
 import random
 
 
+from array import array as typed_array
+from typing import Callable, Generator, Iterable
+
+
+from Algorithms.python_solutions.heap import heap_sort_range
+from Algorithms.python_solutions.merge_sort import shared_memory_sort
+from Algorithms.python_solutions.sort_keys import argsort_by, sort_by_key
+
+
+# tuned on random, sorted, reversed, few-unique and organ-pipe arrays
+INTRO_CUTOFF = 32
+
+
 def split(a: list[float], pivot: float, left_edge: int, right_edge: int) \
         -> tuple[int, int]:
     """
@@ -92,6 +141,122 @@ def split(a: list[float], pivot: float, left_edge: int, right_edge: int) \
     return new_left_edge, new_right_edge
 
 
+def split_3way(a: list[float], pivot: float, left_edge: int,
+               right_edge: int) -> tuple[int, int]:
+    """
+    Three-Way Split Function
+
+    Divide the input array into three parts relative to the pivot value
+    in a single pass (Dutch national flag partitioning). Elements less
+    than pivot are moved to the left, greater ones to the right and
+    equal ones stay in the middle. Elements are compared only by `<`.
+
+    Parameters
+    ----------
+    a: list[float]
+        The input list to be split.
+
+    pivot: float
+        The pivot value used for splitting the array.
+
+    left_edge: int
+        The starting index for the split operation.
+
+    right_edge: int
+        The ending index (exclusive) for the split operation.
+
+    Returns
+    -------
+    tuple
+        A tuple containing two indices that represent the
+        new boundaries for the split parts, the same as `split` returns.
+
+    """
+    less_end = left_edge
+    greater_start = right_edge
+    i = left_edge
+    while i < greater_start:
+        element = a[i]
+        if element < pivot:
+            a[i] = a[less_end]
+            a[less_end] = element
+            less_end += 1
+            i += 1
+        elif pivot < element:
+            greater_start -= 1
+            a[i] = a[greater_start]
+            a[greater_start] = element
+        else:
+            i += 1
+    return less_end, greater_start
+
+
+def split_dual_pivot(a: list[float], left_edge: int,
+                     right_edge: int) -> tuple[int, int]:
+    """
+    Dual-Pivot Split Function
+
+    Divide the input array into three parts relative to two pivots,
+    the first and the last elements of the range (Yaroslavskiy
+    partitioning): elements less than the smaller pivot, elements
+    between the pivots and elements greater than the bigger pivot.
+    The pivots are put between the parts. Elements are compared
+    only by `<`.
+
+    Parameters
+    ----------
+    a: list[float]
+        The input list to be split, the range has to contain at least
+        two elements.
+
+    left_edge: int
+        The starting index for the split operation.
+
+    right_edge: int
+        The ending index (exclusive) for the split operation.
+
+    Returns
+    -------
+    tuple
+        A tuple containing the final indices of the smaller and the
+        bigger pivots.
+
+    """
+    last = right_edge - 1
+    if a[last] < a[left_edge]:
+        a[left_edge], a[last] = a[last], a[left_edge]
+    small_pivot = a[left_edge]
+    big_pivot = a[last]
+
+    less_end = left_edge + 1
+    greater_start = last - 1
+    i = less_end
+    while i <= greater_start:
+        element = a[i]
+        if element < small_pivot:
+            a[i] = a[less_end]
+            a[less_end] = element
+            less_end += 1
+        elif big_pivot < element:
+            while big_pivot < a[greater_start] and i < greater_start:
+                greater_start -= 1
+            a[i] = a[greater_start]
+            a[greater_start] = element
+            greater_start -= 1
+            element = a[i]
+            if element < small_pivot:
+                a[i] = a[less_end]
+                a[less_end] = element
+                less_end += 1
+        i += 1
+
+    less_end -= 1
+    greater_start += 1
+    a[left_edge], a[less_end] = a[less_end], a[left_edge]
+    a[last], a[greater_start] = a[greater_start], a[last]
+    return less_end, greater_start
+
+
 def clst_avg(a: list[float], left_edge: int, right_edge: int) -> float:
     '''
     Calculate the average value of elements in a specified range.
@@ -230,8 +395,146 @@ def median_of_three(array: list[float], left: int, right: int) -> float:
     return array[mid]
 
 
+def intro_sort(array: list[float], left_edge: int, right_edge: int,
+               no_recursion: bool = False,
+               cutoff: int = INTRO_CUTOFF) -> list[float]:
+    """
+    Intro Sort Function
+
+    Sort the part of the array by quick sort with median of three pivot,
+    tracking the depth of the partitioning. Once the depth exceeds
+    2 * log2(n), the current part is sorted by the in-place heap sort,
+    which caps the time complexity at O(n * log n) for any input, and
+    parts not longer than cutoff are sorted by insertion sort.
+    The depth of the recursion is also capped at 2 * log2(n), so the
+    recursion limit can never be hit.
+
+    Parameters
+    ----------
+    array: list
+        The input list to be sorted.
+
+    left_edge: int
+        The starting index for the sort operation.
+
+    right_edge: int
+        The ending index (exclusive) for the sort operation.
+
+    no_recursion: bool
+        Switcher between recursive and non-recursive algorithms.
+
+    cutoff: int
+        The length of parts sorted by insertion sort. Default is
+        INTRO_CUTOFF.
+
+    Returns
+    -------
+    list
+        The input list with the part sorted.
+
+    """
+    length = right_edge - left_edge
+    depth_limit = 2 * length.bit_length()
+
+    if no_recursion:
+        stack = [(left_edge, right_edge, depth_limit)]
+        while stack:
+            left_edge, right_edge, depth = stack.pop()
+            if right_edge - left_edge <= cutoff:
+                if right_edge - left_edge > 1:
+                    partition_small(array, left_edge, right_edge)
+                continue
+            if depth == 0:
+                heap_sort_range(array, left_edge, right_edge)
+                continue
+            pivot = median_of_three(array, left_edge, right_edge - 1)
+            new_left_edge, new_right_edge = \
+                split(array, pivot, left_edge, right_edge)
+            stack.append((left_edge, new_left_edge, depth - 1))
+            stack.append((new_right_edge, right_edge, depth - 1))
+        return array
+
+    def _intro_sort(left_edge, right_edge, depth):
+        if right_edge - left_edge <= cutoff:
+            if right_edge - left_edge > 1:
+                partition_small(array, left_edge, right_edge)
+            return
+        if depth == 0:
+            heap_sort_range(array, left_edge, right_edge)
+            return
+        pivot = median_of_three(array, left_edge, right_edge - 1)
+        new_left_edge, new_right_edge = \
+            split(array, pivot, left_edge, right_edge)
+        _intro_sort(left_edge, new_left_edge, depth - 1)
+        _intro_sort(new_right_edge, right_edge, depth - 1)
+
+    _intro_sort(left_edge, right_edge, depth_limit)
+    return array
+
+
+def dual_pivot_sort(array: list[float], left_edge: int, right_edge: int,
+                    no_recursion: bool = False) -> list[float]:
+    """
+    Dual-Pivot Quick Sort Function
+
+    Sort the part of the array by quick sort which splits every range
+    into three parts around two random pivots with `split_dual_pivot`.
+    If the pivots are equal, the middle part consists of elements equal
+    to them and is not sorted any further.
+
+    Parameters
+    ----------
+    array: list
+        The input list to be sorted.
+
+    left_edge: int
+        The starting index for the sort operation.
+
+    right_edge: int
+        The ending index (exclusive) for the sort operation.
+
+    no_recursion: bool
+        Switcher between recursive and non-recursive algorithms.
+
+    Returns
+    -------
+    list
+        The input list with the part sorted.
+
+    """
+    def partition_range(left_edge, right_edge):
+        # random pivots are moved to the edges of the range
+        last = right_edge - 1
+        i = random.randint(left_edge, last)
+        array[left_edge], array[i] = array[i], array[left_edge]
+        i = random.randint(left_edge + 1, last)
+        array[last], array[i] = array[i], array[last]
+        small, big = split_dual_pivot(array, left_edge, right_edge)
+        parts = [(left_edge, small), (big + 1, right_edge)]
+        if array[small] < array[big]:
+            parts.append((small + 1, big))
+        return parts
+
+    if no_recursion:
+        stack = [(left_edge, right_edge)]
+        while stack:
+            left_edge, right_edge = stack.pop()
+            if right_edge - left_edge > 1:
+                stack.extend(partition_range(left_edge, right_edge))
+        return array
+
+    def _dual_pivot_sort(left_edge, right_edge):
+        if right_edge - left_edge > 1:
+            for part in partition_range(left_edge, right_edge):
+                _dual_pivot_sort(*part)
+
+    _dual_pivot_sort(left_edge, right_edge)
+    return array
+
+
 def _quick_sort(array: list[float], left_edge: int, right_edge: int,
-                pivot_str: str = 'random', no_recursion=False) -> list[float]:
+                pivot_str: str = 'random', no_recursion=False,
+                partition: str = 'two_pass') -> list[float]:
     """
     Quick Sort Function
 
@@ -251,7 +554,7 @@ def _quick_sort(array: list[float], left_edge: int, right_edge: int,
     right_edge: int
         The ending index (exclusive) for the sort operation.
 
-    pivot_str: 'random', 'clst_avg', 'm3' or 'mm'
+    pivot_str: 'random', 'clst_avg', 'm3', 'mm' or 'intro'
         A strategy to choose pivot element.
         'random' for random selection among the elements, works well for
         random or uniformly distributed data.
@@ -262,16 +565,33 @@ def _quick_sort(array: list[float], left_edge: int, right_edge: int,
         ordering but not fully sorted.
         'mm' of median of medians or introselect performs well consistently
         regardless of the input data
+        'intro' for intro sort, see `intro_sort`.
 
     no_recursion: bool
         Switcher between recursive and non-recursive algorithms.
 
+    partition: 'two_pass', '3way' or 'dual_pivot'
+        A scheme to partition the array, see `quick_sort`.
+
     Returns
     -------
     list
         The sorted array.
 
     """
+    if pivot_str == 'intro':
+        return intro_sort(array, left_edge, right_edge,
+                          no_recursion=no_recursion)
+    if partition == 'dual_pivot':
+        return dual_pivot_sort(array, left_edge, right_edge,
+                               no_recursion=no_recursion)
+    if partition == 'two_pass':
+        split_func = split
+    elif partition == '3way':
+        split_func = split_3way
+    else:
+        raise AttributeError('Cannot parse partition option')
+
     if no_recursion:
         stack = [(left_edge, right_edge)]
         while stack:
@@ -292,7 +612,7 @@ def _quick_sort(array: list[float], left_edge: int, right_edge: int,
             else:
                 raise AttributeError('Cannot parse pivot option')
             new_left_edge, new_right_edge, = \
-                split(array, pivot, left_edge, right_edge)
+                split_func(array, pivot, left_edge, right_edge)
             stack.append((left_edge, new_left_edge))
             stack.append((new_right_edge, right_edge))
         return array
@@ -310,14 +630,72 @@ def _quick_sort(array: list[float], left_edge: int, right_edge: int,
         else:
             raise AttributeError('Cannot parse pivot option')
         new_left_edge, new_right_edge, = \
-            split(array, pivot, left_edge, right_edge)
-        _quick_sort(array, left_edge, new_left_edge)
-        _quick_sort(array, new_right_edge, right_edge)
+            split_func(array, pivot, left_edge, right_edge)
+        _quick_sort(array, left_edge, new_left_edge, partition=partition)
+        _quick_sort(array, new_right_edge, right_edge, partition=partition)
         return array[left_edge:right_edge]
 
 
+def lazy_sorted(iterable: Iterable[float],
+                cutoff: int = INTRO_CUTOFF) -> Generator:
+    """
+    Lazy Sorted Function
+
+    Yield the elements in ascending order, sorting only as much as the
+    consumer takes. The elements are copied into a list, then the part
+    holding the next element is split by `split` around the median of
+    three until it is not longer than cutoff, the part is sorted by
+    insertion sort and its elements are yielded. The parts to the right
+    are left unsorted until they are reached, so taking the first k
+    elements costs O(n + k * log k) on average, and all of them cost
+    the same as quick sort. Once a part is split more than 2 * log2(n)
+    times, it is sorted by the in-place heap sort, as in `intro_sort`.
+
+    Parameters
+    ----------
+    iterable: Iterable
+        The elements to sort, the input itself is not changed.
+
+    cutoff: int
+        The length of parts sorted by insertion sort. Default is
+        INTRO_CUTOFF.
+
+    Yields
+    ------
+    float
+        The elements in ascending order.
+
+    """
+    array = list(iterable)
+    length = len(array)
+    # parts to the right of the consumed ones, the leftmost on the top,
+    # depth -1 marks the parts of elements equal to a pivot
+    stack = [(0, length, 2 * length.bit_length())]
+    while stack:
+        left_edge, right_edge, depth = stack.pop()
+        if depth < 0:
+            yield from array[left_edge:right_edge]
+            continue
+        while right_edge - left_edge > cutoff and depth > 0:
+            pivot = median_of_three(array, left_edge, right_edge - 1)
+            new_left_edge, new_right_edge = \
+                split(array, pivot, left_edge, right_edge)
+            stack.append((new_right_edge, right_edge, depth - 1))
+            stack.append((new_left_edge, new_right_edge, -1))
+            right_edge = new_left_edge
+            depth -= 1
+        if right_edge - left_edge > cutoff:
+            heap_sort_range(array, left_edge, right_edge)
+        elif right_edge - left_edge > 1:
+            partition_small(array, left_edge, right_edge)
+        yield from array[left_edge:right_edge]
+
+
 def quick_sort(array: list[float], pivot_str: str = 'random',
-               no_recursion: bool = False) -> list[float]:
+               no_recursion: bool = False, shared_memory: bool = False,
+               max_workers: int | None = None,
+               partition: str = 'two_pass', key: Callable | None = None,
+               reverse: bool = False) -> list[float]:
     """
     Quick Sort Function (Wrapper)
 
@@ -329,23 +707,29 @@ def quick_sort(array: list[float], pivot_str: str = 'random',
     - closest to the average: O(log n), O(n)
     - median of three: O(log n), O(log n)
     - median of medians: O(log n), O(log n)
+    - intro sort: O(log n), O(log n)
     Average and worst time complexities:
     - random: O(n * log n), O(n ** 2)
     - closest to the average: O(n * log n), O(n * log n)
     - median of three: O(n * log n), O(n * log n)
     - median of medians: O(n * log n), O(n * log n)
+    - intro sort: O(n * log n), O(n * log n)
     Important considerations:
     O(n ** 2) performance is so extremely rare, it has no implications in
     practical usage. Median of medians pivot calculation suffers from
     big constant factor, which makes it impractical for small arrays.
     It is worth noting that quick sort is unstable.
+    Arrays of ints or floats can be sorted in parallel with
+    shared_memory=True: worker processes sort disjoint slices of a shared
+    memory block in-place and the slices are merged between two shared
+    blocks, so no elements are pickled, see `merge_sort.shared_memory_sort`.
 
     Parameters
     ----------
     array: list
         The input list to be sorted.
 
-    pivot_str: 'random', 'clst_avg', 'm3' or 'mm'
+    pivot_str: 'random', 'clst_avg', 'm3', 'mm' or 'intro'
         A strategy to choose pivot element.
         'random' for random selection among the elements, works well for
         random or uniformly distributed data.
@@ -356,15 +740,115 @@ def quick_sort(array: list[float], pivot_str: str = 'random',
         ordering but not fully sorted.
         'mm' of median of medians or introselect performs well consistently
         regardless of the input data.
+        'intro' for intro sort: median of three quick sort which switches
+        to heap sort after 2 * log2(n) levels of partitioning and to
+        insertion sort for small parts, it never goes quadratic.
 
     no_recursion: bool
         Switcher between recursive and non-recursive algorithms.
 
+    shared_memory: bool
+        Switcher to the parallel sorting through shared memory blocks,
+        which is available for arrays of ints or floats only.
+        Default is False.
+
+    max_workers: int or None
+        The number of worker processes for shared_memory=True.
+        Default is None, which translates to cpu_count.
+
+    partition: 'two_pass', '3way' or 'dual_pivot'
+        A scheme to partition the array.
+        'two_pass' moves the elements less than the pivot to the left
+        and then the elements equal to it in the second pass.
+        '3way' does the same in a single pass (Dutch national flag),
+        which makes sorting of arrays with few distinct values linear.
+        'dual_pivot' splits the array into three parts around two random
+        pivots at once (Yaroslavskiy), pivot_str is ignored then.
+        All of them only compare elements by `<`, so any comparable
+        elements can be sorted. Default is 'two_pass'.
+
+    key: Callable or None
+        The function of an element to sort by, computed once per element,
+        see `sort_keys.sort_by_key`. The sort is stable with a key, since
+        ties are broken by the positions. It is not available with
+        shared_memory=True or pivot_str='clst_avg', which need numbers.
+        Default is None.
+
+    reverse: bool
+        Whether to sort in the descending order. Default is False.
+
     Returns
     -------
     list
         The sorted list.
 
+    Raises
+    ------
+    AttributeError
+        Raised if a key is given with shared_memory=True or
+        pivot_str='clst_avg'.
+
     """
+    if key is not None or reverse:
+        if key is not None and (shared_memory or pivot_str == 'clst_avg'):
+            raise AttributeError('shared memory sort and closest to the' +
+                                 ' average pivot with key are not available')
+        array[:] = sort_by_key(quick_sort, array, key, reverse,
+                               pivot_str=pivot_str,
+                               no_recursion=no_recursion,
+                               shared_memory=shared_memory,
+                               max_workers=max_workers, partition=partition)
+        return array
+    if shared_memory:
+        return shared_memory_sort(array, algorithm='quick',
+                                  max_workers=max_workers,
+                                  pivot_str=pivot_str)
     return _quick_sort(array, left_edge=0, right_edge=len(array),
-                       pivot_str=pivot_str, no_recursion=no_recursion)
+                       pivot_str=pivot_str, no_recursion=no_recursion,
+                       partition=partition)
+
+
+def quick_argsort(array: list[float], key: Callable | None = None,
+                  reverse: bool = False, **params) -> typed_array:
+    """
+    Quick Argsort Function
+
+    Find the permutation which sorts the array by quick sort. The
+    (key, position) pairs of `sort_keys.decorate` are sorted and their
+    positions are returned. Pairs are never equal, so the permutation is
+    stable although quick sort is not. The array itself is not changed,
+    parallel columns can be reordered by `sort_keys.reorder`.
+
+    Parameters
+    ----------
+    array: list
+        The elements to sort by.
+
+    key: Callable or None
+        The function of an element to sort by, computed once per element.
+        Default is None.
+
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    **params: dict
+        Other keyword parameters of `quick_sort`: pivot_str,
+        no_recursion and partition.
+
+    Returns
+    -------
+    array
+        array('q') of positions, array[i] for i in it go in sorted order
+        and equal elements keep their order.
+
+    Raises
+    ------
+    AttributeError
+        Raised if shared_memory=True or pivot_str='clst_avg' is given,
+        which need numbers instead of pairs.
+
+    """
+    if params.get('shared_memory') or params.get('pivot_str') == 'clst_avg':
+        raise AttributeError('shared memory sort and closest to the' +
+                             ' average pivot in argsort are not available')
+    return argsort_by(quick_sort, array, key, reverse, **params)
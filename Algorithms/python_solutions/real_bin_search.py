@@ -6,6 +6,12 @@ input value (x) for which a given function func(x) is close to func_value
 within a specified epsilon. The binary search algorithm is suitable for
 monotonic functions.
 
+Many targets can be solved at once by batch_real_bin_search: the sorted
+targets go down one tree of halved cuts together and are split by the
+value of the function in the middle of the cut, so every middle is
+evaluated once for all the targets sharing it and the evaluations are
+cached by x.
+
 Functions
 ---------
 real_bin_search(func, func_value, left_edge,
@@ -13,9 +19,17 @@ real_bin_search(func, func_value, left_edge,
     Performs a binary search among real numbers to find an x
     where func(x) is approximately equal to func_value.
 
+batch_real_bin_search(func, func_values, left_edge, right_edge, eps=1e-6,
+    check=False, cache=None)
+    Performs the binary search for many target values at once sharing
+    the evaluations of func between them.
+
 """
 
 
+from bisect import bisect_right
+
+
 def real_bin_search(func, func_value, left_edge,
                     right_edge, eps=1e-6, check=False):
     """
@@ -127,3 +141,101 @@ def real_bin_search(func, func_value, left_edge,
     # as an answer give the middle
     # of the accurate enough cut
     return (left_edge + right_edge)/2
+
+
+def batch_real_bin_search(func, func_values, left_edge, right_edge,
+                          eps=1e-6, check=False, cache=None):
+    """
+    This function performs the binary search among real numbers for many
+    target values at once sharing the evaluations of func between them.
+
+    The targets are sorted in the order their x's go and descend the tree
+    of halved cuts together: in every cut func is evaluated once in the
+    middle and the sorted targets are split by a binary search into the
+    ones going to the left half and to the right half, cuts without
+    targets are dropped. Every target takes exactly the path it takes
+    in `real_bin_search`, so the results are the same, but the first
+    cuts are shared by all the targets: m targets need at most
+    O(m * log2(n / m)) + 2 * m evaluations instead of m * log2(n),
+    where n is the amount of epsilons in the interval. All evaluations
+    are cached by x, so repeated targets and repeated calls with
+    the same cache cost nothing.
+
+    Parameters
+    ----------
+    func: callable
+        The monotonic function for which we are searching for input
+        values.
+
+    func_values: list[float]
+        The target values, in any order.
+
+    left_edge: float
+        The left edge of the search interval.
+
+    right_edge: float
+        The right edge of the search interval.
+
+    eps: float, optional
+        The desired accuracy of the results. Default is 1e-6.
+
+    check: bool, optional
+        If True, every target has to lie between func(left_edge + eps)
+        and func(right_edge - eps), which are evaluated anyway, so the
+        check costs no evaluations. Default is False.
+
+    cache: dict or None, optional
+        A dict of func values by x to use and fill, its length is the
+        number of evaluations done. Default is None, which means
+        a new dict.
+
+    Returns
+    -------
+    list[float]
+        The approximate input values in the order of the targets.
+
+    Raises
+    ------
+    KeyError
+        Is raised if the check parameter is set to True and a target is
+        unreachable within the given edges.
+    """
+    if cache is None:
+        cache = {}
+
+    def value(x):
+        if x not in cache:
+            cache[x] = func(x)
+        return cache[x]
+
+    # the same direction test as in real_bin_search
+    left_value, right_value = value(left_edge + eps), value(right_edge - eps)
+    sign = 1 if left_value < right_value else -1
+    if check:
+        low, high = sorted((left_value, right_value))
+        if any(not low <= target <= high for target in func_values):
+            raise KeyError('func_value is unreachable within given edges')
+
+    # with the sign the targets of bigger x's have bigger keys
+    order = sorted(range(len(func_values)),
+                   key=lambda index: sign * func_values[index])
+    keys = [sign * func_values[index] for index in order]
+    results = [None] * len(func_values)
+
+    # cuts with the slices of the sorted targets inside them
+    cuts = [(left_edge, right_edge, 0, len(keys))] if keys else []
+    while cuts:
+        left, right, start, end = cuts.pop()
+        if abs(right - left) < eps:
+            for index in order[start:end]:
+                results[index] = (left + right) / 2
+            continue
+
+        middle = (left + right) / 2
+        # the targets with keys bigger than the value go to the right
+        split = bisect_right(keys, sign * value(middle), start, end)
+        if split > start:
+            cuts.append((left, middle, start, split))
+        if split < end:
+            cuts.append((middle, right, split, end))
+    return results
@@ -0,0 +1,217 @@
+"""
+Parallel Sample Sort Module
+===========================
+
+This module provides a parallel sample sort. Unlike the merge-based
+parallel sorts of `merge_sort.py`, it partitions the input before
+sorting instead of merging after it: p - 1 splitters are picked from an
+oversampled random sample with `split_find`, the input is distributed
+into p buckets in one pass and every bucket is sorted in its own worker
+process. The sorted buckets are concatenated, so there is no serial
+merge phase at all.
+
+Functions
+---------
+choose_splitters(array: list[float], parts: int, oversampling: int = 16)
+    -> list[float]
+    Pick splitters which divide the array into parts of about equal size.
+
+bucketize(array: list[float], splitters: list[float]) -> list[list[float]]
+    Distribute the elements of the array into buckets between splitters.
+
+sample_sort(array: list[float], max_workers: int | None = None,
+    algorithm: str = 'quick', oversampling: int = 16,
+    pool: MergeSortPool | None = None, batch_size: int = 1000)
+    -> list[float]
+    Sort a list of elements in parallel using the sample sort algorithm.
+
+"""
+
+
+import random
+
+
+from itertools import repeat
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor as Pool
+from multiprocessing import cpu_count
+
+
+from Algorithms.python_solutions.merge_sort import MergeSortPool, merge_sort
+from Algorithms.python_solutions.quick_sort import quick_sort
+from Algorithms.python_solutions.split_find import split_find
+
+
+def choose_splitters(array: list[float], parts: int,
+                     oversampling: int = 16) -> list[float]:
+    """
+    Pick splitters which divide the array into parts of about equal size.
+
+    A random sample of parts * oversampling elements is drawn and the
+    elements of the sample with ranks k * oversampling, k = 1..parts - 1,
+    are found by `split_find` without sorting the sample. The bigger the
+    oversampling, the closer the sizes of the parts are to each other.
+    Equal splitters are dropped, so fewer parts are possible for inputs
+    with few distinct values.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array to pick splitters for.
+
+    parts: int
+        The desired number of parts.
+
+    oversampling: int
+        The number of sampled elements per part. Default is 16.
+
+    Returns
+    -------
+    list[float]
+        Ascending distinct splitters, at most parts - 1 of them.
+
+    """
+    if parts <= 1 or not array:
+        return []
+
+    sample = random.choices(array, k=parts * oversampling)
+    splitters = []
+    for k in range(1, parts):
+        splitter = split_find(sample, k * oversampling)
+        if not splitters or splitters[-1] < splitter:
+            splitters.append(splitter)
+    return splitters
+
+
+def bucketize(array: list[float],
+              splitters: list[float]) -> list[list[float]]:
+    """
+    Distribute the elements of the array into buckets between splitters.
+
+    Bucket i receives the elements x with splitters[i - 1] <= x <
+    splitters[i], so every element of a bucket is less than every
+    element of the following buckets. It takes a single pass and
+    O(log(p)) comparisons per element, where p - the number of buckets.
+
+    Parameters
+    ----------
+    array: list[float]
+        The array to be distributed.
+
+    splitters: list[float]
+        Ascending splitters.
+
+    Returns
+    -------
+    list[list[float]]
+        len(splitters) + 1 buckets.
+
+    """
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    appends = [bucket.append for bucket in buckets]
+    for element in array:
+        appends[bisect_right(splitters, element)](element)
+    return buckets
+
+
+def _sort_bucket(bucket: list[float], algorithm: str) -> list[float]:
+    """
+    Sort one bucket inside a worker process with the chosen sort.
+
+    Parameters
+    ----------
+    bucket: list[float]
+        The bucket to be sorted.
+
+    algorithm: str
+        'quick' or 'merge'.
+
+    Returns
+    -------
+    list[float]
+        The sorted bucket.
+
+    """
+    if algorithm == 'quick':
+        return quick_sort(bucket)
+    return merge_sort(bucket)
+
+
+def sample_sort(array: list[float], max_workers: int | None = None,
+                algorithm: str = 'quick', oversampling: int = 16,
+                pool: MergeSortPool | None = None,
+                batch_size: int = 1000) -> list[float]:
+    """
+    Parallel Sample Sort
+
+    This function sorts the array by distributing its elements into one
+    bucket per worker around splitters picked by `choose_splitters`,
+    sorting every bucket in its own worker process and concatenating the
+    sorted buckets. The only serial parts are sampling and one
+    distribution pass, so it scales with the number of cores better
+    than the merge-based parallel sorts whose final merge is serial.
+    Time complexity is O(n * log(n) / p + n * log(p)), where p - the
+    number of workers.
+
+    Parameters
+    ----------
+    array: list[float]
+        The input list to be sorted in-place.
+
+    max_workers: int or None
+        The number of worker processes to start if pool is not provided.
+        Default is None, which translates to cpu_count.
+
+    algorithm: 'quick' or 'merge'
+        The sort applied to the buckets. Default is 'quick'.
+
+    oversampling: int
+        The number of sampled elements per bucket. Default is 16.
+
+    pool: MergeSortPool or None
+        A long-lived pool whose workers are used instead of starting new
+        ones. Default is None.
+
+    batch_size: int
+        Arrays not longer than batch_size are sorted inside the calling
+        process. Default is 1000.
+
+    Returns
+    -------
+    list[float]
+        The same list with its elements in sorted order.
+
+    Raises
+    ------
+    ValueError
+        Raised if the algorithm option cannot be parsed.
+
+    """
+    if algorithm not in ('quick', 'merge'):
+        raise ValueError('Cannot parse algorithm option')
+
+    if len(array) <= 1:
+        return array
+    if len(array) <= batch_size:
+        array[:] = _sort_bucket(array, algorithm)
+        return array
+
+    if pool is not None:
+        executor, workers = pool.executor, pool.max_workers
+    else:
+        workers = max_workers if max_workers is not None else cpu_count()
+        executor = Pool(max_workers=workers)
+
+    try:
+        buckets = bucketize(array, choose_splitters(array, workers,
+                                                    oversampling))
+        buckets = [bucket for bucket in buckets if bucket]
+        position = 0
+        for bucket in executor.map(_sort_bucket, buckets,
+                                   repeat(algorithm)):
+            array[position:position + len(bucket)] = bucket
+            position += len(bucket)
+    finally:
+        if pool is None:
+            executor.shutdown()
+    return array
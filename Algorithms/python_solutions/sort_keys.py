@@ -0,0 +1,186 @@
+"""
+Sort Keys Module
+================
+
+This module adds the `key` and `reverse` options of the built-in `sorted`
+to the comparison sorts of this package with decorate-once semantics:
+the key of every element is computed exactly once into a parallel list
+and the sort runs over (key, index) pairs, so the key function is never
+called inside the comparison loop and the elements themselves are never
+compared. The index breaks the ties between equal keys, which makes
+the result stable for any sort, and is negated for the reverse order,
+so equal keys keep their order there too.
+
+The same pairs give the argsort variants of the sorts: the sorted
+positions alone are the permutation which sorts the array, kept in
+a compact array('q'), so several parallel columns can be reordered
+by one key column with `reorder` without zipping them into records.
+
+Functions
+---------
+decorate(array: list, key: Callable | None, reverse: bool = False)
+    -> list[tuple]
+    Pair the key of every element with its position.
+
+sort_by_key(function: Callable, array: list, key: Callable | None = None,
+    reverse: bool = False, **params) -> list
+    Sort the array by a comparison sort with the key and reverse options.
+
+argsort_by(function: Callable, array: list, key: Callable | None = None,
+    reverse: bool = False, **params) -> array
+    Find the permutation which sorts the array by a comparison sort.
+
+reorder(column: list, order: array) -> list
+    Take the elements of a column in the order of a permutation.
+
+"""
+
+
+from array import array as typed_array
+from operator import itemgetter, neg
+from typing import Callable
+
+
+def decorate(array: list, key: Callable | None, reverse: bool = False) \
+        -> list[tuple]:
+    """
+    Pair the key of every element with its position.
+
+    Parameters
+    ----------
+    array: list
+        The elements.
+
+    key: Callable or None
+        The function of an element to sort by, called once per element,
+        None means the elements themselves.
+
+    reverse: bool
+        Whether the pairs are for the descending order, the positions are
+        negated then, so after the ascending sort of the pairs is reversed
+        the elements with equal keys are in their original order.
+        Default is False.
+
+    Returns
+    -------
+    list[tuple]
+        (key, position) pairs, the position being negative for reverse.
+
+    """
+    sign = -1 if reverse else 1
+    keys = array if key is None else map(key, array)
+    return list(zip(keys, range(0, sign * len(array), sign)))
+
+
+def sort_by_key(function: Callable, array: list, key: Callable | None = None,
+                reverse: bool = False, **params) -> list:
+    """
+    Sort the array by a comparison sort with the key and reverse options.
+
+    With a key the pairs made by `decorate` are sorted by the function and
+    the elements are taken by the sorted positions. Without a key the
+    reversed copy of the array is sorted and the result is reversed back,
+    so a stable sort keeps the equal elements in their original order in
+    the descending result as well.
+
+    Parameters
+    ----------
+    function: Callable
+        The sort, called as function(list, **params) and returning
+        the sorted list.
+
+    array: list
+        The elements to sort, the input itself is not changed.
+
+    key: Callable or None
+        The function of an element to sort by, None means the elements
+        themselves. Default is None.
+
+    reverse: bool
+        Whether to sort in the descending order. Default is False.
+
+    **params: dict
+        Other keyword parameters of the sort.
+
+    Returns
+    -------
+    list
+        A new list of the elements in sorted order.
+
+    """
+    if key is None:
+        result = list(function(array[::-1], **params))
+        if reverse:
+            result.reverse()
+        return result
+
+    pairs = function(decorate(array, key, reverse), **params)
+    if reverse:
+        return [array[-position] for _, position in reversed(pairs)]
+    return [array[position] for _, position in pairs]
+
+
+def argsort_by(function: Callable, array: list, key: Callable | None = None,
+               reverse: bool = False, **params) -> typed_array:
+    """
+    Find the permutation which sorts the array by a comparison sort.
+
+    The pairs made by `decorate` are sorted by the function and only
+    their positions are kept. The positions break the ties, so the
+    permutation is stable whether the sort is stable or not.
+
+    Parameters
+    ----------
+    function: Callable
+        The sort, called as function(list, **params) and returning
+        the sorted list.
+
+    array: list
+        The elements, the input itself is not changed.
+
+    key: Callable or None
+        The function of an element to sort by, None means the elements
+        themselves. Default is None.
+
+    reverse: bool
+        Whether the order is descending. Default is False.
+
+    **params: dict
+        Other keyword parameters of the sort.
+
+    Returns
+    -------
+    array
+        array('q') of positions, the elements array[i] for i in it go
+        in sorted order.
+
+    """
+    pairs = function(decorate(array, key, reverse), **params)
+    if reverse:
+        return typed_array('q', map(neg, map(itemgetter(1),
+                                             reversed(pairs))))
+    return typed_array('q', map(itemgetter(1), pairs))
+
+
+def reorder(column: list, order: typed_array) -> list:
+    """
+    Take the elements of a column in the order of a permutation.
+
+    Parameters
+    ----------
+    column: list or array
+        The elements of one column.
+
+    order: array
+        The positions made by an argsort of this or of a parallel column.
+
+    Returns
+    -------
+    list or array
+        A new column of the same type with column[i] for i in order.
+
+    """
+    elements = map(column.__getitem__, order)
+    if isinstance(column, typed_array):
+        return typed_array(column.typecode, elements)
+    return list(elements)
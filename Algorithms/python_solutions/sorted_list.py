@@ -0,0 +1,729 @@
+"""
+Sorted List Module
+==================
+
+This module defines SortedList, a container which keeps its values in
+ascending order under insertions and removals. A flat list kept sorted
+by `insert_sort_opt` pays O(n) for shifting the tail on every insertion,
+so the values are stored as a list of sorted blocks of about LOAD values
+instead: an insertion or removal finds the block by binary search over
+the last values of the blocks and shifts only the tail of that block.
+Blocks longer than twice LOAD are split in halves and blocks shorter
+than half of LOAD are joined with a neighbour, so there are about
+n / LOAD blocks of bounded length.
+
+The positional index is a Fenwick (binary indexed) tree over the lengths
+of the blocks: it finds the block and the offset holding the value with
+a given index and the number of values before a block in O(log(n)),
+and it is rebuilt in O(n / LOAD) only when blocks are split or joined.
+
+Classes
+-------
+SortedList
+    A container of values in ascending order with sublinear insertion,
+    removal and indexed access.
+
+Constants
+---------
+LOAD: int
+    The default length of a block, 1000.
+
+"""
+
+
+from itertools import chain, islice
+from typing import Generator, Iterable
+
+
+from Algorithms.python_solutions.insert_sort import bin_search_fl
+from Algorithms.python_solutions.merge_sort import merge, merge_sort
+
+
+# insertion into a random position of 10^6 values is the fastest
+# for blocks of 500 to 2000 values
+LOAD = 1000
+
+
+class SortedList:
+    """
+    A container of values in ascending order with sublinear insertion,
+    removal and indexed access.
+
+    Values only need to be comparable by `<`. Equal values are kept in
+    the order of their insertion.
+
+    Attributes
+    ----------
+    load : int
+        The length of a block the container aims at.
+
+    blocks : list[list[float]]
+        Sorted blocks of values, every block is not empty.
+
+    maxes : list[float]
+        The last value of every block.
+
+    index : list[int]
+        The Fenwick tree over the lengths of the blocks, 1-based.
+
+    size : int
+        The number of values.
+
+    Methods
+    -------
+    __init__(self, iterable: Iterable | None = None, load: int = LOAD)
+        -> None
+        Initialize the container with the values of the iterable.
+
+    insert(self, value: float) -> None
+        Insert the value after the values equal to it.
+
+    update(self, iterable: Iterable) -> None
+        Insert all the values of the iterable.
+
+    remove(self, value: float) -> None
+        Remove one value equal to the given one.
+
+    discard(self, value: float) -> None
+        Remove one value equal to the given one if there is such.
+
+    pop(self, index: int = -1) -> float
+        Remove and return the value with the index.
+
+    bisect_left(self, value: float) -> int
+        Find the index before all the values equal to the value.
+
+    bisect_right(self, value: float) -> int
+        Find the index after all the values equal to the value.
+
+    count(self, value: float) -> int
+        Count the values equal to the value.
+
+    index_of(self, value: float) -> int
+        Find the index of the first value equal to the value.
+
+    islice(self, start: int | None = None, stop: int | None = None)
+        -> Generator
+        Iterate over the values with indexes from start to stop.
+
+    irange(self, minimum: float | None = None, maximum: float | None = None,
+           inclusive: tuple[bool, bool] = (True, True)) -> Generator
+        Iterate over the values between minimum and maximum.
+
+    __getitem__(self, index: int | slice) -> float | list[float]
+        Return the value with the index or a list of values for a slice.
+
+    __len__, __iter__, __reversed__, __contains__, __repr__
+        The usual container methods.
+
+    """
+
+    def __init__(self, iterable: Iterable | None = None,
+                 load: int = LOAD) -> None:
+        """
+        Initialize the container with the values of the iterable.
+
+        Parameters
+        ----------
+        iterable : Iterable or None, optional
+            The initial values, by default None.
+
+        load : int, optional
+            The length of a block the container aims at, by default LOAD.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if load is less than 4.
+
+        """
+        if load < 4:
+            raise ValueError('load has to be at least 4')
+        self.load = load
+        self.blocks = []
+        self.maxes = []
+        self.index = [0]
+        self.size = 0
+        if iterable is not None:
+            self.update(iterable)
+
+    def _rebuild(self, values: list[float] | None = None) -> None:
+        """
+        Rebuild the maxes and the positional index of the blocks.
+
+        Parameters
+        ----------
+        values : list[float] or None
+            If given, the sorted values to cut into new blocks of load
+            values first.
+
+        Returns
+        -------
+        None
+
+        """
+        if values is not None:
+            self.blocks = [values[start:start + self.load]
+                           for start in range(0, len(values), self.load)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.size = sum(map(len, self.blocks))
+
+        # every node adds its sum to its parent, which makes it O(n)
+        self.index = [0] + [len(block) for block in self.blocks]
+        for node in range(1, len(self.index)):
+            parent = node + (node & -node)
+            if parent < len(self.index):
+                self.index[parent] += self.index[node]
+
+    def _index_add(self, block: int, delta: int) -> None:
+        """
+        Add delta to the length of the block inside the positional index.
+
+        Parameters
+        ----------
+        block : int
+            The number of the block.
+
+        delta : int
+            The change of its length.
+
+        Returns
+        -------
+        None
+
+        """
+        node = block + 1
+        while node < len(self.index):
+            self.index[node] += delta
+            node += node & -node
+
+    def _offset(self, block: int) -> int:
+        """
+        Count the values in the blocks before the given one.
+
+        Parameters
+        ----------
+        block : int
+            The number of the block.
+
+        Returns
+        -------
+        int
+            The index of the first value of the block.
+
+        """
+        total = 0
+        node = block
+        while node:
+            total += self.index[node]
+            node -= node & -node
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """
+        Find the block and the offset inside it of the value with the index.
+
+        The Fenwick tree is descended from its highest power of two,
+        skipping the nodes whose blocks end before the index.
+
+        Parameters
+        ----------
+        index : int
+            A non-negative index less than the size.
+
+        Returns
+        -------
+        tuple[int, int]
+            The number of the block and the offset inside it.
+
+        """
+        block = 0
+        step = 1 << (len(self.index) - 1).bit_length()
+        while step:
+            node = block + step
+            if node < len(self.index) and self.index[node] <= index:
+                block = node
+                index -= self.index[node]
+            step >>= 1
+        return block, index
+
+    def _normalize(self, index: int) -> int:
+        """
+        Turn a negative index into a non-negative one and check it.
+
+        Parameters
+        ----------
+        index : int
+            The index, negative ones count from the end.
+
+        Returns
+        -------
+        int
+            The non-negative index.
+
+        Raises
+        ------
+        IndexError
+            Raised if the index is out of range.
+
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('SortedList index out of range')
+        return index
+
+    def insert(self, value: float) -> None:
+        """
+        Insert the value after the values equal to it.
+
+        The block is the first one whose last value is greater than the
+        value (or the last block), the place inside it is found by
+        `bin_search_fl`. Time complexity is O(log(n) + LOAD) amortized.
+
+        Parameters
+        ----------
+        value : float
+            The value to insert.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.blocks:
+            self.blocks.append([value])
+            self._rebuild()
+            return
+
+        block = bin_search_fl(self.maxes, value, 0, len(self.maxes),
+                              right=True)
+        if block == len(self.blocks):
+            block -= 1
+            self.blocks[block].append(value)
+            self.maxes[block] = value
+        else:
+            values = self.blocks[block]
+            values.insert(bin_search_fl(values, value, 0, len(values),
+                                        right=True), value)
+        self.size += 1
+
+        if len(self.blocks[block]) > 2 * self.load:
+            values = self.blocks[block]
+            half = len(values) // 2
+            self.blocks[block:block + 1] = [values[:half], values[half:]]
+            self._rebuild()
+        else:
+            self._index_add(block, 1)
+
+    def update(self, iterable: Iterable) -> None:
+        """
+        Insert all the values of the iterable.
+
+        A few values are inserted one by one. Otherwise the values are
+        sorted by the adaptive merge sort, merged with the container's
+        values in O(n) and cut into new blocks.
+
+        Parameters
+        ----------
+        iterable : Iterable
+            The values to insert.
+
+        Returns
+        -------
+        None
+
+        """
+        values = list(iterable)
+        if len(values) * 8 < self.size:
+            for value in values:
+                self.insert(value)
+            return
+
+        values = merge_sort(values, adaptive=True)
+        if self.size:
+            old_values = list(self)
+            merged = [None] * (len(old_values) + len(values))
+            merge(merged, old_values, values)
+            values = merged
+        self._rebuild(values)
+
+    def _delete(self, block: int, offset: int) -> float:
+        """
+        Delete the value at the offset of the block.
+
+        An emptied block is deleted and a block shorter than half of the
+        load is joined with its neighbour and split again if needed.
+
+        Parameters
+        ----------
+        block : int
+            The number of the block.
+
+        offset : int
+            The offset of the value inside the block.
+
+        Returns
+        -------
+        float
+            The deleted value.
+
+        """
+        values = self.blocks[block]
+        value = values.pop(offset)
+        self.size -= 1
+
+        if len(values) >= self.load // 2 or len(self.blocks) == 1 and values:
+            if offset == len(values):
+                self.maxes[block] = values[-1]
+            self._index_add(block, -1)
+            return value
+
+        if not values:
+            del self.blocks[block]
+        else:
+            neighbour = block - 1 if block else block + 1
+            first, second = sorted((block, neighbour))
+            joined = self.blocks[first] + self.blocks[second]
+            if len(joined) > 2 * self.load:
+                half = len(joined) // 2
+                self.blocks[first:second + 1] = [joined[:half],
+                                                 joined[half:]]
+            else:
+                self.blocks[first:second + 1] = [joined]
+        self._rebuild()
+        return value
+
+    def remove(self, value: float) -> None:
+        """
+        Remove one value equal to the given one.
+
+        Parameters
+        ----------
+        value : float
+            The value to remove.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            Raised if there is no such value.
+
+        """
+        block = bin_search_fl(self.maxes, value, 0, len(self.maxes))
+        if block < len(self.blocks):
+            values = self.blocks[block]
+            offset = bin_search_fl(values, value, 0, len(values))
+            if not value < values[offset]:
+                self._delete(block, offset)
+                return
+        raise ValueError(f'{value} is not in SortedList')
+
+    def discard(self, value: float) -> None:
+        """
+        Remove one value equal to the given one if there is such.
+
+        Parameters
+        ----------
+        value : float
+            The value to remove.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def pop(self, index: int = -1) -> float:
+        """
+        Remove and return the value with the index.
+
+        Parameters
+        ----------
+        index : int, optional
+            The index of the value, by default -1, the largest value.
+
+        Returns
+        -------
+        float
+            The removed value.
+
+        Raises
+        ------
+        IndexError
+            Raised if the index is out of range.
+
+        """
+        return self._delete(*self._locate(self._normalize(index)))
+
+    def bisect_left(self, value: float) -> int:
+        """
+        Find the index before all the values equal to the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search a place for.
+
+        Returns
+        -------
+        int
+            The index where the value would be inserted to stay before
+            the equal values.
+
+        """
+        block = bin_search_fl(self.maxes, value, 0, len(self.maxes))
+        if block == len(self.blocks):
+            return self.size
+        values = self.blocks[block]
+        return self._offset(block) + \
+            bin_search_fl(values, value, 0, len(values))
+
+    def bisect_right(self, value: float) -> int:
+        """
+        Find the index after all the values equal to the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search a place for.
+
+        Returns
+        -------
+        int
+            The index where `insert` would put the value.
+
+        """
+        block = bin_search_fl(self.maxes, value, 0, len(self.maxes),
+                              right=True)
+        if block == len(self.blocks):
+            return self.size
+        values = self.blocks[block]
+        return self._offset(block) + \
+            bin_search_fl(values, value, 0, len(values), right=True)
+
+    def count(self, value: float) -> int:
+        """
+        Count the values equal to the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to count.
+
+        Returns
+        -------
+        int
+            The number of equal values.
+
+        """
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index_of(self, value: float) -> int:
+        """
+        Find the index of the first value equal to the value.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        int
+            The index of the value.
+
+        Raises
+        ------
+        ValueError
+            Raised if there is no such value.
+
+        """
+        index = self.bisect_left(value)
+        if index == self.size or value < self[index]:
+            raise ValueError(f'{value} is not in SortedList')
+        return index
+
+    def islice(self, start: int | None = None,
+               stop: int | None = None) -> Generator:
+        """
+        Iterate over the values with indexes from start to stop.
+
+        Only the block of the start is located, then the blocks are
+        walked one after another.
+
+        Parameters
+        ----------
+        start : int or None, optional
+            The first index, negative ones count from the end, None
+            means 0. By default None.
+
+        stop : int or None, optional
+            The index after the last one, None means the size.
+            By default None.
+
+        Yields
+        ------
+        float
+            The values in ascending order.
+
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        block, offset = self._locate(start)
+        remaining = stop - start
+        for values in islice(self.blocks, block, None):
+            part = values[offset:offset + remaining]
+            yield from part
+            remaining -= len(part)
+            if not remaining:
+                return
+            offset = 0
+
+    def irange(self, minimum: float | None = None,
+               maximum: float | None = None,
+               inclusive: tuple[bool, bool] = (True, True)) -> Generator:
+        """
+        Iterate over the values between minimum and maximum.
+
+        Parameters
+        ----------
+        minimum : float or None, optional
+            The lower bound, None means no bound. By default None.
+
+        maximum : float or None, optional
+            The upper bound, None means no bound. By default None.
+
+        inclusive : tuple[bool, bool], optional
+            Whether the values equal to minimum and to maximum are
+            included. By default (True, True).
+
+        Yields
+        ------
+        float
+            The values in ascending order.
+
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+        if maximum is None:
+            stop = self.size
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+        return self.islice(start, stop)
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        """
+        Return the value with the index or a list of values for a slice.
+
+        Parameters
+        ----------
+        index : int or slice
+            The index, negative ones count from the end.
+
+        Returns
+        -------
+        float or list[float]
+            The value or the values of the slice.
+
+        Raises
+        ------
+        IndexError
+            Raised if the index is out of range.
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return list(self)[index]
+        block, offset = self._locate(self._normalize(index))
+        return self.blocks[block][offset]
+
+    def __len__(self) -> int:
+        """
+        Return the number of values.
+
+        Returns
+        -------
+        int
+            The number of values.
+
+        """
+        return self.size
+
+    def __iter__(self) -> Generator:
+        """
+        Iterate over the values in ascending order.
+
+        Returns
+        -------
+        Generator
+            The values in ascending order.
+
+        """
+        return chain.from_iterable(self.blocks)
+
+    def __reversed__(self) -> Generator:
+        """
+        Iterate over the values in descending order.
+
+        Returns
+        -------
+        Generator
+            The values in descending order.
+
+        """
+        return chain.from_iterable(map(reversed, reversed(self.blocks)))
+
+    def __contains__(self, value: float) -> bool:
+        """
+        Check whether there is a value equal to the given one.
+
+        Parameters
+        ----------
+        value : float
+            The value to search for.
+
+        Returns
+        -------
+        bool
+            True if there is an equal value.
+
+        """
+        block = bin_search_fl(self.maxes, value, 0, len(self.maxes))
+        if block == len(self.blocks):
+            return False
+        values = self.blocks[block]
+        return not value < values[bin_search_fl(values, value, 0,
+                                                len(values))]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the container.
+
+        Returns
+        -------
+        str
+            SortedList([values]).
+
+        """
+        return f'SortedList({list(self)})'
@@ -1,6 +1,7 @@
 import random
 
-from Algorithms.python_solutions.array_count_sort import array_count_sort
+from Algorithms.python_solutions.array_count_sort \
+    import array_count_sort, multi_key_order
 
 
 def test_array_count_sort_case_one_elt_with_huge_variation():
@@ -51,3 +52,19 @@ def test_array_count_sort_case_many_elts_with_key_some_empty():
     assert array_count_sort(array_with_2_dim, key=9) == \
         sorted(array_with_2_dim, key=lambda x: x[9]), \
         'array_count_sort does not sort 2 dim arrays with free places'
+
+
+def test_multi_key_order():
+    rows = [[random.randint(-100, 100), random.randint(0, 3), 7]
+            for _ in range(1000)]
+    order = multi_key_order(rows, [1, 0, 2])
+    assert order.typecode == 'q'
+    assert sorted(order) == list(range(len(rows)))
+    assert [rows[i] for i in order] == \
+        sorted(rows, key=lambda row: (row[1], row[0]))
+
+    # the order is stable and rows without a key go first
+    rows = [[1, 5], [0], [1, 2], [0, 1], [1]]
+    assert list(multi_key_order(rows, [0, 1])) == [1, 3, 4, 2, 0]
+    assert list(multi_key_order(rows, [])) == [0, 1, 2, 3, 4]
+    assert list(multi_key_order([], [0])) == []
@@ -0,0 +1,96 @@
+import pytest
+import random
+
+from mock import patch
+
+from Algorithms.python_solutions.auto_sort import \
+    CANDIDATES, calibrate, choose_sort, classify, input_stats, \
+    load_thresholds, sort
+from Algorithms.python_solutions.bench.distributions import make_array
+
+
+def test_input_stats():
+    stats = input_stats([3, 1, 2, 2])
+    assert stats['size'] == 4
+    assert stats['integers'] and stats['numbers']
+    assert (stats['min'], stats['max']) == (1, 3)
+    assert (stats['descents'], stats['ascents']) == (1, 1)
+    assert stats['duplicates'] == 0.25
+
+    stats = input_stats([1.5, 2])
+    assert not stats['integers'] and stats['numbers']
+    stats = input_stats(['b', 'a'])
+    assert not stats['numbers'] and 'min' not in stats
+    assert input_stats([])['distinct'] == 1.0
+
+
+@pytest.mark.parametrize('distribution', ['uniform', 'sorted', 'reversed',
+                                          'few_unique', 'sawtooth'])
+def test_classify(distribution):
+    array = make_array(distribution, 10000, integers=True)
+    assert classify(input_stats(array)) == distribution
+
+
+def test_classify_zipf():
+    array = make_array('zipf', 10000)
+    assert classify(input_stats(array)) in ('zipf', 'few_unique')
+
+
+def test_calibrate_and_choose():
+    thresholds = calibrate(sizes=(10, 300), repeat=1, path=None,
+                           isolate=False)
+    rankings = thresholds['rankings']
+    assert set(rankings) == {'int', 'float'}
+    for size, names in rankings['float']['uniform']:
+        assert size in (10, 300)
+        assert 'count_sort' not in names
+
+    # the first applicable sort of the ranking is chosen
+    rankings['float']['uniform'] = [[10, ['sample_sort', 'merge_sort']],
+                                    [300, ['quick_sort_3way']]]
+    rankings['int']['uniform'] = [[10, ['count_sort', 'insert_sort_opt']]]
+    floats = make_array('uniform', 100)
+    assert choose_sort(floats, thresholds) in ('sample_sort', 'merge_sort')
+    assert choose_sort(make_array('uniform', 400), thresholds) == \
+        'quick_sort_3way'
+    assert choose_sort(make_array('uniform', 100, integers=True),
+                       thresholds) == 'count_sort'
+    wide = make_array('uniform', 100, integers=True) + [10 ** 12]
+    assert choose_sort(wide, thresholds) == 'insert_sort_opt'
+
+
+def test_saved_thresholds():
+    thresholds = load_thresholds()
+    for kind in ('int', 'float'):
+        for distribution in ('uniform', 'sorted', 'reversed', 'few_unique',
+                             'zipf', 'sawtooth'):
+            for size, names in thresholds['rankings'][kind][distribution]:
+                assert set(names) <= set(CANDIDATES)
+
+
+@pytest.mark.parametrize('array', [
+    [],
+    [1],
+    [random.randint(-10, 10) for _ in range(50)],
+    [random.randint(-10 ** 9, 10 ** 9) for _ in range(3000)],
+    [random.random() for _ in range(3000)],
+    list(range(2000)),
+    list(range(2000, 0, -1)),
+    [random.choice('abcdef') * 3 for _ in range(500)],
+    [random.randint(0, 3) for _ in range(5000)] + [0.5],
+])
+def test_sort(array):
+    copy = array.copy()
+    assert sort(copy) is copy
+    assert copy == sorted(array)
+    assert choose_sort(array) in CANDIDATES
+
+
+@pytest.mark.parametrize('name', CANDIDATES)
+def test_sort_in_place_by_every_sort(name):
+    array = [random.randint(-1000, 1000) for _ in range(2000)]
+    copy = array.copy()
+    with patch('Algorithms.python_solutions.auto_sort.choose_sort',
+               return_value=name):
+        assert sort(copy) is copy
+    assert copy == sorted(array)
@@ -0,0 +1,77 @@
+import bisect
+import pytest
+import random
+
+from Algorithms.python_solutions.batch_search import \
+    NUMPY_OPT, batch_bin_search, batch_bisect, batch_lower_bound, \
+    batch_upper_bound
+from Algorithms.python_solutions.bin_search import bin_search
+from Algorithms.python_solutions.bounds import lower_bound, upper_bound
+
+
+arrays = [[], [7], sorted(random.randint(-50, 50) for _ in range(1000)),
+          sorted(random.uniform(-50, 50) for _ in range(300))]
+
+
+@pytest.mark.parametrize('array', arrays)
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_batch_bisect(array, backend):
+    queries = [random.randint(-60, 60) for _ in range(random.randint(0, 500))]
+    for right, built_in in ((False, bisect.bisect_left),
+                            (True, bisect.bisect_right)):
+        expected = [built_in(array, query) for query in queries]
+        places = batch_bisect(array, queries, right, backend=backend)
+        assert places.typecode == 'q'
+        assert list(places) == expected
+        queries.sort()
+        assert list(batch_bisect(array, queries, right, presorted=True,
+                                 backend=backend)) == \
+            [built_in(array, query) for query in queries]
+
+
+@pytest.mark.parametrize('array', arrays)
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_batch_bin_search(array, backend):
+    queries = [random.randint(-60, 60) for _ in range(200)]
+    found = batch_bin_search(array, queries, backend=backend)
+    assert found.typecode == 'B'
+    assert list(found) == [query in array for query in queries]
+    if array:
+        assert list(found) == [bin_search(array, query)
+                               for query in queries]
+
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_batch_bounds(backend):
+    array = sorted(random.randint(-10, 10) for _ in range(500))
+    # queries inside the array and not at its ends, where bounds.py
+    # finds the first and the last encounters
+    queries = [query for query in range(-10, 11)
+               if query in array and array[0] < query < array[-1]]
+    assert list(batch_lower_bound(array, queries, backend=backend)) == \
+        [lower_bound(array, query) for query in queries]
+    assert list(batch_upper_bound(array, queries, backend=backend)) == \
+        [upper_bound(array, query) for query in queries]
+    assert list(batch_upper_bound(array, [-20, 20], backend=backend)) == \
+        [-1, len(array) - 1]
+
+
+@pytest.mark.skipif(not NUMPY_OPT, reason='numpy is not installed')
+def test_numpy_arrays():
+    import numpy as np
+    array = np.sort(np.random.randint(-100, 100, 1000))
+    queries = np.random.randint(-120, 120, 300)
+    places = batch_lower_bound(array, queries, backend='numpy')
+    assert isinstance(places, np.ndarray)
+    assert places.tolist() == np.searchsorted(array, queries).tolist()
+    assert (batch_upper_bound(array, queries, backend='numpy') ==
+            np.searchsorted(array, queries, side='right') - 1).all()
+    assert batch_bin_search(array, queries, backend='numpy').tolist() == \
+        [query in array for query in queries]
+
+
+def test_backend_error():
+    with pytest.raises(ValueError):
+        batch_bisect([1, 2], [1], backend='c')
+    with pytest.raises(ValueError):
+        batch_bin_search([1, 2], [1], backend='c')
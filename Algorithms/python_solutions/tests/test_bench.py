@@ -0,0 +1,116 @@
+import json
+import pytest
+
+import Algorithms.python_solutions.bench.runner as runner
+
+from Algorithms.python_solutions.bench.__main__ import main
+from Algorithms.python_solutions.bench.distributions import \
+    DISTRIBUTIONS, make_array
+from Algorithms.python_solutions.bench.registry import SORTS
+from Algorithms.python_solutions.bench.runner import \
+    compare, load_results, measure, run_benchmarks, run_case, save_results
+
+
+@pytest.mark.parametrize('distribution', list(DISTRIBUTIONS))
+def test_distributions(distribution):
+    floats = make_array(distribution, 500, seed=1)
+    integers = make_array(distribution, 500, seed=1, integers=True)
+    assert len(floats) == len(integers) == 500
+    assert all(isinstance(x, float) for x in floats)
+    assert all(isinstance(x, int) for x in integers)
+    assert floats == make_array(distribution, 500, seed=1)
+    assert make_array(distribution, 0) == []
+
+    if distribution == 'sorted':
+        assert floats == sorted(floats)
+    elif distribution == 'reversed':
+        assert floats == sorted(floats, reverse=True)
+    elif distribution == 'few_unique':
+        assert len(set(floats)) <= 8
+
+    with pytest.raises(ValueError):
+        make_array('gaussian', 10)
+
+
+def test_registered_sorts_sort():
+    for name, case in SORTS.items():
+        array = make_array('zipf', 300, integers=case.integers)
+        assert case.function(array.copy(), **case.params) == sorted(array), \
+            f'{name} does not sort'
+
+
+def test_measure():
+    array = make_array('uniform', 1000)
+    result = measure(sorted, array, repeat=2)
+    assert len(result['times']) == 2
+    assert result['time'] == min(result['times'])
+    assert result['peak_rss'] > 0
+    assert result['rss_growth'] >= 0
+    assert array == make_array('uniform', 1000)
+
+
+def test_run_case_records_errors():
+    result = run_case('quick_sort_random', 'uniform', 100, repeat=1)
+    assert 'error' not in result and result['time'] >= 0
+
+    SORTS['broken'] = SORTS['heap_sort']._replace(params={'cool': True})
+    try:
+        result = run_case('broken', 'uniform', 100, repeat=1)
+    finally:
+        del SORTS['broken']
+    assert result['error'].startswith('TypeError')
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(['insert_sort', 'count_sort'],
+                             ['sorted', 'sawtooth'], [100, 6000],
+                             repeat=1, isolate=False)
+    cases = [(r['sort'], r['distribution'], r['size'])
+             for r in results['results']]
+    # insert_sort is not run on arrays bigger than its max_size
+    assert ('insert_sort', 'sorted', 6000) not in cases
+    assert ('count_sort', 'sawtooth', 6000) in cases
+    assert len(cases) == 6
+    assert results['meta']['sizes'] == [100, 6000]
+
+    isolated = run_benchmarks(['heap_sort'], ['uniform'], [100], repeat=1)
+    assert isolated['meta']['isolate'] is True
+    assert len(isolated['results']) == 1
+
+    with pytest.raises(ValueError):
+        run_benchmarks(['bogo_sort'])
+
+
+def test_compare(tmp_path):
+    baseline = run_benchmarks(['heap_sort'], ['uniform', 'zipf'], [200],
+                              repeat=1, isolate=False)
+    path = tmp_path / 'baseline.json'
+    save_results(baseline, path)
+    assert load_results(path) == json.loads(json.dumps(baseline))
+    assert compare(baseline, baseline) == []
+
+    current = json.loads(json.dumps(baseline))
+    current['results'][0]['time'] = baseline['results'][0]['time'] + 1
+    current['results'][1] = {**current['results'][1], 'error': 'Boom'}
+    current['results'].append({'sort': 'merge_sort', 'size': 1,
+                               'distribution': 'uniform', 'time': 9})
+    regressions = compare(current, baseline)
+    assert [r['metric'] for r in regressions] == ['time', 'error']
+    assert regressions[0]['ratio'] > 1
+
+
+def test_main(tmp_path, capsys, monkeypatch):
+    output = tmp_path / 'current.json'
+    arguments = ['sorts', '--sorts', 'merge_sort', '--distributions',
+                 'reversed', '--sizes', '300', '--repeat', '1',
+                 '--no-isolate']
+    assert main(arguments + ['--output', str(output)]) == 0
+    assert 'merge_sort' in capsys.readouterr().out
+
+    baseline = load_results(output)
+    baseline['results'][0]['time'] = 0
+    baseline['results'][0]['rss_growth'] = 0
+    save_results(baseline, output)
+    monkeypatch.setattr(runner, 'TIME_SLACK', 0)
+    assert main(arguments + ['--baseline', str(output)]) == 1
+    assert 'REGRESSION' in capsys.readouterr().out
@@ -0,0 +1,107 @@
+import pytest
+import random
+import tracemalloc
+
+from mock import patch
+
+from Algorithms.python_solutions.count_sort import \
+    MAX_CHUNKS, MEMORY_LIMIT, NUMPY_OPT, choose_count_strategy, \
+    count_sort
+
+
+def test_import_error_for_count_sort():
+    from importlib import reload
+    import Algorithms.python_solutions.count_sort as count_sort_module
+    array = [random.randint(-100, 100) for _ in range(1000)]
+    with patch.dict('sys.modules', {'numpy': None}):
+        reload(count_sort_module)
+        assert count_sort_module.NUMPY_OPT is False
+        assert count_sort_module.count_sort(array, backend='numpy') == \
+            sorted(array)
+    reload(count_sort_module)
+    assert count_sort_module.NUMPY_OPT is NUMPY_OPT
+
+
+@pytest.mark.skipif(not NUMPY_OPT, reason='numpy is not installed')
+def test_count_sort_numpy_backend():
+    import numpy as np
+    array = np.random.randint(-1000, 1000, size=10000, dtype=np.int32)
+    sorted_array = count_sort(array, backend='numpy')
+    assert isinstance(sorted_array, np.ndarray)
+    assert sorted_array.dtype == np.int32
+    assert np.array_equal(sorted_array, np.sort(array))
+
+    # floats are not truncated to whole numbers
+    with pytest.raises(ValueError):
+        count_sort(np.array([1.7, 0.2]), backend='numpy')
+    with pytest.raises(ValueError):
+        count_sort([1.5, 2], backend='numpy')
+    assert count_sort([2 ** 70, 1, 3], backend='numpy') == [1, 3, 2 ** 70]
+
+
+def test_choose_count_strategy():
+    assert choose_count_strategy([]) == 'dense'
+    assert choose_count_strategy(list(range(1000))) == 'dense'
+    outlier = list(range(1000)) + [10 ** 12]
+    assert choose_count_strategy(outlier) == 'sparse'
+    assert choose_count_strategy(outlier, memory_limit=1000) == \
+        'comparison'
+    # at most MAX_CHUNKS sub-ranges are counted one by one
+    near_outlier = list(range(1000)) + [125 * MAX_CHUNKS - 1]
+    assert choose_count_strategy(near_outlier, memory_limit=1000) == \
+        'chunked'
+    assert choose_count_strategy(near_outlier[:-1] + [125 * MAX_CHUNKS],
+                                 memory_limit=1000) == 'comparison'
+    # dense counters that fit are preferred over not fitting sparse ones
+    spread = list(range(0, 10 ** 5, 10))
+    assert choose_count_strategy(spread, memory_limit=10 ** 6) == 'dense'
+    # known bounds are taken as they are instead of scanning the array
+    assert choose_count_strategy(outlier, bounds=(0, 999)) == 'dense'
+
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+def test_count_sort_empty(backend):
+    assert count_sort([], backend) == []
+
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+@pytest.mark.parametrize('strategy', ['auto', 'dense', 'sparse', 'chunked',
+                                      'comparison'])
+def test_count_sort_strategies(backend, strategy):
+    array = [random.randint(-500, 500) for _ in range(2000)]
+    assert count_sort(array, backend, strategy, memory_limit=800) == \
+        sorted(array)
+
+
+def test_count_sort_memory_is_bounded():
+    array = [random.randint(0, 1000) for _ in range(1000)] + [10 ** 12]
+    for memory_limit in (MEMORY_LIMIT, 10 ** 4):
+        tracemalloc.start()
+        sorted_array = count_sort(array, memory_limit=memory_limit)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert sorted_array == sorted(array)
+        assert peak < 10 ** 6
+
+
+class IterationCounter(list):
+    """Counts the passes over a list."""
+
+    passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return super().__iter__()
+
+
+def test_count_sort_chunked_single_pass():
+    numbers = [random.randint(-10 ** 4, 10 ** 4) for _ in range(500)] + \
+        [10 ** 9, -10 ** 9, 10 ** 9]
+    array = IterationCounter(numbers)
+    # thousands of sub-ranges, most of them empty or with one number
+    assert count_sort(array, strategy='chunked', memory_limit=80) == \
+        sorted(numbers)
+    # min, max and the bucketing pass, independently of the sub-ranges
+    assert array.passes <= 3
+    assert count_sort(numbers, 'numpy', 'chunked', memory_limit=80) == \
+        sorted(numbers)
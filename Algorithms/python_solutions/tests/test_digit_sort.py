@@ -1,8 +1,12 @@
+import math
 import random
 import pytest
 
+from mock import patch
+
 from Algorithms.python_solutions.digit_sort \
-    import restore_to_nums, to_m_based
+    import NUMPY_OPT, digit_argsort, digit_sort_opt, float_keys, \
+    radix_sort, restore_floats, restore_to_nums, to_m_based
 
 
 @pytest.fixture()
@@ -22,3 +26,85 @@ def test_to_m_based_array(number):
 def test_restore_to_nums(number):
     assert restore_to_nums(to_m_based(number, base=6), 6) == number, \
         'restore to nums works wrong'
+
+
+def test_import_error_for_digit_sort_opt():
+    from importlib import reload
+    import Algorithms.python_solutions.digit_sort as digit_sort
+    array = [random.randint(-1000, 1000) for _ in range(1000)]
+    with patch.dict('sys.modules', {'numpy': None}):
+        reload(digit_sort)
+        assert digit_sort.NUMPY_OPT is False
+        assert digit_sort.digit_sort_opt(array, backend='numpy') == \
+            sorted(array)
+    reload(digit_sort)
+    assert digit_sort.NUMPY_OPT is NUMPY_OPT
+
+
+@pytest.mark.skipif(not NUMPY_OPT, reason='numpy is not installed')
+@pytest.mark.parametrize('base', [2, 10, 256, 70000])
+def test_digit_sort_opt_numpy_backend(base):
+    import numpy as np
+    array = np.random.randint(-10 ** 9, 10 ** 9, size=5000)
+    sorted_array = digit_sort_opt(array, base, backend='numpy')
+    assert isinstance(sorted_array, np.ndarray)
+    assert np.array_equal(sorted_array, np.sort(array))
+    assert digit_sort_opt(array.tolist(), base) == sorted(array.tolist())
+
+    big_numbers = [2 ** 70, 3, 2 ** 65]
+    assert digit_sort_opt(big_numbers, base, backend='numpy') == \
+        sorted(big_numbers)
+
+
+def test_float_keys_keep_order():
+    floats = sorted([random.uniform(-1, 1) * 10 ** random.randint(-300, 300)
+                     for _ in range(1000)] +
+                    [math.inf, -math.inf, 0.0, 5e-324, -5e-324])
+    keys = float_keys(floats)
+    assert list(keys) == sorted(keys)
+    assert restore_floats(keys) == floats
+
+
+@pytest.mark.parametrize('digit_bits', [1, 5, 8, 16])
+def test_radix_sort(digit_bits):
+    integers = [random.randint(-10 ** 12, 10 ** 12) for _ in range(2000)]
+    assert radix_sort(integers, digit_bits) == sorted(integers)
+
+    floats = [random.uniform(-10 ** 6, 10 ** 6) for _ in range(2000)]
+    assert radix_sort(floats, digit_bits) == sorted(floats)
+
+    # passes over digits shared by all numbers are skipped
+    shared_digits = [random.randint(0, 255) << 40 | 0xABCDEF
+                     for _ in range(2000)]
+    assert radix_sort(shared_digits, digit_bits) == sorted(shared_digits)
+
+
+def test_radix_sort_edge_cases():
+    assert radix_sort([]) == []
+    assert radix_sort([7] * 5) == [7] * 5
+    assert radix_sort([2, -1.5, 0]) == [-1.5, 0.0, 2.0]
+    assert radix_sort([True, False, 2]) == [False, True, 2]
+    with pytest.raises(ValueError):
+        radix_sort([2, 1], 17)
+    with pytest.raises(ValueError):
+        radix_sort([2, 1], 8.0)
+
+
+@pytest.mark.skipif(not NUMPY_OPT, reason='numpy is not installed')
+def test_radix_sort_numpy_integers():
+    import numpy as np
+    array = np.array([5, 3, 2 ** 60 + 1, 2 ** 60, -2 ** 60], dtype=np.int64)
+    expected = sorted(array.tolist())
+    for result in (radix_sort(array, 4), digit_sort_opt(array, base=16)):
+        assert result == expected
+        assert all(type(number) is int for number in result)
+    assert radix_sort(array, 4, key=lambda number: number) == expected
+
+
+@pytest.mark.parametrize('backend', ['python', 'numpy'])
+@pytest.mark.parametrize('base', [10, 1000, 256])
+def test_digit_sort_opt_extreme_range(backend, base):
+    array = [2 ** 63 - 1, -2 ** 63, 0, 5, -7]
+    assert digit_sort_opt(array, base, backend=backend) == sorted(array)
+    assert list(digit_argsort(array, base, backend=backend)) == \
+        [1, 4, 2, 3, 0]
@@ -0,0 +1,50 @@
+import os
+import pytest
+import random
+
+from Algorithms.python_solutions.external_sort import \
+    MIN_BUFFER_SIZE, external_sort, external_sort_file, read_items, \
+    write_items
+
+
+@pytest.mark.parametrize('algorithm', ['merge', 'quick'])
+@pytest.mark.parametrize('memory_limit', [8 * MIN_BUFFER_SIZE, 2**20])
+def test_external_sort_iterable(algorithm, memory_limit):
+    array = [random.uniform(-1000, 1000) for _ in range(20000)]
+    developed = external_sort(iter(array), memory_limit=memory_limit,
+                              algorithm=algorithm)
+    assert list(developed) == sorted(array)
+
+
+def test_external_sort_records():
+    records = [(random.randint(-10, 10), random.uniform(-1, 1))
+               for _ in range(5000)]
+    developed = external_sort(records, record_format='<qd',
+                              memory_limit=8 * MIN_BUFFER_SIZE)
+    assert list(developed) == sorted(records)
+
+
+def test_external_sort_file(tmp_path):
+    array = [random.randint(-10**15, 10**15) for _ in range(30000)]
+    input_path = os.path.join(tmp_path, 'input.bin')
+    output_path = os.path.join(tmp_path, 'output.bin')
+    with open(input_path, 'wb') as file:
+        write_items(file, array, typecode='q')
+
+    written = external_sort_file(input_path, output_path, typecode='q',
+                                 memory_limit=8 * MIN_BUFFER_SIZE,
+                                 temp_dir=tmp_path)
+    assert written == len(array)
+    assert list(read_items(output_path, typecode='q')) == sorted(array)
+    # temporary runs are removed
+    assert sorted(os.listdir(tmp_path)) == ['input.bin', 'output.bin']
+
+    with pytest.raises(ValueError):
+        external_sort_file(input_path, input_path, typecode='q')
+
+
+@pytest.mark.parametrize('params', [{'algorithm': 'bubble'},
+                                    {'memory_limit': MIN_BUFFER_SIZE}])
+def test_external_sort_errors(params):
+    with pytest.raises(ValueError):
+        external_sort([3, 2, 1], **params)
@@ -0,0 +1,54 @@
+import bisect
+import pytest
+import random
+
+from Algorithms.python_solutions.bounds import lower_bound, upper_bound
+from Algorithms.python_solutions.eytzinger import StaticSearchIndex
+
+
+layouts = [('eytzinger', 16), ('blocked', 1), ('blocked', 3),
+           ('blocked', 16)]
+
+
+@pytest.mark.parametrize('layout, block_size', layouts)
+@pytest.mark.parametrize('size', [0, 1, 2, 15, 16, 17, 100,
+                                  random.randint(200, 2000)])
+def test_bounds_match_bisect(layout, block_size, size):
+    array = sorted(random.randint(0, size // 2 + 1) for _ in range(size))
+    index = StaticSearchIndex(array, layout, block_size)
+    assert len(index) == size
+    for value in [-1, -0.5, size // 4 + 0.5] + list(range(size // 2 + 3)):
+        assert index.lower_bound(value) == bisect.bisect_left(array, value)
+        assert index.upper_bound(value) == \
+            bisect.bisect_right(array, value) - 1
+        assert index.contains(value) == (value in array)
+        assert (value in index) == (value in array)
+
+
+@pytest.mark.parametrize('layout, block_size', layouts)
+def test_bounds_match_bounds_module(layout, block_size):
+    array = sorted(random.randint(-10, 10) for _ in range(1000))
+    index = StaticSearchIndex(array, layout, block_size)
+    # present values away from the ends, where bounds.py finds
+    # the first and the last encounters
+    for value in set(array) - {array[0], array[-1]}:
+        assert index.lower_bound(value) == lower_bound(array, value)
+        assert index.upper_bound(value) == upper_bound(array, value)
+
+
+def test_key_storage():
+    assert StaticSearchIndex([1, 2, 3]).keys.typecode == 'q'
+    assert StaticSearchIndex([0.5, 1.5], 'blocked').keys.typecode == 'd'
+    index = StaticSearchIndex(['a', 'b', 'b', 'c'], 'blocked', 2)
+    assert isinstance(index.keys, list)
+    assert index.lower_bound('b') == 1 and index.upper_bound('b') == 2
+    assert StaticSearchIndex([1, 1 << 70]).lower_bound(2) == 1
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        StaticSearchIndex([2, 1])
+    with pytest.raises(ValueError):
+        StaticSearchIndex([1, 2], layout='btree')
+    with pytest.raises(ValueError):
+        StaticSearchIndex([1, 2], 'blocked', 0)
@@ -2,7 +2,8 @@ import random
 import logging
 import pytest
 
-from Algorithms.python_solutions.heap import Heap, heap_sort
+from Algorithms.python_solutions.heap import \
+    Heap, heap_sort, heap_sort_range, heapify, top_k
 
 
 def test_can_create_heap():
@@ -54,3 +55,78 @@ def test_heap_sort():
 def test_repr():
     h = Heap(elements=[random.uniform(-100, 100) for _ in range(40)])
     logging.info(h)
+
+
+def test_alternating_insert_and_remove():
+    h = Heap(elements=[random.uniform(-100, 100) for _ in range(10)])
+    for _ in range(100):
+        h.insert(h.remove_min() + random.uniform(0, 100))
+    assert h.size == 10
+    drained = [h.remove_min() for _ in range(10)]
+    assert drained == sorted(drained)
+
+
+def test_heap_sort_range():
+    for _ in range(100):
+        array = [random.randint(-10, 10) for _ in range(random.randint(0, 50))]
+        left = random.randint(0, len(array))
+        right = random.randint(left, len(array))
+        array_copy = array.copy()
+        heap_sort_range(array, left, right)
+        assert array == array_copy[:left] + \
+            sorted(array_copy[left:right]) + array_copy[right:]
+
+
+@pytest.mark.parametrize('array', [
+    [], [1], [2, 1], [1, 1, 1], list(range(50)), list(range(50, 0, -1)),
+    [random.randint(-5, 5) for _ in range(200)]])
+def test_heap_sort_in_place(array):
+    array_copy = array.copy()
+    assert heap_sort(array) is array
+    assert array == sorted(array_copy)
+
+
+def test_heapify():
+    for _ in range(50):
+        array = [random.randint(-20, 20)
+                 for _ in range(random.randint(0, 40))]
+        heap = array.copy()
+        heapify(heap)
+        assert sorted(heap) == sorted(array)
+        for i in range(1, len(heap)):
+            assert heap[(i - 1) // 2] <= heap[i]
+
+
+def test_from_iterable():
+    elements = [random.uniform(-100, 100) for _ in range(100)]
+    h = Heap.from_iterable(iter(elements))
+    assert h.size == 100
+    assert h.height() == 7
+    assert [h.remove_min() for _ in range(100)] == sorted(elements)
+    h = Heap.from_iterable([])
+    assert h.size == 0
+    h.insert(1.5)
+    assert h.remove_min() == 1.5
+
+
+def test_constructor_copies_elements():
+    elements = [3, 1, 2]
+    h = Heap(elements=elements)
+    assert elements == [3, 1, 2]
+    h.insert(0)
+    assert [h.erase() for _ in range(4)] == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize('k', [0, 1, 5, 100, 150])
+def test_top_k(k):
+    array = [random.randint(-20, 20) for _ in range(100)]
+    assert top_k(array, k) == sorted(array)[:k]
+    assert top_k(iter(array), k, largest=True) == \
+        sorted(array, reverse=True)[:k]
+
+    # equal keys keep the order of the stream and items are not compared
+    pairs = [(number % 7, {}) for number in array]
+    assert top_k(pairs, k, key=lambda pair: pair[0]) == \
+        sorted(pairs, key=lambda pair: pair[0])[:k]
+    assert top_k(pairs, k, key=lambda pair: pair[0], largest=True) == \
+        sorted(pairs, key=lambda pair: pair[0], reverse=True)[:k]
@@ -1,3 +1,4 @@
+import pytest
 import random
 
 from mock import patch
@@ -26,3 +27,16 @@ def test_quick_sort_median_of_medians():
     array_copy = array.copy()
     quick_sorted_array = quick_sort.quick_sort(array, 'mm')
     assert sorted(array_copy) == quick_sorted_array
+
+
+@pytest.mark.parametrize('array', [list(range(3000)),
+                                   list(range(3000, 0, -1)),
+                                   [1] * 3000,
+                                   list(range(1500)) + list(range(1500, 0, -1))
+                                   ])
+@pytest.mark.parametrize('no_recursion', [False, True])
+def test_intro_sort_adversarial(array, no_recursion):
+    from Algorithms.python_solutions.quick_sort import intro_sort
+    array_copy = array.copy()
+    assert intro_sort(array, 0, len(array), no_recursion=no_recursion,
+                      cutoff=2) == sorted(array_copy)
@@ -0,0 +1,80 @@
+import pytest
+import random
+
+from array import array as typed_array
+from operator import itemgetter
+
+from Algorithms.python_solutions.kway_merge import \
+    co_rank, kway_merge, loser_tree_merge
+from Algorithms.python_solutions.merge_sort import MergeSortPool
+
+
+def random_runs(count, max_length, reverse=False):
+    # (key, run, position) records show the order of equal keys
+    return [sorted([(random.randint(0, 5), run, position)
+                    for position in range(random.randint(0, max_length))],
+                   key=itemgetter(0), reverse=reverse)
+            for run in range(count)]
+
+
+def test_loser_tree_merge():
+    runs = [[1, 4, 7], [], typed_array('q', [2, 5]), iter([0, 3, 6, 8])]
+    assert list(loser_tree_merge(runs)) == list(range(9))
+    assert list(loser_tree_merge([])) == []
+    assert list(loser_tree_merge([iter([1, 2])])) == [1, 2]
+    assert list(loser_tree_merge([[], []])) == []
+
+
+@pytest.mark.parametrize('count', [2, 3, 5, 8, 13])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_loser_tree_merge_is_stable(count, reverse):
+    runs = random_runs(count, 50, reverse)
+    developed = loser_tree_merge(map(iter, runs), key=itemgetter(0),
+                                 reverse=reverse)
+    built_in = sorted([record for run in runs for record in run],
+                      key=itemgetter(0), reverse=reverse)
+    assert list(developed) == built_in
+
+
+def test_loser_tree_merge_is_lazy():
+    def endless(start):
+        while True:
+            yield start
+            start += 2
+
+    merged = loser_tree_merge([endless(0), endless(1)])
+    assert [next(merged) for _ in range(10)] == list(range(10))
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_co_rank(reverse):
+    for _ in range(20):
+        runs = random_runs(random.randint(1, 5), 10, reverse)
+        merged = list(loser_tree_merge(runs, itemgetter(0), reverse))
+        for rank in range(-1, len(merged) + 2):
+            positions = co_rank(runs, rank, itemgetter(0), reverse)
+            prefixes = [run[:position]
+                        for run, position in zip(runs, positions)]
+            assert list(loser_tree_merge(prefixes, itemgetter(0),
+                                         reverse)) == \
+                merged[:max(rank, 0)]
+
+
+def test_kway_merge_parallel():
+    runs = [sorted(random.uniform(-100, 100)
+                   for _ in range(random.randint(0, 3000)))
+            for _ in range(6)]
+    built_in = sorted([number for run in runs for number in run])
+    assert list(kway_merge(runs)) == built_in
+    assert list(kway_merge(runs, parallel=True, max_workers=3)) == built_in
+    with MergeSortPool(max_workers=2) as pool:
+        assert list(kway_merge(runs, parallel=True, pool=pool)) == built_in
+
+    runs = random_runs(4, 500)
+    assert list(kway_merge(runs, key=itemgetter(0), parallel=True,
+                           max_workers=2)) == \
+        sorted([record for run in runs for record in run],
+               key=itemgetter(0))
+
+    with pytest.raises(TypeError):
+        kway_merge([iter([1, 2])], parallel=True)
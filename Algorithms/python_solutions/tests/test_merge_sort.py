@@ -1,5 +1,15 @@
+import bisect
+import pytest
+import random
+
 from mock import patch
 
+from array import array as typed_array
+
+from Algorithms.python_solutions.merge_sort import \
+    MergeSortPool, gallop, gallop_merge, k_way_merge, merge_runs, \
+    merge_sort_parallel, shared_memory_sort
+
 
 def test_import_error_for_merge():
     with patch.dict('sys.modules',
@@ -20,3 +30,80 @@ def test_merge_sort_easy_merge():
     array_copy = array.copy()
     merge_sorted_array = merge_sort.merge_sort(array)
     assert sorted(array_copy) == merge_sorted_array
+
+
+def test_merge_sort_pool():
+    with MergeSortPool(max_workers=2, batch_size=10) as pool:
+        for size in (0, 1, 7, 1001):
+            array = [random.uniform(-100, 100) for _ in range(size)]
+            array_copy = array.copy()
+            assert merge_sort_parallel(array, pool=pool) == \
+                sorted(array_copy)
+            assert array == sorted(array_copy)
+
+    with pytest.raises(RuntimeError):
+        pool.sort([3, 2, 1])
+    pool.close()
+
+
+def test_k_way_merge():
+    parts = [[1, 4, 7], [], [2, 5], [0, 3, 6, 8]]
+    array = [None] * 9
+    k_way_merge(array, parts)
+    assert array == list(range(9))
+
+
+@pytest.mark.parametrize('typecode, generate',
+                         [('d', lambda: random.uniform(-100, 100)),
+                          ('q', lambda: random.randint(-10**12, 10**12))])
+def test_shared_memory_sort(typecode, generate):
+    array = [generate() for _ in range(1001)]
+    buffer = typed_array(typecode, array)
+    view = memoryview(typed_array(typecode, array))
+
+    assert shared_memory_sort(array.copy(), max_workers=3) == sorted(array)
+    shared_memory_sort(buffer, algorithm='quick', max_workers=2)
+    assert buffer.tolist() == sorted(array)
+    with MergeSortPool(max_workers=2) as pool:
+        shared_memory_sort(view, pool=pool)
+    assert view.tolist() == sorted(array)
+
+    with pytest.raises(ValueError):
+        shared_memory_sort(array, algorithm='bubble')
+
+
+def test_merge_runs():
+    source = [(1, 'a'), (3, 'a'), (5, 'a'), (1, 'b'), (3, 'b'), (4, 'b')]
+    target = [None] * 6
+    merge_runs(target, source, 0, 3, 6)
+    assert target == sorted(source, key=lambda x: x[0])
+
+    # the second run is empty or already in place
+    merge_runs(target, source, 0, 6, 6)
+    assert target == source
+    merge_runs(target, [1, 2, 3, 4], 0, 2, 4)
+    assert target[:4] == [1, 2, 3, 4]
+
+
+def test_gallop():
+    array = [0, 1, 1, 1, 2, 3, 5, 8, 13, 21]
+    for value in range(-1, 23):
+        for start in range(len(array)):
+            assert gallop(array, value, start, len(array)) == \
+                bisect.bisect_left(array, value, start)
+            assert gallop(array, value, start, len(array), right=True) == \
+                bisect.bisect_right(array, value, start)
+
+
+@pytest.mark.parametrize('min_gallop', [1, 3, 7])
+def test_gallop_merge(min_gallop):
+    # pairs are compared by the first element only to check stability
+    class Pair(tuple):
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+    left = sorted(Pair((random.randint(0, 20), 'a')) for _ in range(100))
+    right = sorted(Pair((random.randint(0, 20), 'b')) for _ in range(50))
+    array = left + right
+    gallop_merge(array, 0, len(left), len(array), min_gallop=min_gallop)
+    assert array == sorted(left + right, key=lambda x: x[0])
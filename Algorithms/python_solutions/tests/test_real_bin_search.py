@@ -1,5 +1,9 @@
+import math
 import pytest
-from Algorithms.python_solutions.real_bin_search import real_bin_search
+import random
+
+from Algorithms.python_solutions.real_bin_search import \
+    batch_real_bin_search, real_bin_search
 
 
 def test_real_bin_search_desc():
@@ -24,3 +28,44 @@ def test_search_raises_error_when_result_behind_edges_when_check_enabled():
     def func(x): return x*x
     with pytest.raises(Exception):
         real_bin_search(func, 16, -3, 3, check=True)
+
+
+@pytest.mark.parametrize('func, left_edge, right_edge',
+                         [(lambda x: math.atan(x) + x / 10, -100, 100),
+                          (lambda x: -x ** 3, -10, 10)])
+def test_batch_real_bin_search(func, left_edge, right_edge):
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return func(x)
+
+    targets = [func(random.uniform(left_edge, right_edge))
+               for _ in range(300)]
+    targets += targets[:10]
+    single = [real_bin_search(counted, target, left_edge, right_edge)
+              for target in targets]
+    single_calls = len(calls)
+
+    calls.clear()
+    cache = {}
+    results = batch_real_bin_search(counted, targets, left_edge,
+                                    right_edge, cache=cache)
+    # every target takes the same path as alone
+    assert results == single
+    assert len(calls) == len(cache) == len(set(calls))
+    assert len(calls) < single_calls * 0.8
+
+    calls.clear()
+    assert batch_real_bin_search(counted, targets[::-1], left_edge,
+                                 right_edge, cache=cache) == single[::-1]
+    assert calls == []
+    assert batch_real_bin_search(counted, [], left_edge, right_edge) == []
+
+
+def test_batch_search_with_check():
+    def func(x): return x*x
+    results = batch_real_bin_search(func, [16, 1], 0, 100, check=True)
+    assert abs(results[0] - 4) < 1e-6 and abs(results[1] - 1) < 1e-6
+    with pytest.raises(KeyError):
+        batch_real_bin_search(func, [4, 16], -3, 3, check=True)
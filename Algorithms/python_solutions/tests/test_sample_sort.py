@@ -0,0 +1,60 @@
+import pytest
+import random
+
+from Algorithms.python_solutions.merge_sort import MergeSortPool
+from Algorithms.python_solutions.sample_sort import \
+    bucketize, choose_splitters, sample_sort
+
+
+def test_choose_splitters():
+    array = list(range(1000))
+    random.shuffle(array)
+    splitters = choose_splitters(array, 4)
+    assert 0 < len(splitters) <= 3
+    assert splitters == sorted(set(splitters))
+    assert choose_splitters(array, 1) == []
+    assert choose_splitters([], 4) == []
+    assert choose_splitters([7] * 100, 4) == [7]
+
+
+def test_bucketize():
+    array = [random.randint(-50, 50) for _ in range(500)]
+    splitters = [-10, 0, 25]
+    buckets = bucketize(array, splitters)
+    assert len(buckets) == 4
+    assert sorted(array) == sorted(x for bucket in buckets for x in bucket)
+    bounds = [float('-inf')] + splitters + [float('inf')]
+    for i, bucket in enumerate(buckets):
+        assert all(bounds[i] <= x < bounds[i + 1] for x in bucket)
+
+
+def test_sample_sort():
+    array = [random.random() for _ in range(3000)]
+    assert sample_sort(array.copy(), max_workers=3) == sorted(array)
+    assert sample_sort(array.copy(), max_workers=2,
+                       algorithm='merge') == sorted(array)
+
+    few_unique = [random.randint(0, 2) for _ in range(3000)]
+    assert sample_sort(few_unique.copy(), max_workers=4) == \
+        sorted(few_unique)
+
+    small = [3, 1, 2]
+    assert sample_sort(small) is small
+    assert small == [1, 2, 3]
+
+
+def test_sample_sort_with_pool():
+    with MergeSortPool(max_workers=2) as pool:
+        for _ in range(3):
+            array = [random.randint(-10**6, 10**6) for _ in range(2500)]
+            assert sample_sort(array.copy(), pool=pool) == sorted(array)
+
+
+def test_sample_sort_errors():
+    with pytest.raises(ValueError):
+        sample_sort([2, 1], algorithm='heap')
+
+    pool = MergeSortPool(max_workers=1)
+    pool.close()
+    with pytest.raises(RuntimeError):
+        sample_sort(list(range(2000)), pool=pool)
@@ -0,0 +1,120 @@
+import bisect
+import pytest
+import random
+
+from Algorithms.python_solutions.sorted_list import SortedList
+
+
+# small loads make the blocks split and join often
+loads = [4, 7, 64]
+
+
+@pytest.mark.parametrize('load', loads)
+def test_init_and_update(load):
+    data = [random.randint(-100, 100) for _ in range(random.randint(0, 500))]
+    sorted_list = SortedList(data, load=load)
+    assert list(sorted_list) == sorted(data)
+    assert len(sorted_list) == len(data)
+    more = [random.randint(-100, 100) for _ in range(random.randint(0, 50))]
+    sorted_list.update(more)
+    assert list(sorted_list) == sorted(data + more)
+    sorted_list.update([5])
+    assert list(sorted_list) == sorted(data + more + [5])
+    assert list(reversed(sorted_list)) == sorted(data + more + [5])[::-1]
+    assert all(0 < len(block) <= 2 * load for block in sorted_list.blocks)
+
+
+@pytest.mark.parametrize('load', loads)
+def test_random_operations(load):
+    sorted_list = SortedList(load=load)
+    reference = []
+    for _ in range(3000):
+        value = random.randint(0, 200)
+        operation = random.random()
+        if operation < 0.55:
+            sorted_list.insert(value)
+            bisect.insort_right(reference, value)
+        elif operation < 0.8:
+            if value in reference:
+                sorted_list.remove(value)
+                reference.remove(value)
+            else:
+                with pytest.raises(ValueError):
+                    sorted_list.remove(value)
+                sorted_list.discard(value)
+        elif reference:
+            index = random.randint(-len(reference), len(reference) - 1)
+            assert sorted_list.pop(index) == reference.pop(index)
+    assert list(sorted_list) == reference
+    assert sorted_list.maxes == [block[-1] for block in sorted_list.blocks]
+    assert all(sorted_list[index] == reference[index]
+               for index in range(-len(reference), len(reference)))
+
+
+def test_search():
+    data = [random.randint(0, 100) for _ in range(2000)]
+    sorted_list = SortedList(data, load=16)
+    data.sort()
+    for value in range(-2, 103):
+        assert sorted_list.bisect_left(value) == \
+            bisect.bisect_left(data, value)
+        assert sorted_list.bisect_right(value) == \
+            bisect.bisect_right(data, value)
+        assert sorted_list.count(value) == data.count(value)
+        assert (value in sorted_list) == (value in data)
+        if value in data:
+            assert sorted_list.index_of(value) == data.index(value)
+        else:
+            with pytest.raises(ValueError):
+                sorted_list.index_of(value)
+
+
+def test_ranges():
+    data = [random.randint(0, 100) for _ in range(1000)]
+    sorted_list = SortedList(data, load=8)
+    data.sort()
+    for start, stop in [(None, None), (0, 10), (5, -5), (-20, None),
+                        (30, 10), (990, 2000)]:
+        assert list(sorted_list.islice(start, stop)) == data[start:stop]
+        assert sorted_list[start:stop] == data[start:stop]
+    assert sorted_list[::3] == data[::3]
+    assert list(sorted_list.irange(20, 40)) == \
+        [value for value in data if 20 <= value <= 40]
+    assert list(sorted_list.irange(20, 40, (False, False))) == \
+        [value for value in data if 20 < value < 40]
+    assert list(sorted_list.irange(maximum=10)) == \
+        [value for value in data if value <= 10]
+    assert list(sorted_list.irange(minimum=90)) == \
+        [value for value in data if value >= 90]
+
+
+def test_stability():
+    sorted_list = SortedList(load=4)
+    pairs = [(random.randint(0, 5), index) for index in range(100)]
+    for pair in pairs:
+        sorted_list.insert(Key(pair))
+    assert [key.pair for key in sorted_list] == \
+        sorted(pairs, key=lambda pair: pair[0])
+
+
+class Key:
+    """Compares by the first item of the pair only."""
+
+    def __init__(self, pair):
+        self.pair = pair
+
+    def __lt__(self, other):
+        return self.pair[0] < other.pair[0]
+
+
+def test_errors():
+    sorted_list = SortedList()
+    with pytest.raises(IndexError):
+        sorted_list[0]
+    with pytest.raises(IndexError):
+        sorted_list.pop()
+    with pytest.raises(ValueError):
+        sorted_list.remove(1)
+    with pytest.raises(ValueError):
+        SortedList(load=2)
+    assert repr(SortedList([3, 1, 2])) == 'SortedList([1, 2, 3])'
@@ -3,17 +3,25 @@ import math
 import logging
 import pytest
 import random
+
+from array import array as typed_array
+from itertools import islice
 # import better view function for 2dim arrays
 from Algorithms.python_solutions.matrix_view import Matrix2dim
 # import sorting algorithms
 from Algorithms.python_solutions.array_count_sort import array_count_sort
-from Algorithms.python_solutions.count_sort import count_sort
+from Algorithms.python_solutions.count_sort import count_argsort, count_sort
+from Algorithms.python_solutions.heap import heap_sort
 from Algorithms.python_solutions.insert_sort \
     import insert_sort, insert_sort_opt
 from Algorithms.python_solutions.merge_sort \
-    import merge_sort, merge_sort_parallel
-from Algorithms.python_solutions.quick_sort import quick_sort
-from Algorithms.python_solutions.digit_sort import digit_sort, digit_sort_opt
+    import merge_argsort, merge_sort, merge_sort_parallel
+from Algorithms.python_solutions.quick_sort \
+    import lazy_sorted, quick_argsort, quick_sort
+from Algorithms.python_solutions.sort_keys import reorder
+from Algorithms.python_solutions.sample_sort import sample_sort
+from Algorithms.python_solutions.digit_sort \
+    import digit_argsort, digit_sort, digit_sort_opt, radix_sort
 from Algorithms.python_solutions.two_dim_array_count_sort \
     import two_dim_array_count_sort
 # import searching algorithms
@@ -88,6 +96,36 @@ num_range = (-10, 10)
                              size_of_1_dim_range=(1, 1)),
                            {'opt': False}, {}),
 
+                          (merge_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                           {'no_recursion': True}, {}),
+
+                          (merge_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'opt': False, 'no_recursion': True}, {}),
+
+                          (merge_sort, [0], {'no_recursion': True}, {}),
+
+                          (merge_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                           {'adaptive': True}, {}),
+
+                          (merge_sort,
+                           sorted(random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000))) +
+                           sorted(random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                             reverse=True),
+                           {'adaptive': True}, {}),
+
                           (merge_sort_parallel,
                            random_1_dim_array(
                              elts_range=num_range,
@@ -96,6 +134,12 @@ num_range = (-10, 10)
 
                           (merge_sort_parallel, [0], {}, {}),
 
+                          (merge_sort_parallel,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(32, 100)),
+                           {'shared_memory': True}, {}),
+
                           (merge_sort,
                            random_1_dim_array(
                              elts_range=num_range,
@@ -163,6 +207,64 @@ num_range = (-10, 10)
 
                           (quick_sort, [], {}, {}),
 
+                          (quick_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                           {'pivot_str': 'intro'}, {}),
+
+                          (quick_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                           {'pivot_str': 'intro', 'no_recursion': True}, {}),
+
+                          (quick_sort, [0], {'pivot_str': 'intro'}, {}),
+
+                          (quick_sort,
+                           whole_1_dim_array(
+                             elts_range=(0, 3),
+                             size_of_1_dim_range=(101, 1000)),
+                           {'partition': '3way'}, {}),
+
+                          (quick_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'partition': '3way', 'pivot_str': 'm3',
+                            'no_recursion': True}, {}),
+
+                          (quick_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=(101, 1000)),
+                           {'partition': 'dual_pivot'}, {}),
+
+                          (quick_sort,
+                           whole_1_dim_array(
+                             elts_range=(0, 3),
+                             size_of_1_dim_range=test_size_range),
+                           {'partition': 'dual_pivot',
+                            'no_recursion': True}, {}),
+
+                          (quick_sort,
+                           [str(i) for i in whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range)],
+                           {'partition': '3way'}, {}),
+
+                          (quick_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'shared_memory': True, 'max_workers': 3}, {}),
+
+                          (sample_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'max_workers': 3, 'batch_size': 10}, {}),
+
                           (two_dim_array_count_sort,
                            whole_2_dim_array(
                              elts_range=num_range,
@@ -191,6 +293,18 @@ num_range = (-10, 10)
                              size_of_1_dim_range=test_size_range),
                            {}, {}),
 
+                          (count_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'backend': 'numpy'}, {}),
+
+                          (count_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'strategy': 'chunked', 'memory_limit': 40}, {}),
+
                           (digit_sort,
                            whole_1_dim_array(
                              elts_range=num_range,
@@ -201,7 +315,31 @@ num_range = (-10, 10)
                            whole_1_dim_array(
                              elts_range=num_range,
                              size_of_1_dim_range=test_size_range),
-                           {'base': 16}, {})
+                           {'base': 16}, {}),
+
+                          (digit_sort_opt,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'base': 2, 'backend': 'numpy'}, {}),
+
+                          (digit_sort_opt,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'base': 10}, {}),
+
+                          (radix_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'digit_bits': 16}, {}),
+
+                          (radix_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {}, {})
                          ])
 def test_sorts(function, array, params, sorted_params):
     array_copy = array.copy()
@@ -224,6 +362,105 @@ def test_sorts(function, array, params, sorted_params):
                           f'{developed}')
 
 
+@pytest.mark.parametrize('function, params',
+                         [(insert_sort, {}), (insert_sort_opt, {}),
+                          (merge_sort, {}), (merge_sort, {'opt': False}),
+                          (merge_sort, {'no_recursion': True}),
+                          (merge_sort, {'adaptive': True}),
+                          (quick_sort, {}), (quick_sort, {'pivot_str': 'm3'}),
+                          (quick_sort, {'pivot_str': 'intro'}),
+                          (quick_sort, {'partition': '3way'}),
+                          (quick_sort, {'partition': 'dual_pivot'}),
+                          (heap_sort, {}), (digit_sort, {}),
+                          (digit_sort_opt, {}),
+                          (digit_sort_opt, {'base': 256}),
+                          (digit_sort_opt, {'backend': 'numpy'}),
+                          (radix_sort, {}), (radix_sort, {'digit_bits': 3})])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_sorts_with_key(function, params, reverse):
+    records = [(random.randint(-10, 10), random.random())
+               for _ in range(random.randint(0, 200))]
+    calls = []
+
+    def key(record):
+        calls.append(record)
+        return record[0]
+
+    developed = function(records.copy(), key=key, reverse=reverse, **params)
+    assert len(calls) == len(records)
+    # equal keys keep their order, as the built-in sort is stable
+    assert developed == sorted(records, key=key, reverse=reverse)
+
+    numbers = [number for number, _ in records] + [0]
+    assert list(function(numbers.copy(), reverse=reverse, **params)) == \
+        sorted(numbers, reverse=reverse)
+
+
+@pytest.mark.parametrize('function, params',
+                         [(insert_sort, {}), (insert_sort_opt, {}),
+                          (merge_sort, {}), (merge_sort, {'opt': False}),
+                          (merge_sort, {'no_recursion': True}),
+                          (merge_sort, {'adaptive': True})])
+def test_stability(function, params):
+    # equal numbers of different types show the order of equal elements
+    array = random.choices([0, 0.0, False, 1, 1.0, True], k=200)
+    for reverse in (False, True):
+        developed = function(array.copy(), reverse=reverse, **params)
+        assert list(map(type, developed)) == \
+            list(map(type, sorted(array, reverse=reverse)))
+
+
+def test_key_errors():
+    with pytest.raises(AttributeError):
+        quick_sort([3, 1, 2], pivot_str='clst_avg', key=abs)
+    with pytest.raises(AttributeError):
+        quick_sort([3, 1, 2], shared_memory=True, key=abs)
+
+
+@pytest.mark.parametrize('function, params',
+                         [(merge_argsort, {}),
+                          (merge_argsort, {'no_recursion': True}),
+                          (merge_argsort, {'adaptive': True}),
+                          (quick_argsort, {}),
+                          (quick_argsort, {'partition': '3way'}),
+                          (quick_argsort, {'pivot_str': 'intro'}),
+                          (count_argsort, {}),
+                          (count_argsort, {'memory_limit': 64}),
+                          (digit_argsort, {}),
+                          (digit_argsort, {'base': 256}),
+                          (digit_argsort, {'backend': 'numpy'})])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_argsorts(function, params, reverse):
+    numbers = [random.randint(-50, 50)
+               for _ in range(random.randint(0, 300))]
+    expected = sorted(range(len(numbers)), key=numbers.__getitem__,
+                      reverse=reverse)
+    order = function(numbers, reverse=reverse, **params)
+    assert order.typecode == 'q'
+    # equal keys keep their order, as the built-in sort is stable
+    assert list(order) == expected
+
+    records = [(number, str(number)) for number in numbers]
+    assert list(function(records, key=lambda record: record[0],
+                         reverse=reverse, **params)) == expected
+
+
+def test_reorder():
+    keys = [random.randint(0, 10) for _ in range(100)]
+    column = typed_array('d', map(float, range(100)))
+    names = [str(number) for number in range(100)]
+    order = merge_argsort(keys)
+    assert list(reorder(names, order)) == \
+        [name for _, name in sorted(zip(keys, names),
+                                    key=lambda pair: pair[0])]
+    reordered = reorder(column, order)
+    assert reordered.typecode == 'd'
+    assert list(reordered) == [float(name) for name in
+                               reorder(names, order)]
+    with pytest.raises(AttributeError):
+        quick_argsort(keys, pivot_str='clst_avg')
+
+
 @pytest.mark.parametrize('function, array, params',
                          [(two_dim_array_count_sort,
                           whole_2_dim_array(
@@ -243,7 +480,37 @@ def test_sorts(function, array, params, sorted_params):
                           random_1_dim_array(
                              elts_range=num_range,
                              size_of_1_dim_range=test_size_range),
-                          {'pivot_str': 'cool'})
+                          {'pivot_str': 'cool'}),
+
+                          (quick_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'partition': 'cool'}),
+
+                          (merge_sort,
+                           random_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'opt': False, 'adaptive': True}),
+
+                          (count_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'backend': 'cool'}),
+
+                          (count_sort,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'strategy': 'cool'}),
+
+                          (digit_sort_opt,
+                           whole_1_dim_array(
+                             elts_range=num_range,
+                             size_of_1_dim_range=test_size_range),
+                           {'backend': 'cool'})
                           ])
 def test_errors_in_sorts(function, array, params):
     with pytest.raises(Exception):
@@ -267,6 +534,72 @@ def test_bin_search(array):
             f'existence of {i} inside array is determined wrong'
         assert bin_search(array, i, True) == (i in array), \
             f'existence of {i} inside array is determined wrong'
+        for mode in ('interpolation', 'exponential'):
+            assert bin_search(array, i, mode=mode) == (i in array), \
+                f'existence of {i} inside array is determined wrong'
+
+
+class CountedArray:
+    """Counts the probes of a sorted list, has no length if unbounded."""
+
+    def __init__(self, array):
+        self.array = array
+        self.probes = 0
+
+    def __getitem__(self, index):
+        self.probes += 1
+        if index < 0:
+            raise IndexError('no negative indexes for unbounded arrays')
+        return self.array[index]
+
+
+class CountedList(CountedArray):
+
+    def __len__(self):
+        return len(self.array)
+
+
+@pytest.mark.parametrize('array, uniform', [
+    (sorted(random.randrange(10 ** 9) for _ in range(10 ** 5)), True),
+    # skewed and with an outlier, interpolation misbehaves there
+    (sorted(int(random.random() ** 20 * 10 ** 9) for _ in range(10 ** 5)),
+     False),
+    (list(range(10 ** 5 - 1)) + [10 ** 15], False)])
+def test_bin_search_modes(array, uniform):
+    for value in random.sample(array, 50) + [-1, 10 ** 16, 500.5]:
+        counted = CountedList(array)
+        assert bin_search(counted, value, mode='interpolation') == \
+            (value in array)
+        # the guard bisects at least every second probe
+        assert counted.probes <= 2 * math.log2(len(array)) + 2
+
+        counted = CountedArray(array)
+        assert bin_search(counted, value, mode='exponential') == \
+            (value in array)
+        assert counted.probes <= 2 * math.log2(len(array)) + 4
+
+    if uniform:
+        counted = CountedList(array)
+        for value in random.sample(array, 50):
+            bin_search(counted, value, mode='interpolation')
+        # far fewer probes than the log2(n) of halving on uniform data
+        assert counted.probes / 50 < 0.75 * math.log2(len(array))
+
+    for mode in ('interpolation', 'exponential'):
+        assert not bin_search([], 1, mode=mode)
+        assert bin_search([2], 2, mode=mode)
+    with pytest.raises(ValueError):
+        bin_search(array, 1, mode='ternary')
+
+
+def test_bin_search_infinite_edges():
+    inf = math.inf
+    for array in ([-inf, 1.0, 2.0, inf], [-inf, -inf, 0.5, 3.0],
+                  [0.0, 1.0, 2.0, 3.0, inf, inf]):
+        for value in (-inf, 0.0, 0.5, 1.0, 2.0, 2.5, 3.0, inf):
+            for mode in ('interpolation', 'exponential'):
+                assert bin_search(array, value, mode=mode) == \
+                    (value in array)
 
 
 def func(x):
@@ -297,6 +630,50 @@ def test_min_max_tern_search():
     assert abs(res - 2.121) <= 5*10**(-4), res
 
 
+@pytest.mark.parametrize('function, start, end, extremum', [
+    (lambda x: (x - 1.234) ** 2 + 3, -10, 10, 1.234),
+    (lambda x: abs(x - 0.3), -1, 1, 0.3),
+    (lambda x: math.cosh(x - 2) + (x - 2) ** 4, -50, 50, 2),
+    (lambda x: -math.exp(-50 * (x - 0.7) ** 2), -5, 5, 0.7)])
+def test_extremum_search_modes(function, start, end, extremum):
+    evaluations = {}
+    for mode in ('ternary', 'golden', 'brent'):
+        calls = []
+
+        def counted(x):
+            calls.append(x)
+            return function(x)
+
+        result = tern_search_min(counted, start, end, mode=mode,
+                                 report=True)
+        assert abs(result.x - extremum) < 1e-5, (mode, result)
+        assert result.evaluations == len(calls)
+        evaluations[mode] = result.evaluations
+
+        result = tern_search_max(lambda x: -counted(x), start, end,
+                                 mode=mode)
+        assert abs(result - extremum) < 1e-5, (mode, result)
+
+        calls.clear()
+        result = tern_search_min(counted, start, end, mode=mode,
+                                 max_evaluations=9, report=True)
+        assert result.evaluations == len(calls) <= 9
+        assert start <= result.x <= end
+
+    # one evaluation per iteration keeping 0.618 of the interval
+    assert evaluations['golden'] * 2 <= evaluations['ternary']
+    assert evaluations['brent'] <= evaluations['golden']
+
+
+def test_extremum_search_errors():
+    assert tern_search_min(func, -3, 0) == \
+        tern_search_min(func, -3, 0, report=True).x
+    with pytest.raises(ValueError):
+        tern_search_min(func, -3, 0, mode='fibonacci')
+    with pytest.raises(ValueError):
+        tern_search_max(func, 0, 3, max_evaluations=1)
+
+
 @pytest.mark.parametrize('array', [whole_1_dim_array(
                                     size_of_1_dim_range=(1000, 2000)),
                                    whole_1_dim_array(
@@ -326,3 +703,19 @@ def test_split_search(array):
     array = sorted(array)
     developed = split_find(array_copy, 36)
     assert array[36] == developed
+
+
+@pytest.mark.parametrize('array', [[], [1.5], list(range(500)),
+                                   list(range(500, 0, -1)), [3] * 200,
+                                   whole_1_dim_array(elts_range=(-5, 5)),
+                                   random_1_dim_array()])
+def test_lazy_sorted(array):
+    array_copy = array.copy()
+    assert list(lazy_sorted(array)) == sorted(array)
+    assert array == array_copy
+    assert list(lazy_sorted(array, cutoff=1)) == sorted(array)
+
+    lazy = lazy_sorted(iter(array))
+    first = list(islice(lazy, 10))
+    assert first == sorted(array)[:10]
+    assert first + list(lazy) == sorted(array)
@@ -15,7 +15,8 @@ two_dim_array_count_sort(a: list[list[int]], keys: str | list | int = 'all')
 """
 
 
-from Algorithms.python_solutions.array_count_sort import array_count_sort
+from Algorithms.python_solutions.array_count_sort \
+    import array_count_sort, multi_key_order
 
 
 def two_dim_array_count_sort(
@@ -26,10 +27,12 @@ def two_dim_array_count_sort(
 
     This function sorts the 1-dimensional arrays inside a 2-dimensional array
     in ascending order by all indexes (by default) or by exact indexes
-    in the order they are presented. Be mindful that this sort populates
-    an array with absent places in each row's key position with sentinel
-    values (-inf). In this case the ascending sort will always lead to rows
-    with absent values being put higher than ones without them.
+    in the order they are presented. Be mindful that absent places
+    in each row's key position are treated as sentinel values (-inf).
+    In this case the ascending sort will always lead to rows with absent
+    values being put higher than ones without them.
+    Several keys are sorted by `multi_key_order`, which orders row
+    indexes column by column, so the rows are moved only once.
 
     Parameters
     ----------
@@ -54,23 +57,9 @@ def two_dim_array_count_sort(
 
     """
     if keys == 'all' or isinstance(keys, list):
-        max_len = max(len(row) for row in a)
-        keys = list(range(max_len)) if keys == 'all' else keys
-
-        # Here the sentinel values are introduced into array
-        # If you want them to be under all rows with present values -
-        # you can change -inf to inf
-        a_padded = [row + [float('-inf')] * (max_len - len(row)) for row in a]
-
-        # Sort the padded array
-        for key in reversed(keys):
-            a_padded = array_count_sort(a_padded, key=key)
-
-        a_sorted_padded = a_padded
-
-        # Remove the padded zeros
-        a = [list(filter(lambda x: x != float('-inf'), row))
-             for row in a_sorted_padded]
+        if keys == 'all':
+            keys = list(range(max(len(row) for row in a)))
+        a = [a[index] for index in multi_key_order(a, keys)]
 
     elif isinstance(keys, int):
         a = array_count_sort(a, key=keys)